@@ -1,13 +1,32 @@
 from flask import Flask, request, jsonify, render_template
 from flask_cors import CORS
-import csv
 from datetime import datetime
-import os
+import threading
+
+from modules.storage import applications
 
 app = Flask(__name__)
 CORS(app)
 
-PATH = 'all excels/'
+_history_imported = False
+_history_import_lock = threading.Lock()
+
+@app.before_request
+def import_history_csvs():
+    '''
+    Imports history CSV files saved before the database existed on the first request, not when this module is imported (only done once).
+    * If the import fails, the error is printed and it's tried again on the next request
+    '''
+    global _history_imported
+    if _history_imported: return
+    with _history_import_lock:
+        if _history_imported: return
+        try:
+            applications.import_existing_csvs()
+            _history_imported = True
+        except Exception as e:
+            print(f"Failed to import history CSV files into the applications database, will retry! {e}")
+
 ##> ------ Karthik Sarode : karthik.sarode23@gmail.com - UI for excel files ------
 @app.route('/')
 def home():
@@ -17,40 +36,39 @@ def home():
 @app.route('/applied-jobs', methods=['GET'])
 def get_applied_jobs():
     '''
-    Retrieves a list of applied jobs from the applications history CSV file.
+    Retrieves a list of applied jobs from the applications history database.
     
     Returns a JSON response containing a list of jobs, each with details such as 
     Job ID, Title, Company, HR Name, HR Link, Job Link, External Job link, and Date Applied.
     
-    If the CSV file is not found, returns a 404 error with a relevant message.
+    If no applications are saved yet, returns a 404 error with a relevant message.
     If any other exception occurs, returns a 500 error with the exception message.
     '''
 
     try:
+        rows = applications.get_applied_jobs()
+        if not rows:
+            return jsonify({"error": "No applications history found"}), 404
         jobs = []
-        with open(PATH + 'all_applied_applications_history.csv', 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                jobs.append({
-                    'Job_ID': row['Job ID'],
-                    'Title': row['Title'],
-                    'Company': row['Company'],
-                    'HR_Name': row['HR Name'],
-                    'HR_Link': row['HR Link'],
-                    'Job_Link': row['Job Link'],
-                    'External_Job_link': row['External Job link'],
-                    'Date_Applied': row['Date Applied']
-                })
+        for row in rows:
+            jobs.append({
+                'Job_ID': row['Job ID'],
+                'Title': row['Title'],
+                'Company': row['Company'],
+                'HR_Name': row['HR Name'],
+                'HR_Link': row['HR Link'],
+                'Job_Link': row['Job Link'],
+                'External_Job_link': row['External Job link'],
+                'Date_Applied': row['Date Applied']
+            })
         return jsonify(jobs)
-    except FileNotFoundError:
-        return jsonify({"error": "No applications history found"}), 404
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/applied-jobs/<job_id>', methods=['PUT'])
 def update_applied_date(job_id):
     """
-    Updates the 'Date Applied' field of a job in the applications history CSV file.
+    Updates the 'Date Applied' field of a job in the applications history database.
 
     Args:
         job_id (str): The Job ID of the job to be updated.
@@ -62,30 +80,8 @@ def update_applied_date(job_id):
         exception message.
     """
     try:
-        data = []
-        csvPath = PATH + 'all_applied_applications_history.csv'
-        
-        if not os.path.exists(csvPath):
-            return jsonify({"error": f"CSV file not found at {csvPath}"}), 404
-            
-        # Read current CSV content
-        with open(csvPath, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            fieldNames = reader.fieldnames
-            found = False
-            for row in reader:
-                if row['Job ID'] == job_id:
-                    row['Date Applied'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    found = True
-                data.append(row)
-        
-        if not found:
+        if not applications.update_date_applied(job_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S')):
             return jsonify({"error": f"Job ID {job_id} not found"}), 404
-
-        with open(csvPath, 'w', encoding='utf-8', newline='') as file:
-            writer = csv.DictWriter(file, fieldnames=fieldNames)
-            writer.writeheader()
-            writer.writerows(data)
         
         return jsonify({"message": "Date Applied updated successfully"}), 200
     except Exception as e:
@@ -0,0 +1,103 @@
+"""Benchmark: the AI code paths of the bot against the local stub LLM server, without network.
+
+Runs `ai_extract_skills()` and `ai_answer_question()` of
+`modules/ai/openaiConnections.py` against `benchmarks.stub_llm_server` and
+reports, for the latency set with the arguments:
+* throughput of skill extraction and question answering, plain and streamed
+* throughput of skill extraction with 1, 2, 4 and 8 parallel workers (like `skills_extraction_workers`)
+* hit rate and time saved by the skills cache (`modules.storage.skills_cache`) over two passes of the corpus
+* failures when the stub answers 20% of the requests with 429
+
+Needs the `openai` package and `config/secrets.py`, the AI settings in it are
+overridden to use the stub. Run from the repository root:
+    python -m benchmarks.bench_ai [latency ms] [chunk interval ms]
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.ai import openaiConnections as ai
+from modules.ai.prompts import extract_skills_prompt_version
+from modules.dashboard import metrics
+from modules.storage import database, skills_cache
+
+from benchmarks.bench_filters import load_corpus
+from benchmarks.stub_llm_server import StubConfig, StubLLMServer
+
+QUESTIONS = [
+    "How many years of work experience do you have with Python?",
+    "Are you comfortable working in a hybrid setting?",
+    "Why do you want to work with us?",
+    "What is your notice period in days?",
+]
+
+
+def timed(function, items: list, workers: int = 1) -> float:
+    start = time.perf_counter()
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(function, items))
+    else:
+        for item in items:
+            function(item)
+    return time.perf_counter() - start
+
+
+def cached_extract(client, description: str) -> dict:
+    # Same cache use as `extract_skills()` in runAiBot.py
+    key = skills_cache.cache_key("openai", ai.llm_model, extract_skills_prompt_version, description)
+    skills = skills_cache.get(key)
+    if skills is None:
+        skills = ai.ai_extract_skills(client, description, stream=False)
+        if skills: skills_cache.put(key, skills, "openai", ai.llm_model)
+    return skills
+
+
+def main(latency_ms: float = 500, chunk_interval_ms: float = 20) -> None:
+    corpus = load_corpus()
+    config = StubConfig(latency="lognormal", latency_ms=latency_ms, jitter_ms=latency_ms / 4, chunk_interval_ms=chunk_interval_ms, seed=1)
+    with tempfile.TemporaryDirectory() as folder, StubLLMServer(config) as server:
+        database.connect(os.path.join(folder, "bench.db"))
+        ai.llm_api_url, ai.llm_api_key, ai.llm_model, ai.llm_spec = server.url, "not-needed", "stub-model", "openai-like"
+        ai.use_AI, ai.showAiErrorAlerts = True, False
+        client = ai.ai_create_openai_client()
+
+        rows = []
+        for stream in (False, True):
+            seconds = timed(lambda description: ai.ai_extract_skills(client, description, stream=stream), corpus)
+            rows.append((f"extract skills{' (streamed)' if stream else ''}", len(corpus), seconds))
+            seconds = timed(lambda question: ai.ai_answer_question(client, question, job_description=corpus[0], stream=stream), QUESTIONS)
+            rows.append((f"answer question{' (streamed)' if stream else ''}", len(QUESTIONS), seconds))
+        for workers in (1, 2, 4, 8):
+            server.reset_stats()
+            seconds = timed(lambda description: ai.ai_extract_skills(client, description, stream=False), corpus, workers)
+            rows.append((f"extract skills x{workers} (max {server.stats()['max_in_flight']} in flight)", len(corpus), seconds))
+
+        metrics.reset_all()
+        cold = timed(lambda description: cached_extract(client, description), corpus)
+        warm = timed(lambda description: cached_extract(client, description), corpus)
+        rows.append(("extract skills, cache cold", len(corpus), cold))
+        rows.append(("extract skills, cache warm", len(corpus), warm))
+        hit_rate = metrics.get_hit_rate("skills_cache")
+
+        server.config.error_rate = 0.2
+        server.reset_stats()
+        results = [ai.ai_extract_skills(client, description, stream=False) for description in corpus * 2]
+        failed = sum(result is None for result in results)
+        injected = server.stats()["errors"]
+
+        ai.ai_close_openai_client(client)
+        database.close()
+
+    print(f"\nStub latency {latency_ms:g} ms (lognormal), {chunk_interval_ms:g} ms between streamed chunks\n")
+    print(f"{'case':<45}{'calls':>8}{'seconds':>10}{'calls/min':>12}")
+    for name, calls, seconds in rows:
+        print(f"{name:<45}{calls:>8}{seconds:>10.2f}{60 * calls / seconds if seconds else float('inf'):>12.1f}")
+    print(f"\nSkills cache hit rate over both passes: {hit_rate:.0%}, warm pass {cold / warm if warm else float('inf'):.0f}x faster")
+    print(f"With 20% of requests failing with 429: {injected} errors injected, {failed} of {len(results)} extractions failed")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,83 @@
+"""Benchmark: time to check job descriptions against filter words, before and after `KeywordMatcher`.
+
+"before" replays what `get_job_description()` used to do: lower case the
+description and search it once per filter word. "single pass" compiles the
+words into a `KeywordMatcher` forced to always scan in one pass, "after" is
+`KeywordMatcher` with its default `scan_threshold`, as used by the bot.
+The corpus is a set of sample job descriptions in `benchmarks/data/`.
+
+Run from the repository root:
+    python -m benchmarks.bench_filters [rounds]
+"""
+import os
+import sys
+import time
+
+from config.search import bad_words
+from modules.filters import KeywordMatcher
+
+CORPUS_PATH = os.path.join(os.path.dirname(__file__), "data", "job_descriptions.txt")
+
+SKILLS = [
+    "Java", "Scala", "Kotlin", "Swift", "Objective-C", "Perl", "Haskell", "Elixir", "Erlang", "COBOL", "Fortran", "Delphi",
+    "SAP ABAP", "Salesforce", "ServiceNow", "Mainframe", "AS/400", "Visual Basic", "VB.NET", "Silverlight", "Flash",
+    "Unity", "Unreal Engine", "Blockchain", "Solidity", "Web3", "Crypto", "Forex", "MLM", "Commission only",
+    "Unpaid", "Internship", "Night shift", "Relocation required", "Polygraph", "TS/SCI", "Public Trust", "DoD",
+]
+
+
+def load_corpus() -> list[str]:
+    with open(CORPUS_PATH, 'r', encoding="utf-8") as file:
+        return [description.strip() for description in file.read().split("\n----\n") if description.strip()]
+
+
+def make_terms(count: int) -> list[str]:
+    terms = list(bad_words) + SKILLS
+    i = 0
+    while len(terms) < count:
+        terms.append(f"{SKILLS[i % len(SKILLS)]} {i}")  # Realistic prefixes that mostly don't match
+        i += 1
+    return terms[:count]
+
+
+def legacy_first_match(terms: list[str], description: str) -> str | None:
+    description_low = description.lower()
+    for word in terms:
+        if word.lower() in description_low:
+            return word
+    return None
+
+
+def time_matcher(matcher: KeywordMatcher, corpus: list[str], rounds: int) -> tuple[float, list]:
+    start = time.perf_counter()
+    found = [matcher.first(description) for _ in range(rounds) for description in corpus]
+    return time.perf_counter() - start, found
+
+
+def bench(terms: list[str], corpus: list[str], rounds: int) -> tuple[float, float, float, float]:
+    start = time.perf_counter()
+    legacy = [legacy_first_match(terms, description) for _ in range(rounds) for description in corpus]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single_pass_matcher = KeywordMatcher(terms, scan_threshold=0)
+    build_time = time.perf_counter() - start
+
+    single_pass_time, single_pass = time_matcher(single_pass_matcher, corpus, rounds)
+    default_time, default = time_matcher(KeywordMatcher(terms), corpus, rounds)
+    assert legacy == single_pass == default, "All filters must find the same words"
+    return legacy_time, build_time, single_pass_time, default_time
+
+
+def main(rounds: int = 200) -> None:
+    corpus = load_corpus()
+    checks = rounds * len(corpus)
+    print(f"Descriptions: {len(corpus)}, checks per run: {checks}")
+    print(f"{'Terms':>6} {'Before (us/job)':>16} {'Single pass (us/job)':>21} {'After (us/job)':>15} {'Build (ms)':>11} {'Speed up':>9}")
+    for count in (10, 50, 200, 500, 1000, 5000):
+        legacy, build, single_pass, default = bench(make_terms(count), corpus, rounds)
+        print(f"{count:>6} {legacy / checks * 1e6:>16.1f} {single_pass / checks * 1e6:>21.1f} {default / checks * 1e6:>15.1f} {build * 1e3:>11.2f} {legacy / default:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
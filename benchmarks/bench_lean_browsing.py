@@ -0,0 +1,61 @@
+"""Benchmark: page load time and bytes transferred with and without lean browsing.
+
+Opens a fresh Chrome (guest profile) once normally and once with
+`lean_browsing` options and blocked URLs from `config/settings.py`, loads
+each URL a few times and reports average load time, bytes and number of
+resources per page. The default URLs are public LinkedIn job pages that
+don't need a login. Bytes of cross-origin resources are only counted when
+their server allows it, so they are a lower bound.
+
+Run from the repository root (needs Chrome):
+    python -m benchmarks.bench_lean_browsing [rounds] [url ...]
+"""
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from config.settings import lean_browsing_blocked_urls
+from modules.lean_browsing import apply_lean_options, enable_lean_browsing, record_page_weight
+
+URLS = [
+    "https://www.linkedin.com/jobs/search?keywords=Software%20Engineer&location=United%20States",
+    "https://www.linkedin.com/jobs/search?keywords=Data%20Engineer&location=India",
+]
+
+
+def measure(urls: list[str], rounds: int, lean: bool) -> tuple[float, float, float]:
+    options = Options()
+    options.add_argument("--headless=new")
+    if lean: apply_lean_options(options)
+    driver = webdriver.Chrome(options=options)
+    try:
+        if lean: enable_lean_browsing(driver, lean_browsing_blocked_urls)
+        loads, total_bytes, resources = [], 0, 0
+        for _ in range(rounds):
+            for url in urls:
+                driver.delete_all_cookies()
+                start = time.perf_counter()
+                driver.get(url)
+                loads.append(time.perf_counter() - start)
+                time.sleep(2)   # Let lazy loaded parts of the page come in too
+                weight = record_page_weight(driver, "bench") or {"bytes": 0, "resources": 0}
+                total_bytes += weight["bytes"]
+                resources += weight["resources"]
+        pages = len(loads)
+        return sum(loads) / pages, total_bytes / pages, resources / pages
+    finally:
+        driver.quit()
+
+
+def main(rounds: int = 3, urls: list[str] | None = None) -> None:
+    urls = urls or URLS
+    print(f"{'mode':<10}{'load s':>10}{'KB/page':>12}{'requests/page':>16}")
+    for lean in (False, True):
+        load, size, resources = measure(urls, rounds, lean)
+        print(f"{'lean' if lean else 'normal':<10}{load:>10.2f}{size / 1024:>12.0f}{resources:>16.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3, sys.argv[2:])
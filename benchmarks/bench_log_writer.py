@@ -0,0 +1,58 @@
+"""Benchmark: messages/sec written to a log file by `print_lg`, before and after buffering.
+
+"before" replays what `print_lg` used to do per message: re-import the dashboard
+log handler and open/append/close log.txt. "after" uses `BufferedLogWriter`.
+Console printing is left out of both since it costs the same either way.
+
+Run from the repository root:
+    python -m benchmarks.bench_log_writer [messages]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from modules.log_writer import BufferedLogWriter
+
+
+def legacy_write(path: str, message: str) -> None:
+    try:
+        from modules.dashboard import log_handler  # noqa: F401  (re-imported on every call, like before)
+    except Exception:
+        pass
+    with open(path, 'a+', encoding="utf-8") as file:
+        file.write(message + "\n")
+
+
+def bench_legacy(path: str, messages: list[str]) -> float:
+    start = time.perf_counter()
+    for message in messages:
+        legacy_write(path, message)
+    return time.perf_counter() - start
+
+
+def bench_buffered(path: str, messages: list[str]) -> float:
+    writer = BufferedLogWriter(path)
+    start = time.perf_counter()
+    for message in messages:
+        writer.write(message + "\n")
+    writer.close()
+    return time.perf_counter() - start
+
+
+def main(count: int = 50000) -> None:
+    messages = [f"Message {i}: Trying to Apply to \"Software Engineer | Company {i % 97}\" job. Job ID: {4000000000 + i}" for i in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        legacy_path = os.path.join(directory, "legacy.txt")
+        buffered_path = os.path.join(directory, "buffered.txt")
+        legacy = bench_legacy(legacy_path, messages)
+        buffered = bench_buffered(buffered_path, messages)
+        assert os.path.getsize(legacy_path) == os.path.getsize(buffered_path), "Both writers must write the same bytes"
+    print(f"Messages:            {count}")
+    print(f"Before (open/write): {count / legacy:>12,.0f} msgs/sec  ({legacy:.3f} s)")
+    print(f"After  (buffered):   {count / buffered:>12,.0f} msgs/sec  ({buffered:.3f} s)")
+    print(f"Speed up:            {legacy / buffered:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50000)
@@ -0,0 +1 @@
+"""Offline replay of LinkedIn-like pages, to benchmark the bot end to end without an account"""
@@ -0,0 +1,186 @@
+// Behaviour of the replay fixture pages: job details pane, pagination and the multi-step Easy Apply modal.
+// Only the elements, class names and texts the bot looks for are rendered.
+(() => {
+    const jobs = {};
+    window.REPLAY_JOBS.forEach((job) => { jobs[job.job_id] = job; });
+    const details = document.getElementById('job-details');
+    const modalRoot = document.getElementById('modal-root');
+
+    const QUESTIONS = [
+        { type: 'select', label: 'Are you legally authorized to work in the United States?', options: ['Select an option', 'Yes', 'No'] },
+        { type: 'radio', label: 'Will you now or in the future require sponsorship for employment visa status?', options: ['Yes', 'No'] },
+        { type: 'text', label: 'How many years of work experience do you have with Python?' },
+        { type: 'select', label: 'What is your level of proficiency in English?', options: ['Select an option', 'Native or bilingual', 'Professional', 'Conversational'] },
+        { type: 'radio', label: "Have you completed the following level of education: Bachelor's Degree?", options: ['Yes', 'No'] },
+        { type: 'text', label: 'What is your notice period in days?' },
+        { type: 'textarea', label: 'Cover letter' },
+        { type: 'text', label: 'Current CTC in USD' },
+        { type: 'checkbox', label: 'Terms and conditions', option: 'I Agree Terms & Conditions' },
+        { type: 'text', label: 'LinkedIn Profile' },
+        { type: 'radio', label: 'Are you comfortable commuting to this job\'s location?', options: ['Yes', 'No'] },
+        { type: 'text', label: 'Desired salary' },
+    ];
+
+    const escapeHtml = (text) => String(text).replace(/[&<>"']/g, (char) => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[char]));
+    const spanButton = (text) => `<button type="button" class="artdeco-button"><span>${text}</span></button>`;
+
+    const questionHtml = (question, id) => {
+        const label = escapeHtml(question.label);
+        if (question.type === 'select') {
+            const options = question.options.map((option) => `<option value="${escapeHtml(option)}">${escapeHtml(option)}</option>`).join('');
+            return `<div data-test-form-element><label for="${id}"><span>${label}</span></label><select id="${id}" required>${options}</select></div>`;
+        }
+        if (question.type === 'radio') {
+            const options = question.options.map((option, index) =>
+                `<div><input type="radio" name="${id}" id="${id}-${index}" value="${escapeHtml(option)}"><label for="${id}-${index}">${escapeHtml(option)}</label></div>`).join('');
+            return `<div data-test-form-element><fieldset data-test-form-builder-radio-button-form-component="true">` +
+                `<legend><span data-test-form-builder-radio-button-form-component__title><span aria-hidden="true">${label}</span><span class="visually-hidden">${label}</span></span></legend>` +
+                `${options}</fieldset></div>`;
+        }
+        if (question.type === 'text') {
+            return `<div data-test-form-element><label for="${id}">${label}</label><input type="text" id="${id}" required></div>`;
+        }
+        if (question.type === 'textarea') {
+            return `<div data-test-form-element><label for="${id}">${label}</label><textarea id="${id}"></textarea></div>`;
+        }
+        return `<div data-test-form-element><fieldset><legend><span class="visually-hidden">${label}</span></legend>` +
+            `<input type="checkbox" id="${id}" required><label for="${id}">${escapeHtml(question.option)}</label></fieldset></div>`;
+    };
+
+    // Questions on each page of a job's modal, the same every time the job is opened
+    const questionPages = (job) => {
+        const pages = [];
+        const seed = Number(job.job_id.slice(-4));
+        for (let page = 0; page < job.steps; page++) {
+            pages.push([0, 1, 2].map((offset) => QUESTIONS[(seed + page * 3 + offset) % QUESTIONS.length]));
+        }
+        return pages;
+    };
+
+    const isAnswered = (question) => {
+        const select = question.querySelector('select');
+        if (select) return select.selectedIndex > 0;
+        const radios = question.querySelectorAll('input[type=radio]');
+        if (radios.length) return Array.from(radios).some((radio) => radio.checked);
+        const input = question.querySelector('input[required]');
+        if (input) return input.type === 'checkbox' ? input.checked : input.value.trim() !== '';
+        return true;
+    };
+
+    let application = null;
+
+    const renderStep = () => {
+        const { job, step, pages } = application;
+        let body = '';
+        let footer = '';
+        if (step === 0) {
+            body = `<h3>Contact info</h3>` +
+                `<div><label for="contact-email">Email address</label><input type="text" id="contact-email" value="replay@example.com"></div>` +
+                `<div><label for="contact-phone">Mobile phone number</label><input type="text" id="contact-phone" value="5550100"></div>` +
+                `<div><input type="file" name="file" id="resume-upload"></div>`;
+            footer = spanButton('Next');
+        } else if (step <= pages.length) {
+            body = `<h3>Additional questions</h3>` + pages[step - 1].map((question, index) => questionHtml(question, `q-${job.job_id}-${step}-${index}`)).join('');
+            footer = spanButton(step === pages.length ? 'Review' : 'Next');
+        } else if (step === pages.length + 1) {
+            body = `<h3>Review your application</h3>` +
+                `<div><input type="checkbox" id="follow-company-checkbox" checked><label for="follow-company-checkbox">Follow ${escapeHtml(job.company)}</label></div>`;
+            footer = spanButton('Submit application');
+        } else {
+            body = `<h3>Your application was sent to ${escapeHtml(job.company)}!</h3>`;
+            footer = spanButton('Done');
+        }
+        application.modal.innerHTML = `<div class="jobs-easy-apply-content">${body}<p class="replay-error"></p></div><footer>${footer}</footer>`;
+    };
+
+    const closeModal = () => {
+        modalRoot.innerHTML = '';
+        application = null;
+    };
+
+    const markApplied = (job) => {
+        job.applied = true;
+        const card = document.querySelector(`li[data-occludable-job-id="${job.job_id}"] .job-card-container`);
+        if (card && !card.querySelector('.job-card-container__footer-job-state')) {
+            card.insertAdjacentHTML('beforeend', '<div class="job-card-container__footer-job-state">Applied</div>');
+        }
+        fetch('/replay/applications', { method: 'POST', headers: { 'content-type': 'application/json' }, body: JSON.stringify({ job_id: job.job_id, answers: application.answers }) });
+    };
+
+    const onModalClick = (event) => {
+        const button = event.target.closest('button');
+        if (!button || !application) return;
+        const action = button.innerText.trim();
+        if (action === 'Next' || action === 'Review') {
+            const questions = Array.from(application.modal.querySelectorAll('div[data-test-form-element]'));
+            if (!questions.every(isAnswered)) {
+                application.modal.querySelector('.replay-error').textContent = 'Please enter a valid answer';
+                return;
+            }
+            questions.forEach((question) => {
+                const field = question.querySelector('select, input:checked, input[type=text], textarea, input[type=checkbox]');
+                application.answers.push(field ? (field.type === 'checkbox' ? field.checked : field.value) : null);
+            });
+        } else if (action === 'Submit application') {
+            markApplied(application.job);
+        } else if (action === 'Done') {
+            closeModal();
+            return;
+        } else if (action === 'Discard') {
+            closeModal();
+            return;
+        } else {
+            return;
+        }
+        application.step += 1;
+        renderStep();
+    };
+
+    const openModal = (job) => {
+        modalRoot.innerHTML = '<div class="jobs-easy-apply-modal" role="dialog"></div>';
+        application = { job: job, step: 0, pages: questionPages(job), answers: [], modal: modalRoot.firstElementChild };
+        application.modal.addEventListener('click', onModalClick);
+        renderStep();
+    };
+
+    const showDetails = (job) => {
+        const applyButton = job.applied
+            ? `<a class="jobs-s-apply__application-link" href="#">See application</a>`
+            : `<button class="jobs-apply-button artdeco-button--3" aria-label="Easy Apply to ${escapeHtml(job.title)} at ${escapeHtml(job.company)}"><span>Easy Apply</span></button>`;
+        details.innerHTML = `<div class="jobs-details__main-content">` +
+            `<h2>${escapeHtml(job.title)}</h2>` +
+            `<div class="job-details-jobs-unified-top-card__primary-description-container"><span>${escapeHtml(job.location)}</span> · <span>${escapeHtml(job.posted)}</span> · <span>42 applicants</span></div>` +
+            `<div class="jobs-s-apply">${applyButton}</div>` +
+            `<div class="hirer-card__hirer-information"><a href="/in/replay-recruiter/"><span>Replay Recruiter</span></a></div>` +
+            `<div class="jobs-box__html-content">${escapeHtml(job.description)}</div>` +
+            `<div class="jobs-company__box"><h3>About the company</h3><p>${escapeHtml(job.about_company)}</p></div>` +
+            `</div>`;
+        const button = details.querySelector('.jobs-apply-button');
+        if (button) button.addEventListener('click', () => openModal(job));
+    };
+
+    document.querySelectorAll('li[data-occludable-job-id] a').forEach((anchor) => {
+        anchor.addEventListener('click', (event) => {
+            event.preventDefault();
+            showDetails(jobs[anchor.dataset.jobId]);
+        });
+    });
+
+    document.querySelectorAll('.jobs-search-pagination__pages button').forEach((button) => {
+        button.addEventListener('click', () => {
+            const params = new URLSearchParams(window.location.search);
+            params.set('page', button.dataset.page);
+            window.location.search = params.toString();
+        });
+    });
+
+    // Escape asks to discard an open application, like LinkedIn does
+    document.addEventListener('keydown', (event) => {
+        if (event.key !== 'Escape' || !application) return;
+        if (application.step > application.pages.length + 1) {
+            closeModal();
+            return;
+        }
+        application.modal.innerHTML = `<div><h3>Discard application?</h3>${spanButton('Discard')}</div>`;
+    });
+})();
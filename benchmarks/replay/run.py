@@ -0,0 +1,103 @@
+"""Benchmark: the whole apply loop of the bot, end to end, against the local replay server.
+
+Starts `benchmarks.replay.server` with generated jobs, points the bot at it
+(`runAiBot.LINKEDIN_URL`) and runs `apply_to_jobs()` in a real Chrome, with
+the fixed delays (`buffer()`, `click_gap`, human-like pauses) and every
+prompt turned off, so only the bot's own work and the browser are measured.
+History is saved in a temporary database, your real history is not touched.
+
+Reports jobs handled per minute, WebDriver commands per job and the time
+and WebDriver commands spent in each stage (the stages of `set_log_context()`).
+
+Run from the repository root (needs Flask and Chrome):
+    python -m benchmarks.replay.run [jobs] [page size]
+"""
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from modules.storage import database
+
+from benchmarks.replay.server import ReplayServer, create_app, make_jobs
+
+
+class StageTimer:
+    '''
+    Replaces `set_log_context()` of the bot to time its stages and count the WebDriver commands of each.
+    '''
+    def __init__(self, set_log_context):
+        self._set_log_context = set_log_context
+        self.seconds = defaultdict(float)
+        self.commands = defaultdict(int)
+        self.stage = "startup"
+        self._started = time.perf_counter()
+
+    def __call__(self, job_id: str | None = None, stage: str | None = None) -> None:
+        self.switch(stage or "other")
+        self._set_log_context(job_id, stage)
+
+    def switch(self, stage: str) -> None:
+        now = time.perf_counter()
+        self.seconds[self.stage] += now - self._started
+        self.stage, self._started = stage, now
+
+    def count_commands(self, execute):
+        def counted_execute(*args, **kwargs):
+            self.commands[self.stage] += 1
+            return execute(*args, **kwargs)
+        return counted_execute
+
+
+def main(job_count: int = 50, page_size: int = 25) -> None:
+    jobs = make_jobs(job_count)
+    with tempfile.TemporaryDirectory() as folder, ReplayServer(create_app(jobs, page_size)) as server:
+        database.connect(os.path.join(folder, "replay.db"))
+
+        import runAiBot
+        from modules import clickers_and_finders, helpers
+        runAiBot.start_browser()
+
+        no_wait = lambda *args, **kwargs: None
+        for module in (helpers, clickers_and_finders, runAiBot):
+            module.buffer = no_wait
+        clickers_and_finders.click_gap = runAiBot.click_gap = 0
+        clickers_and_finders.min_human_pause = clickers_and_finders.max_human_pause = 0
+        runAiBot.LINKEDIN_URL = server.url
+        runAiBot.apply_filters = no_wait
+        runAiBot.switch_number = job_count
+        runAiBot.pause_before_submit = runAiBot.pause_at_failed_question = False
+        runAiBot.keep_screen_awake = runAiBot.export_history_csv = runAiBot.randomize_search_order = False
+
+        timer = StageTimer(runAiBot.set_log_context)
+        runAiBot.set_log_context = timer
+        driver = runAiBot.driver
+        driver.execute = timer.count_commands(driver.execute)
+
+        started = time.perf_counter()
+        try:
+            runAiBot.apply_to_jobs(["Benchmark"])
+        finally:
+            timer.switch("done")
+            elapsed = time.perf_counter() - started
+            submitted = len(server.app.config["applications"])
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            database.close()
+
+    handled = runAiBot.easy_applied_count + runAiBot.external_jobs_count + runAiBot.failed_count + runAiBot.skip_count
+    commands = sum(timer.commands.values())
+    print(f"\nReplayed {job_count} jobs ({page_size} per page) in {elapsed:.1f} s")
+    print(f"Submitted {submitted}, failed {runAiBot.failed_count}, skipped {runAiBot.skip_count}")
+    print(f"Jobs per minute: {60 * handled / elapsed:.1f} handled, {60 * submitted / elapsed:.1f} submitted")
+    print(f"WebDriver commands: {commands} ({commands / max(handled, 1):.1f} per job)\n")
+    print(f"{'stage':<20}{'seconds':>10}{'commands':>10}")
+    for stage in sorted(timer.seconds, key=timer.seconds.get, reverse=True):
+        print(f"{stage:<20}{timer.seconds[stage]:>10.2f}{timer.commands[stage]:>10}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,116 @@
+"""Local fixture server replaying LinkedIn-like job search pages.
+
+Serves a jobs search results page (`/jobs/search/`), job detail panes,
+multi-step Easy Apply modals and the `jobPostings` API used to prefetch
+descriptions, built from the sample descriptions in `benchmarks/data/`.
+The pages only have the elements and class names the bot looks for.
+
+Run it on its own to look at the pages in a browser:
+    python -m benchmarks.replay.server [port]
+"""
+import os
+import random
+import sys
+import threading
+
+from flask import Flask, abort, jsonify, render_template, request
+from werkzeug.serving import make_server
+
+from benchmarks.bench_filters import load_corpus
+
+PAGES_FOLDER = os.path.join(os.path.dirname(__file__), "pages")
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Health", "Hooli", "Stark Industries", "Wayne Enterprises", "Soylent",
+             "Wonka Labs", "Cyberdyne", "Tyrell Systems", "Vandelay Industries"]
+LOCATIONS = ["Austin, TX, United States", "Bengaluru, Karnataka, India", "London, England, United Kingdom", "Berlin, Germany", "Remote, United States"]
+WORK_STYLES = ["Remote", "On-site", "Hybrid"]
+TITLES = ["Software Engineer", "Senior Backend Engineer", "Full Stack Developer", "Data Engineer", "Site Reliability Engineer",
+          "Machine Learning Engineer", "Python Developer", "Platform Engineer"]
+
+
+def make_jobs(count: int = 50, seed: int = 1) -> list[dict]:
+    '''
+    Generates `count` jobs with descriptions from the sample corpus. Every 10th job is marked as already applied.
+    '''
+    rng = random.Random(seed)
+    corpus = load_corpus()
+    jobs = []
+    for i in range(count):
+        jobs.append({
+            "job_id": str(4000000000 + i),
+            "title": rng.choice(TITLES),
+            "company": rng.choice(COMPANIES),
+            "location": rng.choice(LOCATIONS),
+            "work_style": rng.choice(WORK_STYLES),
+            "description": corpus[i % len(corpus)],
+            "about_company": f"{rng.choice(COMPANIES)} builds software for businesses around the world.",
+            "posted": f"{rng.randint(1, 6)} days ago",
+            "applied": i % 10 == 9,
+            "steps": 2 + i % 3,     # Pages of questions in the Easy Apply modal
+        })
+    return jobs
+
+
+def create_app(jobs: list[dict] | None = None, page_size: int = 25) -> Flask:
+    '''
+    Creates the fixture Flask app serving `jobs` (defaults to `make_jobs()`), `page_size` jobs per results page.
+    '''
+    jobs = jobs if jobs is not None else make_jobs()
+    by_id = {job["job_id"]: job for job in jobs}
+    app = Flask(__name__, template_folder=PAGES_FOLDER, static_folder=PAGES_FOLDER, static_url_path="/static")
+    app.config["applications"] = []
+
+    @app.route('/jobs/search/')
+    def search():
+        page = max(1, request.args.get("page", 1, type=int))
+        pages = max(1, -(-len(jobs) // page_size))
+        page_jobs = jobs[(page - 1) * page_size: page * page_size]
+        return render_template('search.html', jobs=page_jobs, page=page, pages=pages, keywords=request.args.get("keywords", ""))
+
+    @app.route('/voyager/api/jobs/jobPostings/<job_id>')
+    def job_posting(job_id: str):
+        job = by_id.get(job_id) or abort(404)
+        return jsonify({"jobPostingId": job_id, "title": job["title"], "description": {"text": job["description"]}})
+
+    @app.route('/jobs/view/<job_id>/')
+    def job_view(job_id: str):
+        job = by_id.get(job_id) or abort(404)
+        return render_template('search.html', jobs=[job], page=1, pages=1, keywords="")
+
+    @app.route('/replay/applications', methods=['GET', 'POST'])
+    def submitted_applications():
+        if request.method == 'POST':
+            app.config["applications"].append(request.get_json(silent=True) or {})
+            return jsonify({"ok": True})
+        return jsonify(app.config["applications"])
+
+    return app
+
+
+class ReplayServer:
+    '''
+    Runs the fixture app on a background thread. Use as a context manager or call `start()`/`stop()`.
+    '''
+    def __init__(self, app: Flask | None = None, host: str = "127.0.0.1", port: int = 0):
+        self.app = app or create_app()
+        self._server = make_server(host, port, self.app, threaded=True)
+        self.url = f"http://{host}:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="replay-server", daemon=True)
+
+    def start(self) -> "ReplayServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 5050
+    create_app().run(port=port)
@@ -0,0 +1,299 @@
+"""Local OpenAI-compatible stub LLM server, to run the AI code paths without network.
+
+Implements `GET /v1/models` and `POST /v1/chat/completions` (plain and
+streamed as server-sent events) with made up but deterministic answers:
+skill extraction prompts get a skills JSON built from the technologies named
+in the job description, questions get a number, "Yes" or a short sentence.
+Responses report token counts in `usage`.
+
+Latency (time to first token), the cadence of streamed chunks and errors
+(Eg: 429 with a `Retry-After` header) are configurable with `StubConfig`.
+`GET /stub/stats` returns counters of requests, errors, tokens and the most
+requests that were in flight at the same time.
+
+Point the bot at it with `llm_api_url = "http://127.0.0.1:8001/v1"` and
+`llm_model = "stub-model"` in `config/secrets.py`, after starting it with:
+    python -m benchmarks.stub_llm_server [--port 8001] [--latency-ms 800] [--error-rate 0.1] ...
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TECHNOLOGIES = ["Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++", "C#", "SQL", "PostgreSQL", "MySQL", "MongoDB",
+                "Redis", "Kafka", "Spark", "Airflow", "Django", "Flask", "FastAPI", "Spring Boot", "React", "Node.js", "GraphQL",
+                "AWS", "GCP", "Azure", "Docker", "Kubernetes", "Terraform", "Linux", "Git", "PyTorch", "TensorFlow", "Pandas"]
+TECHNICAL_SKILLS = ["System Design", "Microservices", "Distributed Systems", "Data Engineering", "Machine Learning", "CI/CD",
+                    "REST APIs", "Observability", "Data Modeling"]
+OTHER_SKILLS = ["Communication", "Mentoring", "Leadership", "Collaboration", "Ownership", "Problem solving"]
+
+
+@dataclass
+class StubConfig:
+    '''
+    Behaviour of the stub server, can be changed while it runs.
+    * `latency`: distribution of the time to first token, "fixed", "uniform" (`latency_ms` ± `jitter_ms`) or "lognormal" (median `latency_ms`)
+    * `chunk_interval_ms`: time between streamed chunks, `chunk_tokens` tokens each. Non streamed answers take as long as streamed ones
+    * `error_rate`: fraction of completions (0.0 - 1.0) answered with `error_status`, 429 responses include `Retry-After: retry_after` secs
+    '''
+    models: list[str] = field(default_factory=lambda: ["stub-model"])
+    latency: str = "fixed"
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    chunk_interval_ms: float = 0.0
+    chunk_tokens: int = 4
+    error_rate: float = 0.0
+    error_status: int = 429
+    retry_after: float = 1.0
+    seed: int | None = None
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count of `text`, about 4 characters per token like OpenAI's tokenizers."""
+    return max(1, -(-len(text) // 4)) if text else 0
+
+
+def extract_skills(description: str) -> dict:
+    """Skills JSON in the format of `extract_skills_prompt`, with the known skills named in `description`."""
+    lowered = description.lower()
+    def named(skills: list[str]) -> list[str]:
+        return [skill for skill in skills if re.search(r"(?<![\w+#.])" + re.escape(skill.lower()) + r"(?![\w+#])", lowered)]
+    tech_stack, technical_skills, other_skills = named(TECHNOLOGIES), named(TECHNICAL_SKILLS), named(OTHER_SKILLS)
+    required = tech_stack[:len(tech_stack) // 2 + 1] if tech_stack else []
+    return {"tech_stack": tech_stack, "technical_skills": technical_skills, "other_skills": other_skills,
+            "required_skills": required + other_skills[:1], "nice_to_have": tech_stack[len(required):]}
+
+
+def answer(messages: list[dict], response_format: dict | None = None) -> str:
+    """Made up answer to the last user message of `messages`."""
+    prompt = next((str(message.get("content", "")) for message in reversed(messages) if message.get("role") == "user"), "")
+    if response_format or '"tech_stack"' in prompt:
+        description = prompt.split("JOB DESCRIPTION:", 1)[-1]
+        return json.dumps(extract_skills(description))
+    question = prompt.split("QUESTION Strat from here:**", 1)[-1].split("Job Description:", 1)[0].strip().lower()
+    if re.search(r"how many|years|number|salary|ctc|notice", question):
+        return "3"
+    if re.match(r"(are|do|did|have|will|would|can|is)\b", question):
+        return "Yes"
+    return "I have built and shipped production software in this area and enjoy working closely with my team."
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/models"):
+            created = int(self.server.started)
+            self._send_json(200, {"object": "list", "data": [{"id": model, "object": "model", "created": created, "owned_by": "stub"}
+                                                             for model in self.server.config.models]})
+        elif path == "/stub/stats":
+            self._send_json(200, self.server.get_stats())
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error", "code": None}})
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_json(400, {"error": {"message": "Body is not valid JSON", "type": "invalid_request_error", "code": None}})
+            return
+        if not self.path.split("?", 1)[0].rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error", "code": None}})
+            return
+        with self.server.track_request():
+            self._complete(body)
+
+    def _complete(self, body: dict) -> None:
+        server = self.server
+        config = server.config
+        model = body.get("model") or config.models[0]
+        if model not in config.models:
+            server.count("errors")
+            self._send_json(404, {"error": {"message": f"The model `{model}` does not exist", "type": "invalid_request_error", "code": "model_not_found"}})
+            return
+        if server.should_fail():
+            server.count("errors")
+            headers = {"Retry-After": f"{config.retry_after:g}"} if config.error_status == 429 else {}
+            message = "Rate limit reached, please retry later" if config.error_status == 429 else "The server had an error while processing your request"
+            self._send_json(config.error_status, {"error": {"message": message, "type": "stub_error", "code": config.error_status}}, headers)
+            return
+
+        messages = body.get("messages") or []
+        content = answer(messages, body.get("response_format"))
+        prompt_tokens = sum(count_tokens(str(message.get("content", ""))) for message in messages)
+        completion_tokens = count_tokens(content)
+        server.count("prompt_tokens", prompt_tokens)
+        server.count("completion_tokens", completion_tokens)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens, "total_tokens": prompt_tokens + completion_tokens}
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        created = int(time.time())
+
+        chunk_size = max(1, config.chunk_tokens) * 4
+        chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)] or [""]
+        time.sleep(server.sample_latency())
+
+        if not body.get("stream"):
+            time.sleep(config.chunk_interval_ms / 1000 * (len(chunks) - 1))
+            self._send_json(200, {
+                "id": completion_id, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        def send_event(delta: dict, finish_reason: str | None = None, with_usage: bool = False) -> None:
+            event = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            if with_usage:
+                event["usage"] = usage
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+        send_event({"role": "assistant", "content": ""})
+        for i, chunk in enumerate(chunks):
+            if i:
+                time.sleep(config.chunk_interval_ms / 1000)
+            send_event({"content": chunk})
+        send_event({}, "stop", with_usage=True)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: StubConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._random = random.Random(config.seed)
+        self._stats = {"requests": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0, "in_flight": 0, "max_in_flight": 0}
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += n
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.update(requests=0, errors=0, prompt_tokens=0, completion_tokens=0, max_in_flight=self._stats["in_flight"])
+
+    def should_fail(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.config.error_rate
+
+    def sample_latency(self) -> float:
+        config = self.config
+        with self._lock:
+            if config.latency == "uniform":
+                value = self._random.uniform(config.latency_ms - config.jitter_ms, config.latency_ms + config.jitter_ms)
+            elif config.latency == "lognormal":
+                sigma = config.jitter_ms / config.latency_ms if config.latency_ms > 0 else 0.0
+                value = self._random.lognormvariate(0, sigma) * config.latency_ms
+            else:
+                value = config.latency_ms
+        return max(0.0, value) / 1000
+
+    @contextmanager
+    def track_request(self):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["in_flight"] += 1
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._stats["in_flight"] -= 1
+
+
+class StubLLMServer:
+    '''
+    Runs the stub server on a background thread. Use as a context manager or call `start()`/`stop()`.
+    * `url`: base URL to use as `llm_api_url` (ends with `/v1`)
+    '''
+    def __init__(self, config: StubConfig | None = None, host: str = "127.0.0.1", port: int = 0):
+        self._server = _StubHTTPServer((host, port), config or StubConfig())
+        self.url = f"http://{host}:{self._server.server_port}/v1"
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-llm-server", daemon=True)
+
+    @property
+    def config(self) -> StubConfig:
+        return self._server.config
+
+    def stats(self) -> dict:
+        return self._server.get_stats()
+
+    def reset_stats(self) -> None:
+        self._server.reset_stats()
+
+    def start(self) -> "StubLLMServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+if __name__ == "__main__":
+    defaults = StubConfig()
+    parser = argparse.ArgumentParser(description="OpenAI-compatible stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--model", action="append", dest="models", help="Model name to serve, can be repeated (default: stub-model)")
+    parser.add_argument("--latency", choices=["fixed", "uniform", "lognormal"], default=defaults.latency)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--chunk-interval-ms", type=float, default=defaults.chunk_interval_ms)
+    parser.add_argument("--chunk-tokens", type=int, default=defaults.chunk_tokens)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after)
+    parser.add_argument("--seed", type=int, default=None)
+    args = vars(parser.parse_args())
+    host, port = args.pop("host"), args.pop("port")
+    config = StubConfig(**{name: value for name, value in args.items() if value is not None})
+    server = StubLLMServer(config, host, port)
+    print(f"Stub LLM server listening on {server.url} with {asdict(config)}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
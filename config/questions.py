@@ -134,6 +134,10 @@ Note: Will be treated as False if `run_in_background = True`
 # Do you want to overwrite previous answers?
 overwrite_previous_answers = False # True or False, Note: True or False are case-sensitive
 
+# Remember answers of questions in successfully submitted applications and reuse them when the same or a very similar question is asked again (before asking AI or answering randomly)?
+remember_answers = True            # True or False, Note: True or False are case-sensitive
+answer_match_threshold = 85        # How similar (in %) a question must be to a remembered one to reuse its answer. Only numbers from 1 to 100... Don't put in quotes. (100 = only the same question)
+
 
 
 
@@ -23,6 +23,10 @@ switch_number = 30                 # Only numbers greater than 0... Don't put in
 # Do you want to randomize the search order for search_terms?
 randomize_search_order = False     # True of False, Note: True or False are case-sensitive
 
+# Stop going through more result pages of a search once this many jobs in a row were already seen (applied, skipped or gone through in earlier cycles or runs)
+stop_after_seen_jobs = 25          # Only numbers 0 or greater... 0 to go through all pages (until `switch_number` applications). Don't put in quotes
+seen_jobs_retention_days = 30      # Forget jobs seen more than these many days ago. 0 to never forget. Don't put in quotes
+
 
 # >>>>>>>>>>> Job Search Filters <<<<<<<<<<<
 ''' 
@@ -86,6 +90,9 @@ about_company_good_words = []      # (dynamic multiple search) or leave empty as
 # Avoid applying to these companies if they have these bad words in their 'Job Description' section...  (In development)
 bad_words = ["US Citizen","USA Citizen","No C2C", "No Corp2Corp", ".NET", "Embedded Programming", "PHP", "Ruby", "CNC"]                     # (dynamic multiple search) or leave empty as []. Case Insensitive. Ex: ["word_1", "phrase 1", "word word", "polygraph", "US Citizenship", "Security Clearance"]
 
+# Should `bad_words`, `about_company_bad_words` and `about_company_good_words` only match whole words? (If True, "PHP" won't match "PHPUnit" and "Java" won't match "JavaScript")
+match_whole_words = False           # True or False, Note: True or False are case-sensitive
+
 # Do you have an active Security Clearance? (True for Yes and False for No)
 security_clearance = False         # True or False, Note: True or False are case-sensitive
 
@@ -36,6 +36,16 @@ alternate_sortby = True             # True or False, Note: True or False are cas
 cycle_date_posted = True            # True or False, Note: True or False are case-sensitive
 stop_date_cycle_at_24hr = True      # True or False, Note: True or False are case-sensitive
 
+# Instead of sleeping 10 min after every cycle, search each term again only when it's due? (Only when `run_non_stop = True`)
+adaptive_scheduling = True          # True or False, Note: True or False are case-sensitive
+'''
+Note: Terms that found new jobs in their last search are searched again sooner (down to `min_search_interval`),
+terms that found only jobs the bot has already seen are searched less often (up to `max_search_interval`).
+'''
+min_search_interval = 300           # Seconds, minimum time before searching the same term again (Eg: 300 = 5 min)
+max_search_interval = 7200          # Seconds, maximum time before searching a term that keeps finding nothing new (Eg: 7200 = 2 hours)
+max_searches_per_hour = 30          # Maximum number of searches in any hour, across all terms (0 = no limit)
+
 
 
 
@@ -64,15 +74,76 @@ file_name = "all excels/all_applied_applications_history.csv"
 failed_file_name = "all excels/all_failed_applications_history.csv"
 logs_folder_path = "logs/"
 
+# Log messages are saved to log.txt in batches. How many messages to collect and how many secs to wait at most before saving a batch?
+log_flush_batch_size = 200          # Only numbers greater than 0... Don't put in quotes. Eg: 50, 200, 1000
+log_flush_interval = 1              # Secs. Only numbers greater than 0... Don't put in quotes. Eg: 1, 2, 5
+
+# Start a new log file when it grows bigger than this size or when the day changes. Older log files are compressed (.gz) and kept in the logs folder.
+log_max_size_mb = 20                # Only numbers greater than or equal to 0... Don't put in quotes. (0 = no size limit)
+log_rotate_daily = True             # True or False, Note: True or False are case-sensitive
+log_backup_count = 14               # How many old (compressed) log files to keep. (0 = keep all)
+
+# Save logs as JSON lines (log.jsonl) with timestamp, level, job_id and stage of each message, instead of plain text (log.txt)? Useful for analysing logs with tools.
+structured_logs = False             # True or False, Note: True or False are case-sensitive
+
+# Path of the SQLite database where history of applied and failed jobs is saved (Indexed, so it stays fast even with thousands of applications)
+history_db_path = "all excels/applications_history.db"
+'''
+Note: Existing CSV files in `file_name` and `failed_file_name` are imported into this database once, automatically.
+'''
+
+# Do you want to keep saving the history of applied and failed jobs in the CSV files as well?
+export_history_csv = True           # True or False, Note: True or False are case-sensitive
+
 # Set the maximum amount of time allowed to wait between each click in secs
 click_gap = 1                       # Enter max allowed secs to wait approximately. (Only Non Negative Integers Eg: 0,1,2,3,....)
 
+# Instead of waiting a random `click_gap` after clicks, wait only until the page stops changing (no new elements and no new network requests), plus a short random pause?
+event_driven_waits = True           # True or False, Note: True or False are case-sensitive
+page_quiet_time = 0.3               # Secs without page changes to consider it ready. Eg: 0.2, 0.3, 0.5
+max_page_settle_time = 5            # Max secs to wait for the page to become quiet. Keep it less than `prefetch_timeout`. Eg: 3, 5, 10
+min_human_pause = 0.2               # Random human-like pause added after each wait, between min and max secs. Eg: 0, 0.2, 0.5
+max_human_pause = 0.6               # Eg: 0.4, 0.6, 1
+
+# Fill all answers of an Easy Apply page at once with JavaScript instead of typing and clicking them one by one? (Much faster. Set it to False if LinkedIn doesn't accept the answers)
+fast_form_filling = True            # True or False, Note: True or False are case-sensitive
+
+# Fetch descriptions of all jobs on a results page at once and skip the ones failing your About Job filters (bad words, clearance, experience) without opening them?
+prefetch_descriptions = True        # True or False, Note: True or False are case-sensitive
+prefetch_timeout = 30               # Max secs to wait for the descriptions of a page. Only numbers greater than 0... Don't put in quotes. Eg: 15, 30, 60
+
+# Remember jobs skipped by your filters and companies blacklisted by `about_company_bad_words` across runs, so they are skipped without opening them again?
+remember_rejections = True          # True or False, Note: True or False are case-sensitive
+forget_rejections_on_filter_change = True # Give them another chance when you change the filters in `config/search.py` (bad words, experience, clearance...)? True or False
+rejections_retention_days = 30      # Forget them after these many days. 0 to never forget. Don't put in quotes
+
 # If you want to see Chrome running then set run_in_background as False (May reduce performance). 
 run_in_background = False           # True or False, Note: True or False are case-sensitive ,   If True, this will make pause_at_failed_question, pause_before_submit and run_in_background as False
 
 # If you want to disable extensions then set disable_extensions as True (Better for performance)
 disable_extensions = False          # True or False, Note: True or False are case-sensitive
 
+# Don't load images, fonts, videos and ad/tracking scripts the bot doesn't need? (Pages load faster and use less data, but show without pictures). Experimental, opt-in
+lean_browsing = False               # True or False, Note: True or False are case-sensitive
+lean_browsing_blocked_urls = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.ico*", "*.woff*", "*.ttf*", "*.otf*", "*.mp4*", "*.webm*", "*.m3u8*",
+                              "*media.licdn.com/dms/image*", "*px.ads.linkedin.com*", "*doubleclick.net*", "*googletagmanager.com*", "*google-analytics.com*"]
+'''
+URL patterns to block when you turn on `lean_browsing`, `*` matches anything. They are only used then.
+Patterns like "*.png*" match any URL containing ".png", not just images, so remove a pattern if some part of LinkedIn stops working.
+Try `python -m benchmarks.bench_lean_browsing` first to see what you save on your connection.
+'''
+
+# How long should Chrome wait for a page to load before the bot goes on? "normal" waits for every image and script, "eager" only for the page's HTML (faster, the bot waits for the elements it needs anyway), "none" doesn't wait
+page_load_strategy = "eager"        # "normal", "eager" or "none"
+navigation_page_load = {"login": "normal", "search": "eager"}  # Overrides `page_load_strategy` for kinds of pages. Eg: {"login": "normal", "search": "none"}
+page_load_timeout = 30              # Max secs to wait for a page to load. Only numbers greater than 0... Don't put in quotes. Eg: 20, 30, 60
+script_timeout = 40                 # Max secs for scripts run by the bot (prefetching descriptions, waiting for pages to settle). At least `prefetch_timeout` + 5, so prefetching can return what it got before the browser stops it
+element_wait_timeout = 5            # Max secs to wait for elements the bot looks for. Eg: 3, 5, 10
+'''
+Note: Kinds of pages in `navigation_page_load` are "login" (LinkedIn login and feed) and "search" (job search results).
+Time taken until the bot can use each kind of page is shown at the end of the run and in the dashboard metrics (`ttfue_<kind>`, `ttfue_job` for job details).
+'''
+
 # Run in safe mode. Set this true if chrome is taking too long to open or if you have multiple profiles in browser. This will open chrome in guest profile!
 safe_mode = True                   # True or False, Note: True or False are case-sensitive
 
@@ -84,10 +155,49 @@ keep_screen_awake = True            # True or False, Note: True or False are cas
 
 # Run in undetected mode to bypass anti-bot protections (Preview Feature, UNSTABLE. Recommended to leave it as False)
 stealth_mode = False                # True or False, Note: True or False are case-sensitive
+cache_chromedriver = True           # Keep the Chrome Driver of undetected mode to reuse it in next runs (and without internet), instead of downloading it every run? True or False
+chromedriver_cache_path = "drivers/" # Folder where the Chrome Driver is kept, one per Chrome version
 
 # Do you want to get alerts on errors related to AI API connection?
 showAiErrorAlerts = False            # True or False, Note: True or False are case-sensitive
 
+# Reuse skills extracted by AI when the same job description is seen again (Eg: same job under another search term, re-posted jobs or next run)? Saves AI calls and time.
+cache_extracted_skills = True       # True or False, Note: True or False are case-sensitive
+skills_cache_ttl_days = 30          # How many days to keep reusing extracted skills. Only numbers greater than or equal to 0... Don't put in quotes. (0 = forever)
+skills_cache_max_entries = 5000     # Maximum number of job descriptions to remember, least recently used are forgotten first. (0 = no limit)
+
+# Extract skills with AI in the background while the application is being filled? How many extractions can run at once and how many secs to wait for one when saving the job?
+skills_extraction_workers = 2       # Only numbers greater than or equal to 0... Don't put in quotes. (0 = extract before applying, like before)
+skills_extraction_timeout = 60      # Secs. Only numbers greater than 0... Don't put in quotes. Eg: 30, 60, 120
+
+# Ask AI all the questions of an Easy Apply page it needs to answer in one request, instead of one request per question? (Falls back to one by one if AI's reply can't be read)
+batch_ai_questions = True           # True or False, Note: True or False are case-sensitive
+
+# Connections to the AI API are kept open and shared by all AI calls. Max secs to connect and to wait for an answer, and max connections open at once
+ai_connect_timeout = 10             # Eg: 5, 10, 20
+ai_read_timeout = 120               # Eg: 60, 120, 300 (local LLMs can be slow)
+ai_max_connections = 10             # Eg: 5, 10, 20
+ai_http2 = True                     # Use HTTP/2 when the `h2` package is installed (pip install h2)? True or False
+
+# Limits of AI requests per provider, to stay under your API plan's rate limits: requests per minute ("rpm") and tokens per minute ("tpm"). 0 for no limit
+ai_rate_limits = {"openai": {"rpm": 60, "tpm": 150000}, "deepseek": {"rpm": 60, "tpm": 0}, "gemini": {"rpm": 15, "tpm": 1000000}}
+ai_max_retries = 3                  # Retries of AI calls failing with rate limits (429), timeouts or server errors. Eg: 0, 3, 5
+ai_retry_base_delay = 1             # Secs to wait before the first retry, doubled (with some randomness) each retry. The wait asked by the API is used instead if it gives one
+ai_retry_max_delay = 30             # Max secs to wait between retries
+ai_circuit_failures = 5             # After these many failed AI calls in a row, stop calling AI and use answers from your config...
+ai_circuit_cooldown = 300           # ...for these many secs, then try AI again
+
+# Max secs to wait for AI to answer a question (or all questions of a page) and max secs of AI answering per job. When AI takes longer, answers from your config are used (Eg: `years_of_experience`, `linkedin_summary`)
+ai_answer_timeout = 20              # Eg: 10, 20, 60 (0 = no limit)
+ai_job_budget = 60                  # Eg: 30, 60, 120 (0 = no limit)
+'''
+Note: A late AI answer isn't lost, it's kept and used the next time the same question is asked.
+'''
+
+# Local Ollama server used when `ai_provider = "ollama"` (start it with `ollama serve`), and how long it should keep the model loaded after the last call
+ollama_url = "http://localhost:11434"
+ollama_keep_alive = "30m"           # Eg: "10m", "1h", -1 (until Ollama stops), 0 (unload right away)
+
 # Use ChatGPT for resume building (Experimental Feature can break the application. Recommended to leave it as False) 
 # use_resume_generator = False       # True or False, Note: True or False are case-sensitive ,   This feature may only work with 'stealth_mode = True'. As ChatGPT website is hosted by CloudFlare which is protected by Anti-bot protections!
 
@@ -0,0 +1,89 @@
+"""Time limits of AI calls.
+
+A slow AI answer keeps the Easy Apply modal open while LinkedIn's session
+timers run. `call_with_deadline()` waits for an AI call at most `timeout`
+secs and then gives up with `DeadlineExceeded`, so the bot can use the
+answer from your config instead. The call isn't killed, it finishes in the
+background and its result can still be kept for later (`on_late`).
+
+`Budget` is the AI time left for one job (`ai_job_budget`), each call gets
+at most what's left of it.
+
+Missed deadlines are counted in `modules.dashboard.metrics` as
+`ai_deadline_misses` and per stage as `ai_deadline_misses_<stage>`.
+"""
+import threading
+import time
+from typing import Callable
+
+
+class DeadlineExceeded(TimeoutError):
+    pass
+
+
+class Budget:
+    '''
+    `seconds` of AI time to share between the calls of one job. 0 means no limit.
+    '''
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.ends_at = clock() + seconds if seconds > 0 else None
+
+    def remaining(self) -> float | None:
+        '''
+        Secs left, `None` if there is no limit.
+        '''
+        return None if self.ends_at is None else max(self.ends_at - self.clock(), 0)
+
+    def timeout(self, limit: float) -> float | None:
+        '''
+        Secs a call may take: `limit` (0 for no limit) or what's left of the budget, whichever is less. `None` if there is no limit.
+        '''
+        remaining = self.remaining()
+        if limit <= 0: return remaining
+        return limit if remaining is None else min(limit, remaining)
+
+
+def record_miss(stage: str) -> None:
+    from modules.dashboard import metrics as _m
+    _m.inc("ai_deadline_misses")
+    _m.inc(f"ai_deadline_misses_{stage}")
+
+
+def call_with_deadline(stage: str, timeout: float | None, function: Callable, *args, on_late: Callable | None = None, **kwargs):
+    '''
+    Returns `function(*args, **kwargs)` if it finishes within `timeout` secs (`None` to wait as long as it takes).
+    * `stage`: name the missed deadline is counted under (Eg: "question")
+    * `on_late`: called with the result if `function` finishes after the deadline (Eg: to cache it)
+    * Raises `DeadlineExceeded` if it didn't finish in time, or the error `function` raised
+    '''
+    if timeout is None: return function(*args, **kwargs)
+    if timeout <= 0:
+        record_miss(stage)
+        raise DeadlineExceeded(f"No AI time left for {stage}")
+    outcome = {}
+    finished = threading.Event()
+    lock = threading.Lock()
+
+    def run() -> None:
+        try:
+            outcome["result"] = function(*args, **kwargs)
+        except BaseException as error:
+            outcome["error"] = error
+        with lock:
+            finished.set()
+            late = outcome.get("abandoned", False)
+        if late and on_late and "result" in outcome:
+            try: on_late(outcome["result"])
+            except Exception: pass
+
+    # Daemon thread, so a call that never returns doesn't keep the bot from exiting
+    threading.Thread(target=run, name=f"ai-{stage}", daemon=True).start()
+    if not finished.wait(timeout):
+        with lock:
+            if not finished.is_set():
+                outcome["abandoned"] = True
+                record_miss(stage)
+                raise DeadlineExceeded(f"AI took longer than {timeout:.1f} secs for {stage}")
+    if "error" in outcome: raise outcome["error"]
+    return outcome["result"]
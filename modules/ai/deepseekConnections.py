@@ -1,10 +1,10 @@
 ##> ------ Yang Li : MARKYangL - Feature ------
 from config.secrets import *
-from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.transport import get_http_client
+from modules.ai.resilience import alert_in_background, estimate_tokens, get_guard
 
-from pyautogui import confirm
 from openai import OpenAI
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
@@ -28,7 +28,7 @@ def deepseek_create_client() -> OpenAI | None:
             base_url = base_url[:-1]
         
         # Create client with DeepSeek endpoint
-        client = OpenAI(base_url=base_url, api_key=llm_api_key)
+        client = OpenAI(base_url=base_url, api_key=llm_api_key, http_client=get_http_client(), max_retries=0)  # Retries are done by `get_guard()`
         
         print_lg("---- SUCCESSFULLY CREATED DEEPSEEK CLIENT! ----")
         print_lg(f"Using API URL: {base_url}")
@@ -40,9 +40,7 @@ def deepseek_create_client() -> OpenAI | None:
     except Exception as e:
         error_message = f"Error occurred while creating DeepSeek client. Make sure your API connection details are correct."
         critical_error_log(error_message, e)
-        if showAiErrorAlerts:
-            if "Pause AI error alerts" == confirm(f"{error_message}\n{str(e)}", "DeepSeek Connection Error", ["Pause AI error alerts", "Okay Continue"]):
-                showAiErrorAlerts = False
+        alert_in_background(f"{error_message}\n{str(e)}", "DeepSeek Connection Error")
         return None
 
 def deepseek_model_supports_temperature(model_name: str) -> bool:
@@ -91,7 +89,8 @@ def deepseek_completion(client: OpenAI, messages: list[dict], response_format: d
         print_lg(f"Calling DeepSeek API for completion...")
         print_lg(f"Using model: {llm_model}")
         print_lg(f"Message count: {len(messages)}")
-        completion = client.chat.completions.create(**params)
+        guard = get_guard("deepseek")
+        completion = (guard.stream if stream else guard.call)(client.chat.completions.create, tokens=estimate_tokens(*(message["content"] for message in messages)), **params)
     ##<
         result = ""
         
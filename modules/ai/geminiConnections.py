@@ -1,9 +1,8 @@
 import google.generativeai as genai
 from config.secrets import llm_model, llm_api_key
-from config.settings import showAiErrorAlerts
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
-from pyautogui import confirm
+from modules.ai.resilience import alert_in_background, estimate_tokens, get_guard
 from typing import Literal
 
 def gemini_get_models_list():
@@ -50,9 +49,7 @@ def gemini_create_client():
     except Exception as e:
         error_message = f"Error occurred while configuring Gemini client. Make sure your API key and model name are correct."
         critical_error_log(error_message, e)
-        if showAiErrorAlerts:
-            if "Pause AI error alerts" == confirm(f"{error_message}\n{str(e)}", "Gemini Connection Error", ["Pause AI error alerts", "Okay Continue"]):
-                showAiErrorAlerts = False
+        alert_in_background(f"{error_message}\n{str(e)}", "Gemini Connection Error")
         return None
 
 def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
@@ -90,7 +87,7 @@ def gemini_completion(model, prompt: str, is_json: bool = False) -> dict | str:
         ]
 
         print_lg(f"Calling Gemini API for completion...")
-        response = model.generate_content(prompt, safety_settings=safety_settings)
+        response = get_guard("gemini").call(model.generate_content, prompt, tokens=estimate_tokens(prompt), safety_settings=safety_settings)
         
         # The response might be blocked. Check for that.
         if not response.parts:
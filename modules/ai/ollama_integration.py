@@ -1,56 +1,211 @@
-"""Ollama Qwen-3-14B wrapper with streaming support"""
-import subprocess
-import shlex
+"""Ollama Qwen-3-14B wrapper with streaming support.
+
+Talks to the local Ollama server (`ollama serve`, `ollama_url` in
+`config/settings.py`) over its HTTP API instead of starting an `ollama run`
+process per call. Connections are kept alive and reused, `preload()` loads
+the model when the bot starts and keeps it loaded for `ollama_keep_alive`,
+and streamed answers are read token by token from the NDJSON response.
+
+Response time and time to first token of each call are recorded in
+`modules.dashboard.metrics` (`ollama_response_time`, `ollama_ttft`).
+"""
+import http.client
+import json
 import threading
 import time
-from typing import Optional, Iterator
+from typing import Iterator
+from urllib.parse import urlsplit
+
+from config.settings import ollama_url, ollama_keep_alive
 
-OLLAMA_BINARY = "ollama"  # assumes `ollama` is on PATH
 MODEL_NAME = "qwen-3-14b"
 
 
-def _read_process_stream(proc: subprocess.Popen) -> Iterator[str]:
-    """Yield stdout incremental chunks from the process."""
+class OllamaError(Exception):
+    pass
+
+
+class OllamaClient:
+    '''
+    Client of the Ollama server API keeping up to `pool_size` idle keep-alive connections for reuse.
+    '''
+    def __init__(self, base_url: str = ollama_url, model: str = MODEL_NAME, keep_alive: str | int = ollama_keep_alive, pool_size: int = 4):
+        url = urlsplit(base_url)
+        self.host = url.hostname or "localhost"
+        self.port = url.port or (443 if url.scheme == "https" else 11434)
+        self.https = url.scheme == "https"
+        self.model = model
+        self.keep_alive = keep_alive
+        self.pool_size = pool_size
+        self.connections_opened = 0
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+            conn = connection_class(self.host, self.port, timeout=timeout)
+            self.connections_opened += 1
+        conn.timeout = timeout
+        if conn.sock: conn.sock.settimeout(timeout)
+        return conn
+
+    def _release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        with self._lock:
+            if reusable and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _post(self, path: str, payload: dict, timeout: float) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        for attempt in range(2):
+            conn = self._connect(timeout)
+            reused = conn.sock is not None
+            try:
+                conn.request("POST", path, body, headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused and attempt == 0: continue   # The server closed an idle connection, try a new one
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if response.status != 200:
+                detail = response.read().decode("utf-8", "replace")
+                self._release(conn, not response.will_close)
+                try: detail = json.loads(detail).get("error", detail)
+                except (ValueError, AttributeError): pass
+                raise OllamaError(f"HTTP {response.status}: {detail}")
+            return conn, response
+
+    def _payload(self, prompt: str | None, stream: bool) -> dict:
+        payload = {"model": self.model, "stream": stream, "keep_alive": self.keep_alive}
+        if prompt is not None: payload["prompt"] = prompt
+        return payload
+
+    def preload(self, timeout: float = 300) -> None:
+        '''
+        Loads the model into memory and keeps it there for `keep_alive`, so the first real call doesn't wait for it.
+        '''
+        conn, response = self._post("/api/generate", self._payload(None, False), timeout)
+        response.read()
+        self._release(conn, not response.will_close)
+
+    def stream_generate(self, prompt: str, timeout: float = 60) -> Iterator[str]:
+        '''
+        Yields the answer to `prompt` as it is generated. Raises `OllamaError` or `TimeoutError` if it fails or takes longer than `timeout` secs.
+        '''
+        start = time.perf_counter()
+        deadline = start + timeout
+        conn = response = None
+        done = False
+        first_token = None
+        try:
+            conn, response = self._post("/api/generate", self._payload(prompt, True), timeout)
+            for line in response:
+                if not line.strip(): continue
+                message = json.loads(line)
+                if message.get("error"): raise OllamaError(message["error"])
+                piece = message.get("response", "")
+                if piece:
+                    if first_token is None:
+                        first_token = time.perf_counter() - start
+                        _record_first_token(first_token)
+                    yield piece
+                if message.get("done"):
+                    done = True
+                    break
+                if time.perf_counter() > deadline: raise TimeoutError(f"No full answer from Ollama in {timeout} secs")
+        finally:
+            if conn:
+                if done: response.read()    # Reach the end of the response to reuse the connection
+                self._release(conn, done and not response.will_close)
+            _record_call(time.perf_counter() - start, done)
+
+    def generate(self, prompt: str, timeout: float = 60) -> str:
+        '''
+        Returns the whole answer to `prompt`. Raises `OllamaError` or `TimeoutError` if it fails or takes longer than `timeout` secs.
+        '''
+        start = time.perf_counter()
+        ok = False
+        try:
+            conn, response = self._post("/api/generate", self._payload(prompt, False), timeout)
+            try:
+                data = json.loads(response.read())
+            except Exception:
+                conn.close()
+                raise
+            self._release(conn, not response.will_close)
+            if data.get("error"): raise OllamaError(data["error"])
+            _record_first_token(time.perf_counter() - start)   # Nothing comes before the whole answer without streaming
+            ok = True
+            return data.get("response", "").strip()
+        finally:
+            _record_call(time.perf_counter() - start, ok)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle: conn.close()
+
+
+def _record_call(duration: float, ok: bool) -> None:
     try:
-        while True:
-            chunk = proc.stdout.readline()
-            if chunk == '' and proc.poll() is not None:
-                break
-            if chunk:
-                yield chunk
-    finally:
-        # drain remaining
-        rest = proc.stdout.read()
-        if rest:
-            yield rest
-
-
-def stream_generate(prompt: str, timeout: int = 60, cmd_extra: Optional[str] = None) -> Iterator[str]:
-    """Generator yielding incremental text from local `ollama` call."""
-    cmd = [OLLAMA_BINARY, 'run', MODEL_NAME, '--prompt', prompt]
-    if cmd_extra:
-        cmd.extend(shlex.split(cmd_extra))
+        from modules.dashboard import metrics as _m
+        _m.inc("ollama_calls" if ok else "ollama_errors")
+        _m.append_sample("ollama_response_time", duration)
+    except Exception:
+        pass
+
+
+def _record_first_token(duration: float) -> None:
     try:
-        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    except FileNotFoundError:
-        yield "[Ollama Error] ollama binary not found on PATH"
-        return
+        from modules.dashboard import metrics as _m
+        _m.append_sample("ollama_ttft", duration)
+    except Exception:
+        pass
+
+
+_client: OllamaClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OllamaClient:
+    '''
+    Returns the shared `OllamaClient`, created on first use.
+    '''
+    global _client
+    with _client_lock:
+        if _client is None: _client = OllamaClient()
+        return _client
+
+
+def preload(timeout: float = 300) -> bool:
+    '''
+    Loads the model in the Ollama server for `ollama_keep_alive`. Returns `False` if Ollama couldn't be reached.
+    '''
+    try:
+        get_client().preload(timeout)
+        return True
     except Exception as e:
-        yield f"[Ollama Error] {e}"
-        return
+        from modules.helpers import print_lg
+        print_lg(f"[Ollama Error] Couldn't preload {MODEL_NAME}:", e)
+        return False
+
 
-    start = time.perf_counter()
+def stream_generate(prompt: str, timeout: int = 60) -> Iterator[str]:
+    """Generator yielding incremental text from the local Ollama server."""
     try:
-        for piece in _read_process_stream(proc):
-            yield piece
-    finally:
-        duration = time.perf_counter() - start
-        try:
-            from modules.dashboard import metrics as _m
-            _m.inc('ollama_calls')
-            _m.append_sample('ollama_response_time', duration)
-        except Exception:
-            pass
+        yield from get_client().stream_generate(prompt, timeout)
+    except TimeoutError:
+        yield "[Ollama Error] Timeout"
+    except (OSError, OllamaError, ValueError) as e:
+        yield f"[Ollama Error] {e}"
 
 
 def generate(prompt: str, timeout: int = 60, stream: bool = False) -> str | Iterator[str]:
@@ -61,24 +216,9 @@ def generate(prompt: str, timeout: int = 60, stream: bool = False) -> str | Iter
     """
     if stream:
         return stream_generate(prompt, timeout)
-
-    cmd = [OLLAMA_BINARY, 'run', MODEL_NAME, '--prompt', prompt]
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
-        if proc.returncode == 0:
-            text = proc.stdout.strip()
-            try:
-                from modules.dashboard import metrics as _m
-                _m.inc('ollama_calls')
-                _m.append_sample('ollama_response_time', 0)
-            except Exception:
-                pass
-            return text
-        else:
-            return f"[Ollama Error] {proc.stderr.strip()}"
-    except subprocess.TimeoutExpired:
+        return get_client().generate(prompt, timeout)
+    except TimeoutError:
         return "[Ollama Error] Timeout"
-    except FileNotFoundError:
-        return "[Ollama Error] ollama binary not found on PATH"
-    except Exception as e:
+    except (OSError, OllamaError, ValueError) as e:
         return f"[Ollama Error] {e}"
@@ -14,15 +14,15 @@ version:    24.12.29.12.30
 
 
 from config.secrets import *
-from config.settings import showAiErrorAlerts
 from config.personals import ethnicity, gender, disability_status, veteran_status
 from config.questions import *
 from config.search import security_clearance, did_masters
 
 from modules.helpers import print_lg, critical_error_log, convert_to_json
 from modules.ai.prompts import *
+from modules.ai.transport import get_http_client
+from modules.ai.resilience import alert_in_background, estimate_tokens, get_guard
 
-from pyautogui import confirm
 from openai import OpenAI
 from openai.types.model import Model
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
@@ -43,13 +43,10 @@ ERROR:
 # Function to show an AI error alert
 def ai_error_alert(message: str, stackTrace: str, title: str = "AI Connection Error") -> None:
     """
-    Function to show an AI error alert and log it.
+    Function to log an AI error and show an alert about it without stopping the bot.
     """
-    global showAiErrorAlerts
-    if showAiErrorAlerts:
-        if "Pause AI error alerts" == confirm(f"{message}{stackTrace}\n", title, ["Pause AI error alerts", "Okay Continue"]):
-            showAiErrorAlerts = False
     critical_error_log(message, stackTrace)
+    alert_in_background(f"{message}{stackTrace}\n", title)
 
 
 # Function to check if an error occurred
@@ -77,7 +74,7 @@ def ai_create_openai_client() -> OpenAI:
         if not use_AI:
             raise ValueError("AI is not enabled! Please enable it by setting `use_AI = True` in `secrets.py` in `config` folder.")
         
-        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key)
+        client = OpenAI(base_url=llm_api_url, api_key=llm_api_key, http_client=get_http_client(), max_retries=0)  # Retries are done by `get_guard()`
 
         models = ai_get_models_list(client)
         if "error" in models:
@@ -165,7 +162,8 @@ def ai_completion(client: OpenAI, messages: list[dict], response_format: dict =
     if response_format and llm_spec in ["openai", "openai-like"]:
         params["response_format"] = response_format
 
-    completion = client.chat.completions.create(**params)
+    guard = get_guard("openai")
+    completion = (guard.stream if stream else guard.call)(client.chat.completions.create, tokens=estimate_tokens(*(message["content"] for message in messages)), **params)
 
     result = ""
     
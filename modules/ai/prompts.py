@@ -104,6 +104,11 @@ extract_skills_response_format = {
 """
 Response schema for `extract_skills` function
 """
+
+extract_skills_prompt_version = "1"
+"""
+Version of the skills extraction prompts and response schema above. Increase it whenever you change them, so cached skills (`modules.storage.skills_cache`) are extracted again.
+"""
 #<
 
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
@@ -126,4 +131,56 @@ Respond concisely based on the type of question:
 **QUESTION Strat from here:**  
 {}
 """
+
+# Structure of messages = `[{"role": "user", "content": ai_answer_batch_prompt}]`
+
+ai_answer_batch_prompt = """
+You are an intelligent AI assistant filling out a form and answer like human.
+Answer EVERY question in the list below. Respond concisely based on the type of each question:
+
+1. If the question asks for **years of experience, duration, or numeric value**, answer **only a number** (e.g., "2", "5", "10").
+2. If the question is **a Yes/No question**, answer **only "Yes" or "No"**.
+3. If the question requires a **short description** ("text"), give a **single-sentence answer**.
+4. If the question requires a **detailed response** ("textarea"), give a **well-structured and human-like answer of less than 350 characters**.
+5. Do **not** repeat the question in your answer.
+
+Return ONLY a JSON object, no other text, with one entry per question using its "id":
+{{"answers": [{{"id": "<id of the question>", "answer": "<your answer>"}}]}}
+
+**User Information:**
+{}
+
+**QUESTIONS:**
+{}
+"""
+"""
+Use `ai_answer_batch_prompt.format(user_information_all, questions_json)`, `questions_json` is a JSON array of {"id", "question", "type"}.
+"""
+
+ai_answer_batch_response_format = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Batch_Answers_Response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answers": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {"id": {"type": "string"}, "answer": {"type": "string"}},
+                        "required": ["id", "answer"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["answers"],
+            "additionalProperties": False
+        },
+    },
+}
+"""
+Response schema for answering several questions in one call
+"""
 #<
\ No newline at end of file
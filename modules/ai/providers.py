@@ -0,0 +1,320 @@
+"""AI providers behind one interface.
+
+Each provider (OpenAI, DeepSeek, Gemini, Ollama) is a subclass of
+`AIProvider` registered under the name used for `ai_provider` in
+`config/secrets.py`. The bot calls `connect(ai_provider)` once and then
+only uses `complete()`, `stream()`, `extract_skills()`,
+`answer_question()` and `answer_questions()` (all questions of a page in
+one call), so adding a provider means adding a class here.
+
+OpenAI compatible providers share the pooled HTTP client of
+`modules.ai.transport`. Ollama keeps its own keep-alive pool in
+`modules.ai.ollama_integration`. Provider SDKs are imported only when their
+provider connects.
+"""
+import json
+import threading
+from typing import Iterator, Literal
+
+from modules.ai.prompts import ai_answer_prompt, ai_answer_batch_prompt, ai_answer_batch_response_format, extract_skills_prompt
+
+QuestionType = Literal['text', 'textarea', 'single_select', 'multiple_select']
+
+_registry: dict[str, type["AIProvider"]] = {}
+
+
+class BatchParseError(ValueError):
+    '''
+    The AI answered a batch of questions, but its answer couldn't be read.
+    '''
+
+
+def register(name: str):
+    '''
+    Class decorator registering an `AIProvider` subclass under `name`.
+    '''
+    def decorator(cls: type["AIProvider"]) -> type["AIProvider"]:
+        cls.name = name
+        _registry[name] = cls
+        return cls
+    return decorator
+
+
+def available_providers() -> list[str]:
+    return list(_registry)
+
+
+def create_provider(name: str) -> "AIProvider":
+    '''
+    Returns a new, not yet connected provider registered as `name` (case-insensitive). Raises `ValueError` if there is none.
+    '''
+    cls = _registry.get(name.lower())
+    if cls is None: raise ValueError(f'Unknown AI provider "{name}"! Expecting one of {available_providers()}.')
+    return cls()
+
+
+def connect(name: str) -> "AIProvider | None":
+    '''
+    Creates and connects the provider registered as `name`. Returns `None` if it couldn't connect (the error is already logged).
+    '''
+    provider = create_provider(name)
+    return provider if provider.connect() else None
+
+
+def build_question_prompt(question: str, options: list[str] | None = None, question_type: QuestionType = 'text',
+                          job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str:
+    '''
+    Returns the prompt to answer a form question, with its options and the job details if given.
+    '''
+    prompt = ai_answer_prompt.format(user_information_all or "", question)
+    if options and question_type in ['single_select', 'multiple_select']:
+        prompt += "\n\nOPTIONS:\n" + "\n".join(f"- {option}" for option in options)
+        if question_type == 'single_select':
+            prompt += "\n\nPlease select exactly ONE option from the list above."
+        else:
+            prompt += "\n\nYou may select MULTIPLE options from the list above if appropriate."
+    if job_description and job_description != "Unknown":
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+    if about_company and about_company != "Unknown":
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+    return prompt
+
+
+def build_batch_prompt(questions: list[dict], job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str:
+    '''
+    Returns the prompt to answer all `questions` ({"id", "question", "type"}) at once, with the job details given only once.
+    '''
+    prompt = ai_answer_batch_prompt.format(user_information_all or "", json.dumps(questions, ensure_ascii=False, indent=1))
+    if job_description and job_description != "Unknown":
+        prompt += f"\n\nJOB DESCRIPTION:\n{job_description}"
+    if about_company and about_company != "Unknown":
+        prompt += f"\n\nABOUT COMPANY:\n{about_company}"
+    return prompt
+
+
+def parse_batch_answers(result, ids: list[str]) -> dict[str, str]:
+    '''
+    Returns {question id: answer} from the AI `result` of a batch prompt, keeping only non-empty answers to the questions in `ids`.
+    * Accepts {"answers": [{"id", "answer"}]}, a bare list of them or an {id: answer} object, as JSON text or already parsed
+    * Raises `BatchParseError` if `result` is none of these, or `RuntimeError` if it's an error of the provider ({"error"} without "data")
+    '''
+    if isinstance(result, str): result = _parse_json(result)
+    if isinstance(result, dict) and "error" in result:
+        if "data" not in result: raise RuntimeError(f"AI failed to answer the questions: {result['error']}")
+        raise BatchParseError(f"AI didn't return JSON: {result['data']}")
+    if isinstance(result, dict) and isinstance(result.get("answers"), list): result = result["answers"]
+    if isinstance(result, list):
+        pairs = [(str(item.get("id")), item.get("answer")) for item in result if isinstance(item, dict)]
+    elif isinstance(result, dict):
+        pairs = [(str(key), value) for key, value in result.items()]
+    else:
+        raise BatchParseError(f"Unexpected AI answer for the questions: {result!r}")
+    wanted = set(ids)
+    return {key: str(value).strip() for key, value in pairs if key in wanted and value not in (None, "") and str(value).strip()}
+
+
+class AIProvider:
+    '''
+    Interface of an AI provider. Subclasses implement `connect()` and `complete()`, the rest have defaults built on them.
+    '''
+    name = ""
+
+    def __init__(self):
+        self.client = None
+
+    @property
+    def model(self) -> str:
+        from config.secrets import llm_model
+        return llm_model
+
+    @property
+    def healthy(self) -> bool:
+        '''
+        `False` while calls to this provider fail fast because it kept failing (see `modules.ai.resilience`).
+        '''
+        from modules.ai.resilience import get_guard
+        return get_guard(self.name).healthy
+
+    def connect(self) -> bool:
+        '''
+        Creates the client. Returns `False` if it failed.
+        '''
+        raise NotImplementedError
+
+    def close(self) -> None:
+        self.client = None
+
+    def complete(self, prompt: str, response_format: dict | None = None) -> str | dict:
+        '''
+        Returns the answer to `prompt`, parsed as JSON if `response_format` (a JSON schema) is given.
+        '''
+        raise NotImplementedError
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        '''
+        Yields the answer to `prompt` in pieces as they are generated.
+        '''
+        yield str(self.complete(prompt))
+
+    def extract_skills(self, job_description: str) -> dict | str:
+        from modules.ai.prompts import extract_skills_response_format
+        prompt = extract_skills_prompt.format(job_description) + "\n\nImportant: Respond with only the JSON object, without any markdown formatting or other text."
+        return self.complete(prompt, extract_skills_response_format)
+
+    def answer_question(self, question: str, options: list[str] | None = None, question_type: QuestionType = 'text',
+                        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str | dict:
+        return self.complete(build_question_prompt(question, options, question_type, job_description, about_company, user_information_all))
+
+    def answer_questions(self, questions: list[dict], job_description: str | None = None, about_company: str | None = None,
+                         user_information_all: str | None = None) -> dict[str, str]:
+        '''
+        Answers all `questions` ({"id", "question", "type"}) in one call. Returns {id: answer}, questions it couldn't answer are left out.
+        * Raises `BatchParseError` if the answer couldn't be read, or the error of the call if it failed
+        '''
+        import time
+        from modules.dashboard import metrics as _m
+        start = time.perf_counter()
+        result = self.complete(build_batch_prompt(questions, job_description, about_company, user_information_all), ai_answer_batch_response_format)
+        answers = parse_batch_answers(result, [question["id"] for question in questions])
+        _m.inc("ai_batch_calls")
+        _m.inc("ai_batch_questions", len(questions))
+        _m.append_sample("ai_batch_answer_time", time.perf_counter() - start)
+        return answers
+
+
+def _parse_json(text: str) -> dict | list:
+    '''
+    Parses `text` as JSON, ignoring a markdown code fence around it. Returns {"error", "data"} if it isn't JSON, like `convert_to_json()`.
+    '''
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[-1] if "\n" in text else text[3:]
+        if text.endswith("```"): text = text[:-3]
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return {"error": "Unable to parse the response as JSON", "data": text}
+
+
+@register("openai")
+class OpenAIProvider(AIProvider):
+    def connect(self) -> bool:
+        from modules.ai.openaiConnections import ai_create_openai_client
+        self.client = ai_create_openai_client()
+        return self.client is not None
+
+    def close(self) -> None:
+        from modules.ai.transport import close_http_client
+        close_http_client()
+        self.client = None
+
+    def complete(self, prompt: str, response_format: dict | None = None) -> str | dict:
+        from modules.ai.openaiConnections import ai_completion
+        return ai_completion(self.client, [{"role": "user", "content": prompt}], response_format=response_format, stream=False)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        from modules.ai.resilience import estimate_tokens, get_guard
+        params = {"model": self.model, "messages": [{"role": "user", "content": prompt}], "stream": True}
+        for chunk in get_guard(self.name).stream(self.client.chat.completions.create, tokens=estimate_tokens(prompt), **params):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def extract_skills(self, job_description: str) -> dict | str:
+        from modules.ai.openaiConnections import ai_extract_skills
+        return ai_extract_skills(self.client, job_description)
+
+    def answer_question(self, question: str, options: list[str] | None = None, question_type: QuestionType = 'text',
+                        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str | dict:
+        from modules.ai.openaiConnections import ai_answer_question
+        return ai_answer_question(self.client, question, options, question_type, job_description, about_company, user_information_all)
+
+
+@register("deepseek")
+class DeepSeekProvider(OpenAIProvider):
+    def connect(self) -> bool:
+        from modules.ai.deepseekConnections import deepseek_create_client
+        self.client = deepseek_create_client()
+        return self.client is not None
+
+    def complete(self, prompt: str, response_format: dict | None = None) -> str | dict:
+        from modules.ai.deepseekConnections import deepseek_completion
+        # DeepSeek doesn't take JSON schemas, only asks for any JSON object
+        return deepseek_completion(self.client, [{"role": "user", "content": prompt}], response_format={"type": "json_object"} if response_format else None, stream=False)
+
+    def extract_skills(self, job_description: str) -> dict | str:
+        from modules.ai.deepseekConnections import deepseek_extract_skills
+        return deepseek_extract_skills(self.client, job_description)
+
+    def answer_question(self, question: str, options: list[str] | None = None, question_type: QuestionType = 'text',
+                        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str | dict:
+        from modules.ai.deepseekConnections import deepseek_answer_question
+        return deepseek_answer_question(self.client, question, options, question_type, job_description, about_company, user_information_all)
+
+
+@register("gemini")
+class GeminiProvider(AIProvider):
+    def connect(self) -> bool:
+        from modules.ai.geminiConnections import gemini_create_client
+        self.client = gemini_create_client()
+        return self.client is not None
+
+    def complete(self, prompt: str, response_format: dict | None = None) -> str | dict:
+        from modules.ai.geminiConnections import gemini_completion
+        return gemini_completion(self.client, prompt, is_json=response_format is not None)
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        from modules.ai.resilience import estimate_tokens, get_guard
+        for chunk in get_guard(self.name).stream(self.client.generate_content, prompt, tokens=estimate_tokens(prompt), stream=True):
+            if chunk.parts: yield chunk.text
+
+    def extract_skills(self, job_description: str) -> dict | str:
+        from modules.ai.geminiConnections import gemini_extract_skills
+        return gemini_extract_skills(self.client, job_description)
+
+    def answer_question(self, question: str, options: list[str] | None = None, question_type: QuestionType = 'text',
+                        job_description: str | None = None, about_company: str | None = None, user_information_all: str | None = None) -> str | dict:
+        from modules.ai.geminiConnections import gemini_answer_question
+        return gemini_answer_question(self.client, question, options, question_type, job_description, about_company, user_information_all)
+
+
+@register("ollama")
+class OllamaProvider(AIProvider):
+    timeout = 120
+
+    @property
+    def model(self) -> str:
+        from modules.ai.ollama_integration import MODEL_NAME
+        return MODEL_NAME
+
+    def connect(self) -> bool:
+        from modules.ai import ollama_integration
+        self.client = ollama_integration.get_client()
+        # Load the model in the background while jobs are searched, so the first answer doesn't wait for it
+        threading.Thread(target=ollama_integration.preload, daemon=True).start()
+        return True
+
+    def close(self) -> None:
+        if self.client: self.client.close()
+        self.client = None
+
+    def complete(self, prompt: str, response_format: dict | None = None) -> str | dict:
+        text = "".join(self.stream(prompt))
+        if text.startswith("[Ollama Error]"): return {"error": text}
+        return _parse_json(text) if response_format else text.strip()
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        from modules.ai.ollama_integration import stream_generate
+        try:
+            from modules.dashboard import log_handler as _lh
+        except Exception:
+            _lh = None
+        line = ""
+        for piece in stream_generate(prompt, self.timeout):
+            line += piece
+            if _lh and "\n" in line:
+                *done, line = line.split("\n")
+                for text in done:
+                    if text.strip():
+                        try: _lh.publish('[AI] ' + text.strip())
+                        except Exception: pass
+            yield piece
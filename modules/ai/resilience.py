@@ -0,0 +1,293 @@
+"""Rate limiting, retries and circuit breaking of AI calls.
+
+Every provider gets a `ProviderGuard` (`get_guard(name)`) made of:
+
+* a `RateLimiter`: token buckets for requests and tokens per minute
+  (`ai_rate_limits` in `config/settings.py`), also paused when the API
+  answers with a Retry-After header,
+* retries with jittered exponential backoff for rate limits (429),
+  timeouts, connection errors and server errors,
+* a `CircuitBreaker` that stops calling a provider after
+  `ai_circuit_failures` failed calls in a row and lets one call through
+  again after `ai_circuit_cooldown` secs. While it's open, calls fail fast
+  with `CircuitOpenError` and the bot uses the answers from your config.
+
+Throttled, retried, failed and short-circuited calls are counted in
+`modules.dashboard.metrics` (`ai_throttled`, `ai_retries`, `ai_failures`,
+`ai_short_circuited`, `ai_throttle_wait`).
+"""
+import random
+import threading
+import time
+from typing import Callable, Iterator
+
+from config.settings import ai_rate_limits, ai_max_retries, ai_retry_base_delay, ai_retry_max_delay, ai_circuit_failures, ai_circuit_cooldown
+
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class TokenBucket:
+    '''
+    Allows `rate` units per minute, in bursts of at most `capacity` (defaults to `rate`). A `rate` of 0 means no limit.
+    '''
+    def __init__(self, rate: float, capacity: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate / 60)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        '''
+        Secs to wait until `amount` units are available (0 if they are now).
+        '''
+        if self.rate <= 0: return 0
+        self._refill()
+        amount = min(amount, self.capacity)    # A request bigger than a burst waits for a full bucket
+        return 0 if self.tokens >= amount else (amount - self.tokens) * 60 / self.rate
+
+    def take(self, amount: float) -> None:
+        if self.rate <= 0: return
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    '''
+    Requests per minute (`rpm`) and tokens per minute (`tpm`) limits of a provider, 0 for no limit.
+    '''
+    def __init__(self, rpm: float = 0, tpm: float = 0, clock: Callable[[], float] = time.monotonic):
+        self.requests = TokenBucket(rpm, clock=clock)
+        self.tokens = TokenBucket(tpm, clock=clock)
+        self.clock = clock
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 0) -> float:
+        '''
+        Reserves one request of `tokens` tokens and returns how many secs to wait before sending it.
+        '''
+        with self._lock:
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens), self.paused_until - self.clock())
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            return max(wait, 0)
+
+    def pause(self, seconds: float) -> None:
+        '''
+        Holds all requests for `seconds` (Eg: from a Retry-After header).
+        '''
+        with self._lock:
+            self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+
+class CircuitBreaker:
+    '''
+    Opens after `failure_threshold` failures in a row, then lets one trial call through after `reset_timeout` secs.
+    '''
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 300, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None: return "closed"
+        return "half_open" if self.clock() - self.opened_at >= self.reset_timeout else "open"
+
+    def allow(self) -> bool:
+        '''
+        Returns whether a call can be made now. In half open state only one trial call is allowed at a time.
+        '''
+        with self._lock:
+            state = self.state
+            if state == "closed": return True
+            if state == "open" or self._trial_running: return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self._trial_running = False
+
+
+def status_code(error: Exception) -> int | None:
+    '''
+    HTTP status code of an API error (OpenAI, httpx and Google API errors), `None` if it has none.
+    '''
+    for attribute in ("status_code", "code", "status"):
+        value = getattr(error, attribute, None)
+        if isinstance(value, int) and 100 <= value < 600: return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after(error: Exception) -> float | None:
+    '''
+    Secs the API asked to wait in the Retry-After (or retry-after-ms) header of the error's response, `None` if it didn't.
+    '''
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers: return None
+    try:
+        if headers.get("retry-after-ms"): return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"): return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass   # An HTTP date, rare for APIs. Use the backoff instead
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    '''
+    Whether the call that raised `error` may work if tried again (rate limits, timeouts, connection and server errors).
+    '''
+    if isinstance(error, CircuitOpenError): return False
+    code = status_code(error)
+    if code is not None: return code in RETRYABLE_STATUS
+    name = type(error).__name__
+    return isinstance(error, (TimeoutError, ConnectionError)) or "Timeout" in name or "Connection" in name or name in ("ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded")
+
+
+def backoff_delay(attempt: int, base: float = ai_retry_base_delay, cap: float = ai_retry_max_delay, rng: random.Random = random) -> float:
+    '''
+    Secs to wait before retry number `attempt` (0 for the first): random between 0 and `base * 2 ** attempt`, at most `cap` ("full jitter").
+    '''
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def estimate_tokens(*texts, reply: int = 500) -> int:
+    '''
+    Rough number of tokens of a request with `texts` (4 characters per token) and a `reply` of that many tokens.
+    '''
+    return sum(len(str(text)) for text in texts) // 4 + reply
+
+
+class ProviderGuard:
+    '''
+    Makes the calls of one provider with its `RateLimiter`, retries and `CircuitBreaker`.
+    '''
+    def __init__(self, name: str, limiter: RateLimiter, breaker: CircuitBreaker, max_retries: int = ai_max_retries,
+                 sleep: Callable[[float], None] = time.sleep, rng: random.Random = random):
+        self.name = name
+        self.limiter = limiter
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.sleep = sleep
+        self.rng = rng
+
+    @property
+    def healthy(self) -> bool:
+        '''
+        `False` while the circuit breaker is open and calls would fail right away.
+        '''
+        return self.breaker.state != "open"
+
+    def call(self, function: Callable, *args, tokens: int = 0, **kwargs):
+        '''
+        Returns `function(*args, **kwargs)`, waiting for the rate limits first and retrying it when it fails with a retryable error.
+        * `tokens`: estimated tokens of the request and its answer, for the tokens per minute limit
+        * Raises `CircuitOpenError` without calling it if the provider is failing, or the last error if all attempts failed
+        '''
+        from modules.dashboard import metrics as _m
+        if not self.breaker.allow():
+            _m.inc("ai_short_circuited")
+            raise CircuitOpenError(f"{self.name} AI is failing, not calling it for now (retrying after {self.breaker.reset_timeout} secs)")
+        for attempt in range(self.max_retries + 1):
+            wait = self.limiter.reserve(tokens)
+            if wait > 0:
+                _m.inc("ai_throttled")
+                _m.append_sample("ai_throttle_wait", wait)
+                self.sleep(wait)
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:
+                if attempt >= self.max_retries or not is_retryable(error):
+                    self._failed(error)
+                    raise
+                delay = retry_after(error)
+                if delay is not None: self.limiter.pause(delay)
+                else: self.sleep(backoff_delay(attempt, rng=self.rng))
+                _m.inc("ai_retries")
+                continue
+            self.breaker.record_success()
+            return result
+
+    def stream(self, function: Callable, *args, tokens: int = 0, **kwargs) -> Iterator:
+        '''
+        Like `call()` for streaming calls, yields the pieces of the stream `function(*args, **kwargs)` returns.
+        * An error while reading the stream counts as a failed call. It isn't retried, as pieces of the answer were already used
+        '''
+        pieces = self.call(function, *args, tokens=tokens, **kwargs)
+        try:
+            yield from pieces
+        except Exception as error:
+            self._failed(error)
+            raise
+
+    def _failed(self, error: Exception) -> None:
+        from modules.dashboard import metrics as _m
+        _m.inc("ai_failures")
+        # Bad requests say nothing about the provider's health, but auth or wrong URL and model errors won't go away
+        if is_retryable(error) or status_code(error) in (None, 401, 403, 404): self.breaker.record_failure()
+        else: self.breaker.record_success()
+
+
+_guards: dict[str, ProviderGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_guard(provider: str) -> ProviderGuard:
+    '''
+    Returns the `ProviderGuard` of `provider` (Eg: "openai"), created on first use with its limits from `ai_rate_limits`.
+    '''
+    provider = provider.lower()
+    with _guards_lock:
+        if provider not in _guards:
+            limits = ai_rate_limits.get(provider, {})
+            _guards[provider] = ProviderGuard(provider, RateLimiter(limits.get("rpm", 0), limits.get("tpm", 0)),
+                                              CircuitBreaker(ai_circuit_failures, ai_circuit_cooldown))
+        return _guards[provider]
+
+
+_alert_lock = threading.Lock()
+
+
+def alert_in_background(message: str, title: str) -> None:
+    '''
+    Shows an AI error alert without stopping the bot. Only one is shown at a time, others are just logged.
+    * "Pause AI error alerts" turns them off for the rest of the run, like `showAiErrorAlerts = False`
+    '''
+    from config import settings
+    if not settings.showAiErrorAlerts or not _alert_lock.acquire(blocking=False): return
+    def show() -> None:
+        try:
+            from pyautogui import confirm
+            if "Pause AI error alerts" == confirm(message, title, ["Pause AI error alerts", "Okay Continue"]):
+                settings.showAiErrorAlerts = False
+        except Exception:
+            pass
+        finally:
+            _alert_lock.release()
+    threading.Thread(target=show, daemon=True).start()
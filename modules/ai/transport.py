@@ -0,0 +1,49 @@
+"""Shared HTTP connection pool of the AI providers.
+
+Every OpenAI compatible client (OpenAI, DeepSeek and local servers like LM
+Studio) is created with the same `httpx.Client`, so calls reuse warm
+keep-alive connections instead of each client opening its own. HTTP/2 is
+used when the `h2` package is installed. Timeouts and pool size come from
+`config/settings.py` (`ai_connect_timeout`, `ai_read_timeout`,
+`ai_max_connections`, `ai_http2`).
+"""
+import threading
+
+from config.settings import ai_connect_timeout, ai_read_timeout, ai_max_connections, ai_http2
+
+_client = None
+_lock = threading.Lock()
+
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_http_client():
+    '''
+    Returns the shared `httpx.Client`, created on first use.
+    '''
+    global _client
+    with _lock:
+        if _client is None:
+            import httpx
+            _client = httpx.Client(
+                http2=ai_http2 and http2_available(),
+                timeout=httpx.Timeout(ai_read_timeout, connect=ai_connect_timeout),
+                limits=httpx.Limits(max_connections=ai_max_connections, max_keepalive_connections=ai_max_connections, keepalive_expiry=120),
+            )
+        return _client
+
+
+def close_http_client() -> None:
+    '''
+    Closes the shared `httpx.Client` and its connections. A new one is created on next use.
+    '''
+    global _client
+    with _lock:
+        client, _client = _client, None
+    if client is not None: client.close()
@@ -12,8 +12,13 @@ GitHub:     https://github.com/GodsScion/Auto_job_applier_linkedIn
 version:    24.12.29.12.30
 ''' 
 
-from config.settings import click_gap, smooth_scroll
+import os
+from random import uniform
+from time import perf_counter
+
+from config.settings import click_gap, smooth_scroll, event_driven_waits, page_quiet_time, max_page_settle_time, min_human_pause, max_human_pause, element_wait_timeout, page_load_timeout
 from modules.helpers import buffer, print_lg, sleep
+from modules.dashboard import metrics
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -38,7 +43,7 @@ def wait_span_click(driver: WebDriver, text: str, time: float=5.0, click: bool=T
             if scroll:  scroll_to_view(driver, button, scrollTop)
             if click:
                 button.click()
-                buffer(click_gap)
+                settle(driver, "span_click")
             return button
         except Exception as e:
             print_lg("Click Failed! Didn't find '"+text+"'")
@@ -101,6 +106,101 @@ def find_by_class(driver: WebDriver, class_name: str, time: float=5.0) -> WebEle
     '''
     return WebDriverWait(driver, time).until(EC.presence_of_element_located((By.CLASS_NAME, class_name)))
 
+# JavaScript functions
+__javascript_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "javascript")
+__javascript_cache: dict[str, str] = {}
+
+def run_javascript(driver: WebDriver, file_name: str, *args, asynchronous: bool = False):
+    '''
+    Runs the script in `/modules/javascript/<file_name>` with `args` in a single WebDriver call and returns its result.
+    - Scripts are read from disk once and cached.
+    - `asynchronous` runs it with `execute_async_script`, the script must call its last argument with the result.
+    '''
+    script = __javascript_cache.get(file_name)
+    if script is None:
+        with open(os.path.join(__javascript_folder, file_name), 'r', encoding="utf-8") as file:
+            script = __javascript_cache[file_name] = file.read()
+    if asynchronous:
+        return driver.execute_async_script(script, *args)
+    return driver.execute_script(script, *args)
+
+# Wait functions
+def wait_until_quiet(driver: WebDriver | WebElement, quiet: float = page_quiet_time, timeout: float = max_page_settle_time) -> bool:
+    '''
+    Waits until the page has no new elements and no new network requests for `quiet` secs, for a max of `timeout` secs.
+    - `driver` can also be a `WebElement` (Eg: the Easy Apply modal), then its page is waited for.
+    - Returns `True` if the page became quiet, `False` if it gave up or couldn't check.
+    '''
+    if isinstance(driver, WebElement): driver = driver.parent
+    try:
+        result = run_javascript(driver, "wait_until_quiet.js", int(quiet * 1000), int(timeout * 1000), asynchronous=True)
+        return bool(result and result.get("quiet"))
+    except Exception as e:
+        print_lg("Failed to wait for the page to be quiet!", e)
+        return False
+
+def human_pause() -> None:
+    '''
+    Sleeps a random time between `min_human_pause` and `max_human_pause` secs.
+    '''
+    if max_human_pause > 0: sleep(uniform(min_human_pause, max_human_pause))
+
+def settle(driver: WebDriver | WebElement, site: str, speed: int = click_gap, fixed: bool = False) -> None:
+    '''
+    Waits after an action (click, typing...) until the page is ready for the next one.
+    - If `event_driven_waits`, waits until the page is quiet and then a short human-like pause, else `buffer(speed)`.
+    - `fixed` sleeps exactly `speed` secs instead of `buffer(speed)` when `event_driven_waits` is off (Eg: for a typeahead that needs time to show up).
+    - Time spent is recorded in the `wait_<site>` histogram of the dashboard metrics.
+    '''
+    start = perf_counter()
+    if event_driven_waits:
+        wait_until_quiet(driver)
+        human_pause()
+    elif fixed:
+        sleep(speed)
+    else:
+        buffer(speed)
+    metrics.observe(f"wait_{site}", perf_counter() - start)
+
+def wait_for(driver: WebDriver | WebElement, site: str, condition, time: float = 5.0):
+    '''
+    Waits for a max of `time` secs until `condition` (Eg: `EC.staleness_of(element)`) is met, checking every 0.1 secs, and returns its result.
+    - Raises `TimeoutException` if it isn't met in time.
+    - Time spent is recorded in the `wait_<site>` histogram of the dashboard metrics.
+    '''
+    start = perf_counter()
+    try:
+        return WebDriverWait(driver, time, poll_frequency=0.1).until(condition)
+    finally:
+        metrics.observe(f"wait_{site}", perf_counter() - start)
+
+# Navigation functions
+def navigate(driver: WebDriver, url: str, site: str, ready: tuple[str, str] | None = None, strategy: str = "", time: float = element_wait_timeout) -> WebElement | None:
+    '''
+    Opens `url` and waits until the page can be used, returning the element found with the locator `ready` (Eg: `(By.ID, "global-nav")`) if given.
+    - `strategy`: "normal" waits until the page and all its resources have loaded, "eager" until its HTML is parsed, "none" doesn't wait for the page, only for `ready`. Empty to use the browser's page load strategy.
+    - Waits a max of `page_load_timeout` secs for the page to load and `time` secs for `ready`, raises `TimeoutException` if either doesn't happen in time.
+    - Time taken until the page can be used is recorded in the `ttfue_<site>` histogram of the dashboard metrics.
+    '''
+    start = perf_counter()
+    browser_strategy = driver.caps.get("pageLoadStrategy", "normal")
+    strategy = strategy or browser_strategy
+    try:
+        if strategy == browser_strategy and strategy != "none":
+            driver.get(url)
+        else:
+            # The page load strategy is fixed when the browser starts, so for a different one navigate with JavaScript and wait for it here
+            old_page = driver.find_element(By.TAG_NAME, "html")
+            driver.execute_script("window.location.assign(arguments[0]);", url)
+            waiter = WebDriverWait(driver, page_load_timeout, poll_frequency=0.05)
+            waiter.until(EC.staleness_of(old_page))
+            if strategy != "none":
+                ready_states = ["complete"] if strategy == "normal" else ["interactive", "complete"]
+                waiter.until(lambda d: d.execute_script("return document.readyState;") in ready_states)
+        if ready: return WebDriverWait(driver, time, poll_frequency=0.1).until(EC.presence_of_element_located(ready))
+    finally:
+        metrics.observe(f"ttfue_{site}", perf_counter() - start)
+
 # Scroll functions
 def scroll_to_view(driver: WebDriver, element: WebElement, top: bool = False, smooth_scroll: bool = smooth_scroll) -> None:
     '''
@@ -161,7 +261,7 @@ def text_input(actions: ActionChains, textInputEle: WebElement | bool, value: st
         # actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
         textInputEle.clear()
         textInputEle.send_keys(value.strip())
-        sleep(2)
+        settle(textInputEle, "text_input", 2, fixed=True)
         actions.send_keys(Keys.ENTER).perform()
     else:
         print_lg(f'{textFieldName} input was not given!')
\ No newline at end of file
@@ -1,4 +1,5 @@
 '''Modern Tkinter dashboard to control and monitor the bot.'''
+import os
 import threading
 import queue
 import time
@@ -310,8 +311,22 @@ class BotDashboard(ttkb.Window):
         messagebox.showinfo("Pause", "Pause functionality would be implemented here")
     
     def export_logs(self):
-        # Placeholder for export functionality
-        messagebox.showinfo("Export Logs", "Logs export functionality would be implemented here")
+        # Stream current and rotated (gzipped) log files into one file, never loading them in memory
+        from tkinter import filedialog
+        from modules.helpers import get_log_path, flush_logs
+        from modules import log_reader
+        log_path = get_log_path()
+        extension = os.path.splitext(log_path)[1]
+        destination = filedialog.asksaveasfilename(title="Export Logs", defaultextension=extension,
+                                                   initialfile=f"exported_logs{extension}")
+        if not destination:
+            return
+        try:
+            flush_logs()
+            size = log_reader.export_logs(log_path, destination)
+            messagebox.showinfo("Export Logs", f"Exported {size / (1024 * 1024):.1f} MB of logs to\n{destination}")
+        except Exception as e:
+            messagebox.showerror("Export Failed", str(e))
         
     def manual_refresh(self):
         # Force a refresh of metrics
@@ -417,11 +432,12 @@ class BotDashboard(ttkb.Window):
                 
         # Bar chart for different metrics
         try:
-            metric_names = ['easy_applied', 'external_jobs', 'jd_analysis_count']
+            metric_names = ['easy_applied', 'external_jobs', 'jd_analysis_count',
+                            'ai_deadline_misses_question', 'ai_deadline_misses_page_questions', 'ai_deadline_misses_skills']
             metric_values = [data.get(name, 0) for name in metric_names]
-            labels = ['Easy Applied', 'External Links', 'JD Analyses']
+            labels = ['Easy Applied', 'External Links', 'JD Analyses', 'Late AI\nAnswers', 'Late AI\nPages', 'Late AI\nSkills']
             self.ax_bar.clear()
-            bars = self.ax_bar.bar(labels, metric_values, color=['#FF9800', '#9C27B0', '#00BCD4'])
+            bars = self.ax_bar.bar(labels, metric_values, color=['#FF9800', '#9C27B0', '#00BCD4', '#F44336', '#E91E63', '#795548'])
             self.ax_bar.set_title('Application Metrics', color='white')
             self.ax_bar.grid(True, alpha=0.3)
             # Add value labels on bars
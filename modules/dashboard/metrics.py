@@ -6,6 +6,9 @@ _lock = threading.Lock()
 _metrics: Dict[str, float] = defaultdict(float)
 _counters: Dict[str, int] = defaultdict(int)
 _time_series: Dict[str, deque] = defaultdict(lambda: deque(maxlen=200))  # keep last 200 samples
+_histograms: Dict[str, Dict[float, int]] = {}
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, float('inf'))  # seconds
 
 
 def inc(name: str, n: int = 1) -> None:
@@ -24,6 +27,43 @@ def append_sample(name: str, value: float) -> None:
         _time_series[name].append(float(value))
 
 
+def record_hit(name: str, hit: bool) -> None:
+    """Count a lookup hit or miss of `name` (Eg: a cache) and update `<name>_hit_rate` (0.0 - 1.0)."""
+    with _lock:
+        _counters[f"{name}_hits" if hit else f"{name}_misses"] += 1
+        hits = _counters[f"{name}_hits"]
+        _metrics[f"{name}_hit_rate"] = hits / (hits + _counters[f"{name}_misses"])
+
+
+def get_hit_rate(name: str) -> float:
+    """Hit rate of lookups recorded with `record_hit` (0.0 if none yet)."""
+    with _lock:
+        return _metrics.get(f"{name}_hit_rate", 0.0)
+
+
+def observe(name: str, value: float, buckets: tuple = DEFAULT_BUCKETS) -> None:
+    """Count `value` in the first bucket of histogram `name` whose upper bound it doesn't exceed, and append it to the time series."""
+    with _lock:
+        histogram = _histograms.setdefault(name, {bound: 0 for bound in buckets})
+        for bound in histogram:
+            if value <= bound:
+                histogram[bound] += 1
+                break
+        _time_series[name].append(float(value))
+
+
+def get_histogram(name: str) -> Dict[float, int]:
+    """Bucket upper bound -> number of values recorded with `observe` (empty if none)."""
+    with _lock:
+        return dict(_histograms.get(name, {}))
+
+
+def get_histograms(prefix: str = "") -> Dict[str, Dict[float, int]]:
+    """All histograms whose name starts with `prefix`."""
+    with _lock:
+        return {name: dict(histogram) for name, histogram in _histograms.items() if name.startswith(prefix)}
+
+
 def get_time_series(name: str) -> List[float]:
     with _lock:
         return list(_time_series.get(name, []))
@@ -88,3 +128,4 @@ def reset_all() -> None:
         _metrics.clear()
         _counters.clear()
         _time_series.clear()
+        _histograms.clear()
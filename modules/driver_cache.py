@@ -0,0 +1,182 @@
+"""Local cache of the patched chromedriver used in stealth mode.
+
+undetected-chromedriver downloads and patches a chromedriver every time it
+starts, which takes tens of seconds and fails without network. Here the
+patched binary is kept in a folder per Chrome major version
+(`chromedriver_cache_path` in `config/settings.py`) with a manifest holding
+its SHA-256 hash. A copy that no longer matches its hash is deleted and
+downloaded again. Once a version is cached, the bot starts without network.
+
+`StartupTimer` measures the steps of opening Chrome for the breakdown printed
+at launch.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+
+MANIFEST_NAME = "manifest.json"
+
+
+def driver_file_name() -> str:
+    return "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+
+def parse_major_version(text: str) -> int | None:
+    '''
+    Returns the major version in a version text (Eg: "Google Chrome 126.0.6478.126" -> 126), `None` if there is none.
+    '''
+    match = re.search(r"(\d+)\.\d+\.\d+(?:\.\d+)?", text or "")
+    return int(match.group(1)) if match else None
+
+
+def _version_commands() -> list[list[str]]:
+    if sys.platform.startswith("win"):
+        return [["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+                ["reg", "query", r"HKEY_LOCAL_MACHINE\Software\Google\Chrome\BLBeacon", "/v", "version"]]
+    if sys.platform == "darwin":
+        return [["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"]]
+    return [["google-chrome", "--version"], ["google-chrome-stable", "--version"], ["chromium", "--version"], ["chromium-browser", "--version"]]
+
+
+def detect_chrome_major_version() -> int | None:
+    '''
+    Returns the major version of the installed Google Chrome, `None` if it couldn't be found.
+    '''
+    for command in _version_commands():
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        major = parse_major_version(output)
+        if major: return major
+    return None
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _version_folder(cache_path: str, major: int) -> str:
+    return os.path.join(cache_path, str(major))
+
+
+def get_cached_driver(cache_path: str, major: int) -> str | None:
+    '''
+    Returns the path of the cached chromedriver for Chrome `major` version if it is there and intact, else `None`.
+    * A cached driver not matching the hash in its manifest is deleted.
+    '''
+    folder = _version_folder(cache_path, major)
+    executable = os.path.join(folder, driver_file_name())
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), encoding="utf-8") as file:
+            manifest = json.load(file)
+        if manifest.get("sha256") == file_sha256(executable) and manifest.get("major") == major:
+            return executable
+    except (OSError, ValueError):
+        pass
+    if os.path.exists(folder): shutil.rmtree(folder, ignore_errors=True)
+    return None
+
+
+def latest_cached_driver(cache_path: str) -> tuple[int, str] | None:
+    '''
+    Returns (Chrome major version, path) of the newest intact cached chromedriver, `None` if nothing is cached.
+    '''
+    try:
+        versions = sorted((int(name) for name in os.listdir(cache_path) if name.isdigit()), reverse=True)
+    except OSError:
+        return None
+    for major in versions:
+        executable = get_cached_driver(cache_path, major)
+        if executable: return major, executable
+    return None
+
+
+def store_driver(cache_path: str, major: int, executable: str) -> str:
+    '''
+    Copies the patched chromedriver `executable` into the cache for Chrome `major` version with its manifest.
+    * Returns the path of the cached copy
+    '''
+    folder = _version_folder(cache_path, major)
+    os.makedirs(folder, exist_ok=True)
+    cached = os.path.join(folder, driver_file_name())
+    temp = cached + ".part"
+    shutil.copyfile(executable, temp)
+    os.chmod(temp, os.stat(temp).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    os.replace(temp, cached)
+    manifest = {"major": major, "sha256": file_sha256(cached), "patched": True, "cached_at": time.time()}
+    with open(os.path.join(folder, MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return cached
+
+
+def download_patched_driver(major: int | None) -> tuple[int | None, str]:
+    '''
+    Downloads and patches chromedriver for Chrome `major` version (latest if `None`) with undetected-chromedriver.
+    * Returns (major version downloaded, path of the patched binary). The binary is deleted by undetected-chromedriver later, copy it with `store_driver()`
+    '''
+    import undetected_chromedriver as uc
+    patcher = uc.Patcher(version_main=major or 0)
+    patcher.auto()
+    return major or parse_major_version(str(getattr(patcher, "version_full", ""))), patcher.executable_path
+
+
+def prepare_driver(cache_path: str, timer: "StartupTimer") -> tuple[int | None, str | None]:
+    '''
+    Finds the patched chromedriver to start stealth mode with, downloading and caching it only if the installed Chrome version isn't cached yet.
+    * Returns (Chrome major version, chromedriver path), `None`s to let undetected-chromedriver download one itself
+    * Without network, falls back to the newest cached driver
+    '''
+    from modules.helpers import print_lg
+    with timer.step("detect Chrome version"):
+        major = detect_chrome_major_version()
+    if major:
+        with timer.step("check driver cache"):
+            cached = get_cached_driver(cache_path, major)
+        if cached:
+            print_lg(f"Using cached Chrome Driver for Chrome {major}.")
+            return major, cached
+    try:
+        print_lg(f"Downloading Chrome Driver for Chrome {major or 'latest'}... Only needed once per Chrome version.")
+        with timer.step("download driver"):
+            major, executable = download_patched_driver(major)
+        if not major: return None, None
+        with timer.step("cache driver"):
+            return major, store_driver(cache_path, major, executable)
+    except Exception as e:
+        latest = latest_cached_driver(cache_path)
+        if not latest: raise
+        print_lg(f"Couldn't download Chrome Driver, trying the cached one for Chrome {latest[0]}!", e)
+        return latest
+
+
+class StartupTimer:
+    '''
+    Times the steps of starting the browser. Use `with timer.step("name"):` around each step.
+    '''
+    def __init__(self):
+        self.steps: list[tuple[str, float]] = []
+
+    @contextmanager
+    def step(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((name, time.perf_counter() - start))
+
+    def summary(self) -> str:
+        total = sum(seconds for _, seconds in self.steps)
+        lines = [f"  {name:<24}{seconds:>7.2f}s" for name, seconds in self.steps]
+        return "Browser startup took {:.2f}s:\n{}".format(total, "\n".join(lines))
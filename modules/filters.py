@@ -0,0 +1,112 @@
+"""Multi keyword matcher for the job and company filters in `config/search.py`.
+
+`KeywordMatcher` compiles a list of keywords once into a single regular
+expression shaped like a trie (keywords sharing a prefix share the pattern),
+so a text is scanned in one pass by the regex engine instead of once per
+keyword, however many keywords there are. Matching is case-insensitive and,
+optionally, limited to whole words ("PHP" won't match "PHPUnit").
+
+For short keyword lists, searching once per keyword with `in` is still faster
+in CPython, so below `scan_threshold` keywords the matcher does that instead.
+Both ways give the same results.
+
+Run `python -m benchmarks.bench_filters` to compare it with searching once per keyword.
+"""
+import re
+from typing import Iterable, Iterator
+
+_END = ""   # Trie key marking the end of a keyword
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char != _END]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    return f"(?:{pattern})?" if _END in node else pattern
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False, scan_threshold: int = 1000):
+        self.keywords = [keyword for keyword in keywords if keyword and keyword.strip()]
+        self.whole_words = whole_words
+        self._lowered = [keyword.lower() for keyword in self.keywords]
+        self._single_pass = len(self.keywords) >= scan_threshold
+        self._trie: dict = {}
+        for index, keyword in enumerate(self.keywords):
+            node = self._trie
+            for char in keyword.lower():
+                node = node.setdefault(char, {})
+            node.setdefault(_END, []).append(index)
+        pattern = _trie_pattern(self._trie)
+        if pattern and whole_words:
+            pattern = r"(?<!\w)" + pattern + r"(?!\w)"
+        self._pattern = re.compile(pattern) if pattern else None
+
+    def _is_whole_word(self, text: str, start: int, end: int) -> bool:
+        return (start == 0 or not _is_word_char(text[start - 1])) and (end == len(text) or not _is_word_char(text[end]))
+
+    def _starting_at(self, text: str, start: int) -> Iterator[tuple[int, int]]:
+        # Walk the trie from `start` to find every keyword beginning there (Eg: both "java" and "javascript")
+        node = self._trie
+        position = start
+        while True:
+            if _END in node and (not self.whole_words or self._is_whole_word(text, start, position)):
+                for index in node[_END]:
+                    yield index, position
+            if position == len(text) or text[position] not in node:
+                return
+            node = node[text[position]]
+            position += 1
+
+    def _find_each(self, lowered: str) -> Iterator[int]:
+        # Search once per keyword, in the order they were given
+        for index, keyword in enumerate(self._lowered):
+            start = lowered.find(keyword)
+            while start != -1:
+                if not self.whole_words or self._is_whole_word(lowered, start, start + len(keyword)):
+                    yield index
+                    break
+                start = lowered.find(keyword, start + 1)
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """Yield (keyword index, start, end) of every match in `text`, in order of their start position."""
+        if self._pattern is None:
+            return
+        lowered = text.lower()
+        position = 0
+        while True:
+            match = self._pattern.search(lowered, position)
+            if match is None:
+                return
+            for index, end in self._starting_at(lowered, match.start()):
+                yield index, match.start(), end
+            position = match.start() + 1
+
+    def find_all(self, text: str) -> list[str]:
+        """All keywords found in `text`, each once, in the order they were given."""
+        if not self._single_pass:
+            return [self.keywords[index] for index in self._find_each(text.lower())]
+        found = {index for index, _, _ in self.iter_matches(text)}
+        return [self.keywords[index] for index in sorted(found)]
+
+    def first(self, text: str) -> str | None:
+        """The first keyword (in the order they were given) found in `text`, or `None`."""
+        if not self._single_pass:
+            index = next(self._find_each(text.lower()), None)
+            return None if index is None else self.keywords[index]
+        found = self.find_all(text)
+        return found[0] if found else None
+
+    def matches_any(self, text: str) -> bool:
+        """`True` if any keyword is found in `text`."""
+        if not self._single_pass:
+            return next(self._find_each(text.lower()), None) is not None
+        return self._pattern is not None and self._pattern.search(text.lower()) is not None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
@@ -26,7 +26,8 @@ from datetime import datetime, timedelta
 from pyautogui import alert
 from pprint import pprint
 
-from config.settings import logs_folder_path
+from config.settings import logs_folder_path, log_flush_batch_size, log_flush_interval, log_max_size_mb, log_rotate_daily, log_backup_count, structured_logs
+from modules.log_writer import BufferedLogWriter
 
 
 
@@ -106,36 +107,65 @@ def critical_error_log(possible_reason: str, stack_trace: Exception) -> None:
 def get_log_path():
     '''
     Function to replace '//' with '/' for logs path
+    * Returns path of `log.jsonl` instead of `log.txt` if `structured_logs` is enabled
     '''
+    log_file = "log.jsonl" if structured_logs else "log.txt"
     try:
-        path = logs_folder_path+"/log.txt"
+        path = logs_folder_path+"/"+log_file
         return path.replace("//","/")
     except Exception as e:
-        critical_error_log("Failed getting log path! So assigning default logs path: './logs/log.txt'", e)
-        return "logs/log.txt"
+        critical_error_log(f"Failed getting log path! So assigning default logs path: './logs/{log_file}'", e)
+        return "logs/"+log_file
 
 
 __logs_file_path = get_log_path()
+__log_writer = BufferedLogWriter(__logs_file_path, log_flush_batch_size, log_flush_interval, 
+                                 max_bytes=log_max_size_mb*1024*1024, backup_count=log_backup_count, rotate_daily=log_rotate_daily)
+__log_context: dict[str, str | None] = {"job_id": None, "stage": None}
+
+try:
+    from modules.dashboard import log_handler as __dashboard_log_handler
+except Exception:
+    __dashboard_log_handler = None
+
+
+def flush_logs() -> None:
+    '''
+    Function to write all buffered log messages to log.txt right away
+    '''
+    __log_writer.flush()
+
+
+def set_log_context(job_id: str | None = None, stage: str | None = None) -> None:
+    '''
+    Function to set the `job_id` and `stage` saved with every following message in structured logs
+    '''
+    __log_context["job_id"] = job_id
+    __log_context["stage"] = stage
 
 
 def print_lg(*msgs: str | dict, end: str = "\n", pretty: bool = False, flush: bool = False, from_critical: bool = False) -> None:
     '''
     Function to log and print. **Note that, `end` and `flush` parameters are ignored if `pretty = True`**
+    * Messages are written to log.txt in batches by a background thread, critical errors are written immediately
+    * If `structured_logs` is enabled, each message is saved as a JSON line with timestamp, level, job_id and stage
     '''
     try:
         for message in msgs:
             pprint(message) if pretty else print(message, end=end, flush=flush)
-            with open(__logs_file_path, 'a+', encoding="utf-8") as file:
-                file.write(str(message) + end)
+            if structured_logs:
+                __log_writer.write(json.dumps({"timestamp": datetime.now().isoformat(timespec="milliseconds"), "level": "CRITICAL" if from_critical else "INFO", 
+                                               **__log_context, "message": str(message)}, ensure_ascii=False) + "\n")
+            else:
+                __log_writer.write(str(message) + end)
             # Publish to dashboard if available (non-blocking)
-            try:
-                from modules.dashboard import log_handler
+            if __dashboard_log_handler:
                 try:
-                    log_handler.publish(str(message))
+                    __dashboard_log_handler.publish(str(message))
                 except Exception:
                     pass
-            except Exception:
-                pass
+        if from_critical:
+            __log_writer.flush()
     except Exception as e:
         trail = f'Skipped saving this message: "{message}" to log.txt!' if from_critical else "We'll try one more time to log..."
         alert(f"log.txt in {logs_folder_path} is open or is occupied by another program! Please close it! {trail}", "Failed Logging")
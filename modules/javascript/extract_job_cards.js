@@ -0,0 +1,38 @@
+// Extracts details of job cards on the jobs search results page in a single `execute_script` call.
+// Used by `get_job_cards()` in runAiBot.py via `run_javascript()`.
+// * `arguments[0]` (optional): a single `li[data-occludable-job-id]` element to extract, else all cards on the page.
+// * Returns a list of {job_id, title, company, work_location, work_style, applied, rendered}.
+//   `rendered` is false for cards LinkedIn hasn't rendered yet (occluded, off screen), scroll them into view and extract again.
+const cards = arguments[0] ? [arguments[0]] : Array.from(document.querySelectorAll('li[data-occludable-job-id]'));
+
+return cards.map((card) => {
+    const anchor = card.querySelector('a');
+    const subtitle = card.querySelector('.artdeco-entity-lockup__subtitle');
+    const footerState = card.querySelector('.job-card-container__footer-job-state');
+
+    const titleText = anchor ? anchor.innerText.trim() : '';
+    const title = titleText.includes('\n') ? titleText.slice(0, titleText.indexOf('\n')) : titleText;
+
+    // Subtitle looks like "Company · City, State, Country (Remote)"
+    const details = subtitle ? subtitle.innerText.trim() : '';
+    const separator = details.indexOf(' · ');
+    const company = separator >= 0 ? details.slice(0, separator) : details;
+    let workLocation = separator >= 0 ? details.slice(separator + 3) : '';
+    let workStyle = '';
+    const open = workLocation.lastIndexOf('(');
+    if (open >= 0) {
+        const close = workLocation.lastIndexOf(')');
+        workStyle = workLocation.slice(open + 1, close > open ? close : undefined);
+        workLocation = workLocation.slice(0, open).trim();
+    }
+
+    return {
+        job_id: card.getAttribute('data-occludable-job-id'),
+        title: title,
+        company: company,
+        work_location: workLocation,
+        work_style: workStyle,
+        applied: footerState ? footerState.innerText.trim() === 'Applied' : false,
+        rendered: Boolean(anchor && subtitle),
+    };
+});
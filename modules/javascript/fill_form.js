@@ -0,0 +1,56 @@
+// Fills answers into the current Easy Apply modal page in a single `execute_script` call.
+// Used by `fill_form()` in runAiBot.py via `run_javascript()`, after `snapshot_form.js` tagged the questions.
+// * `arguments[0]`: the Easy Apply modal element (or nothing, to use the whole document).
+// * `arguments[1]`: list of {index, type, option, value}
+//   - "select" and "radio" pick the option at position `option`
+//   - "text" and "textarea" set `value`
+//   - "checkbox" ticks the checkbox
+// * Returns a list of {index, ok, value} with the value each field holds afterwards.
+const modal = arguments[0] || document;
+
+const setValue = (element, value) => {
+    // Use the native setter so that framework bound listeners see the change
+    const prototype = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+    element.dispatchEvent(new Event('input', { bubbles: true }));
+    element.dispatchEvent(new Event('change', { bubbles: true }));
+    element.dispatchEvent(new Event('blur', { bubbles: true }));
+};
+
+const clickWithLabel = (question, input) => {
+    const label = input.id ? question.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+    (label || input).click();
+};
+
+return arguments[1].map((fill) => {
+    const result = { index: fill.index, ok: false, value: null };
+    const question = modal.querySelector(`[data-hunter-question="${fill.index}"]`);
+    if (!question) return result;
+    try {
+        if (fill.type === 'select') {
+            const select = question.querySelector('select');
+            select.selectedIndex = fill.option;
+            select.dispatchEvent(new Event('change', { bubbles: true }));
+            result.value = select.options[select.selectedIndex].text.trim();
+            result.ok = select.selectedIndex === fill.option;
+        } else if (fill.type === 'radio') {
+            const input = question.querySelectorAll('fieldset input')[fill.option];
+            if (!input.checked) clickWithLabel(question, input);
+            result.value = input.value;
+            result.ok = input.checked;
+        } else if (fill.type === 'text' || fill.type === 'textarea') {
+            const element = question.querySelector(fill.type === 'text' ? "input[type='text']" : 'textarea');
+            setValue(element, fill.value);
+            result.value = element.value;
+            result.ok = element.value === fill.value;
+        } else if (fill.type === 'checkbox') {
+            const checkbox = question.querySelector("input[type='checkbox']");
+            if (!checkbox.checked) clickWithLabel(question, checkbox);
+            result.value = checkbox.checked;
+            result.ok = checkbox.checked;
+        }
+    } catch (error) {
+        result.ok = false;
+    }
+    return result;
+});
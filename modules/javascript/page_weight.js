@@ -0,0 +1,26 @@
+// Sums the bytes transferred by the current page since the previous call, in a single `execute_script` call.
+// Used by `record_page_weight()` in lean_browsing.py via `run_javascript()`.
+// * Counts the page itself on the first call after a navigation, then only resources (XHR, images, scripts...) loaded since the previous call.
+// * Returns {bytes, resources, load_ms} where `load_ms` is the time the page took to load, or null if it was already reported or the page is still loading.
+//   Cross-origin resources report 0 bytes unless their server allows it (Timing-Allow-Origin), so `bytes` is a lower bound.
+if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+const state = window.__hunterPageWeight || (window.__hunterPageWeight = { resources: 0, counted: false, timed: false });
+
+let bytes = 0;
+let loadMs = null;
+const navigation = performance.getEntriesByType('navigation')[0];
+if (navigation && !state.counted) {
+    state.counted = true;
+    bytes += navigation.transferSize || 0;
+}
+if (navigation && !state.timed && navigation.loadEventEnd > 0) {
+    state.timed = true;
+    loadMs = navigation.loadEventEnd - navigation.startTime;
+}
+
+const entries = performance.getEntriesByType('resource');
+for (let i = state.resources; i < entries.length; i++) bytes += entries[i].transferSize || 0;
+const resources = Math.max(0, entries.length - state.resources);
+state.resources = entries.length;
+
+return { bytes: bytes, resources: resources, load_ms: loadMs };
@@ -0,0 +1,50 @@
+// Fetches descriptions of many jobs through LinkedIn's own API in a single `execute_async_script` call, without opening them.
+// Used by `prefetch_job_descriptions()` in runAiBot.py via `run_javascript(..., asynchronous=True)`.
+// * `arguments[0]`: list of job IDs
+// * `arguments[1]`: how many requests to run in parallel
+// * `arguments[2]`: max ms to wait, then returns what was fetched so far (keep it below the driver's script timeout)
+// * Returns {job_id: {description}} or {job_id: {error}} for each fetched job ID.
+const jobIds = arguments[0];
+const parallel = Math.max(1, arguments[1] || 4);
+const timeoutMs = arguments[2] || 30000;
+const done = arguments[arguments.length - 1];
+
+// LinkedIn expects the JSESSIONID cookie value as CSRF token
+const session = document.cookie.match(/JSESSIONID="?([^";]+)"?/);
+const csrfToken = session ? session[1] : '';
+const results = {};
+
+const fetchOne = async (jobId) => {
+    try {
+        const response = await fetch(`/voyager/api/jobs/jobPostings/${encodeURIComponent(jobId)}`, {
+            credentials: 'include',
+            headers: { 'csrf-token': csrfToken, 'accept': 'application/json', 'x-restli-protocol-version': '2.0.0' },
+        });
+        if (!response.ok) {
+            results[jobId] = { error: `HTTP ${response.status}` };
+            return;
+        }
+        const data = await response.json();
+        const description = data.description || (data.data && data.data.description);
+        results[jobId] = description && description.text ? { description: description.text } : { error: 'No description' };
+    } catch (error) {
+        results[jobId] = { error: String(error) };
+    }
+};
+
+let finished = false;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    done(results);
+};
+setTimeout(finish, timeoutMs);
+
+(async () => {
+    const queue = jobIds.slice();
+    const workers = Array.from({ length: Math.min(parallel, queue.length) }, async () => {
+        while (queue.length && !finished) await fetchOne(queue.shift());
+    });
+    await Promise.all(workers);
+    finish();
+})();
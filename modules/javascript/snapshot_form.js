@@ -0,0 +1,65 @@
+// Serializes every question of the current Easy Apply modal page in a single `execute_script` call.
+// Used by `get_form_snapshot()` in runAiBot.py via `run_javascript()`.
+// * `arguments[0]`: the Easy Apply modal element (or nothing, to use the whole document).
+// * Each question element is tagged with `data-hunter-question="<index>"`, which `fill_form.js` uses as locator.
+// * Returns a list of {index, type, label, options: [{label, value, id, checked}], value, checked, option_label}
+//   where `type` is one of "select", "radio", "text", "textarea", "checkbox" or "unknown".
+const modal = arguments[0] || document;
+const textOf = (element) => element ? (element.innerText || element.textContent || '').trim() : '';
+const hiddenOr = (element) => {
+    if (!element) return null;
+    return element.querySelector('.visually-hidden') || element;
+};
+
+return Array.from(modal.querySelectorAll('div[data-test-form-element]')).map((question, index) => {
+    question.setAttribute('data-hunter-question', index);
+    const snapshot = { index: index, type: 'unknown', label: '', options: [], value: '', checked: false, option_label: '' };
+
+    const select = question.querySelector('select');
+    if (select) {
+        const label = question.querySelector('label');
+        snapshot.type = 'select';
+        snapshot.label = textOf(label ? label.querySelector('span') : null);
+        snapshot.options = Array.from(select.options).map((option) => ({ label: option.text.trim(), value: option.value, id: '', checked: option.selected }));
+        snapshot.value = select.selectedIndex >= 0 ? select.options[select.selectedIndex].text.trim() : '';
+        return snapshot;
+    }
+
+    const radio = question.querySelector('fieldset[data-test-form-builder-radio-button-form-component="true"]');
+    if (radio) {
+        snapshot.type = 'radio';
+        snapshot.label = textOf(hiddenOr(radio.querySelector('span[data-test-form-builder-radio-button-form-component__title]')));
+        snapshot.options = Array.from(radio.querySelectorAll('input')).map((input) => {
+            const optionLabel = input.id ? radio.querySelector(`label[for="${CSS.escape(input.id)}"]`) : null;
+            return { label: optionLabel ? textOf(optionLabel) : 'Unknown', value: input.value, id: input.id, checked: input.checked };
+        });
+        return snapshot;
+    }
+
+    const text = question.querySelector("input[type='text']");
+    if (text) {
+        snapshot.type = 'text';
+        snapshot.label = textOf(hiddenOr(question.querySelector('label[for]')));
+        snapshot.value = text.value;
+        return snapshot;
+    }
+
+    const textArea = question.querySelector('textarea');
+    if (textArea) {
+        snapshot.type = 'textarea';
+        snapshot.label = textOf(question.querySelector('label[for]'));
+        snapshot.value = textArea.value;
+        return snapshot;
+    }
+
+    const checkbox = question.querySelector("input[type='checkbox']");
+    if (checkbox) {
+        snapshot.type = 'checkbox';
+        snapshot.label = textOf(Array.from(question.querySelectorAll('span')).find((span) => span.className === 'visually-hidden'));
+        snapshot.option_label = textOf(question.querySelector('label[for]')) || 'Unknown';
+        snapshot.checked = checkbox.checked;
+        return snapshot;
+    }
+
+    return snapshot;
+});
@@ -0,0 +1,33 @@
+// Waits until the page is quiet: no DOM changes and no new network requests for `arguments[0]` ms, in a single `execute_async_script` call.
+// Used by `wait_until_quiet()` in clickers_and_finders.py via `run_javascript(..., asynchronous=True)`.
+// * `arguments[0]`: ms without DOM mutations (MutationObserver) and without new Resource Timing entries to count as quiet
+// * `arguments[1]`: max ms to wait, keep it below the driver's script timeout
+// * Returns {quiet, waited} where `waited` is in ms and `quiet` is false if it gave up at the max time.
+const quietMs = arguments[0];
+const timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+
+const start = performance.now();
+let lastChange = start;
+// Resource Timing only keeps 250 entries by default, after that new requests wouldn't be noticed
+if (performance.setResourceTimingBufferSize) performance.setResourceTimingBufferSize(5000);
+let resources = performance.getEntriesByType('resource').length;
+
+const observer = new MutationObserver(() => { lastChange = performance.now(); });
+// Only elements added or removed count, attribute changes (animations, focus) happen all the time
+observer.observe(document, { childList: true, subtree: true });
+
+const timer = setInterval(() => {
+    const now = performance.now();
+    const count = performance.getEntriesByType('resource').length;
+    if (count !== resources) {
+        resources = count;
+        lastChange = now;
+    }
+    const quiet = document.readyState !== 'loading' && now - lastChange >= quietMs;
+    if (quiet || now - start >= timeoutMs) {
+        clearInterval(timer);
+        observer.disconnect();
+        done({ quiet: quiet, waited: now - start });
+    }
+}, 25);
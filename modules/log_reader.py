@@ -0,0 +1,72 @@
+"""Fast readers for the (possibly rotated and gzipped) log files.
+
+None of these load a whole log file in memory: `tail()` seeks backwards from
+the end, `read_from()` continues from a byte offset (for live viewers) and
+`iter_lines()` / `export_logs()` stream rolled segments and the current file.
+"""
+import gzip
+import os
+import shutil
+from typing import BinaryIO, Iterator
+
+from modules.log_writer import list_segments
+
+
+def _open_segment(path: str) -> BinaryIO:
+    return gzip.open(path, 'rb') if path.endswith(".gz") else open(path, 'rb')
+
+
+def tail(path: str, lines: int = 100, block_size: int = 8192) -> list[str]:
+    """Return the last `lines` lines of the log file at `path`."""
+    if lines <= 0 or not os.path.exists(path):
+        return []
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        position = file.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= lines:
+            step = min(block_size, position)
+            position -= step
+            file.seek(position)
+            data = file.read(step) + data
+    text = data.decode("utf-8", errors="replace")
+    return text.splitlines()[-lines:]
+
+
+def read_from(path: str, offset: int = 0, max_bytes: int = 1024 * 1024) -> tuple[str, int]:
+    """
+    Return text written to `path` after byte `offset` (at most `max_bytes`) and the new offset.
+    If the file was rotated (it is now smaller than `offset`) reading restarts from the beginning.
+    """
+    if not os.path.exists(path):
+        return "", 0
+    with open(path, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        if offset > file.tell():
+            offset = 0
+        file.seek(offset)
+        data = file.read(max_bytes)
+    # Don't split a line (or a multi-byte character) between two reads
+    end = data.rfind(b"\n") + 1 if len(data) == max_bytes else len(data)
+    if end == 0:
+        end = len(data)
+    return data[:end].decode("utf-8", errors="replace"), offset + end
+
+
+def iter_lines(path: str, include_rotated: bool = True) -> Iterator[str]:
+    """Yield lines of all rolled segments (oldest first) and then of the current log file."""
+    paths = (list_segments(path) if include_rotated else []) + ([path] if os.path.exists(path) else [])
+    for segment in paths:
+        with _open_segment(segment) as file:
+            for line in file:
+                yield line.decode("utf-8", errors="replace").rstrip("\n")
+
+
+def export_logs(path: str, destination: str, include_rotated: bool = True) -> int:
+    """Stream the log file (and its rolled segments, decompressed) into `destination`. Returns bytes written."""
+    paths = (list_segments(path) if include_rotated else []) + ([path] if os.path.exists(path) else [])
+    with open(destination, 'wb') as target:
+        for segment in paths:
+            with _open_segment(segment) as source:
+                shutil.copyfileobj(source, target)
+        return target.tell()
@@ -0,0 +1,205 @@
+"""Buffered, batched log file writer used by `print_lg`.
+
+Messages are appended to an in-memory ring buffer and written by a background
+thread in batches, through a single open file handle. A batch is written when
+`flush_lines` messages are waiting or every `flush_interval` seconds, whichever
+comes first. `flush()` writes synchronously (used for critical errors) and the
+buffer is flushed on interpreter exit.
+
+The file is rolled over when it grows past `max_bytes` or when the day changes.
+Rolled segments are named `<name>.<YYYY-MM-DD>.<n><ext>.gz` (Eg: `log.2024-12-29.1.txt.gz`),
+compressed in the background, and only the newest `backup_count` are kept.
+Use `modules.log_reader` to read them.
+"""
+import atexit
+import gzip
+import os
+import re
+import shutil
+import sys
+import threading
+from collections import deque
+from datetime import date, datetime
+from typing import TextIO
+
+
+def segment_pattern(path: str) -> re.Pattern:
+    """Regex matching the file names of rolled segments of `path` (groups: day, index)."""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    return re.compile(re.escape(stem) + r"\.(\d{4}-\d{2}-\d{2})\.(\d+)" + re.escape(ext) + r"(?:\.gz)?$")
+
+
+def list_segments(path: str) -> list[str]:
+    """Paths of rolled segments of `path`, oldest first."""
+    directory = os.path.dirname(path) or "."
+    pattern = segment_pattern(path)
+    found = []
+    try:
+        names = os.listdir(directory)
+    except FileNotFoundError:
+        return []
+    for name in names:
+        match = pattern.match(name)
+        if match:
+            found.append((match.group(1), int(match.group(2)), os.path.join(directory, name)))
+    return [segment for _, _, segment in sorted(found)]
+
+
+def _compress(path: str) -> None:
+    try:
+        with open(path, 'rb') as source, gzip.open(path + ".gz", 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(path)
+    except Exception as e:
+        print(f'Failed compressing log segment "{path}"! {e}', file=sys.stderr)
+
+
+class BufferedLogWriter:
+    def __init__(self, path: str, flush_lines: int = 200, flush_interval: float = 1.0, max_buffer_lines: int = 50000,
+                 max_bytes: int = 0, backup_count: int = 0, rotate_daily: bool = False):
+        self.path = path
+        self.flush_lines = max(1, flush_lines)
+        self.flush_interval = max(0.01, flush_interval)
+        self.max_bytes = max_bytes          # 0 = no size limit
+        self.backup_count = backup_count    # 0 = keep all rolled segments
+        self.rotate_daily = rotate_daily
+        self._size = 0
+        self._day: date | None = None
+        self._buffer: deque[str] = deque(maxlen=max(self.flush_lines, max_buffer_lines))
+        self._dropped = 0
+        self._condition = threading.Condition()
+        self._file_lock = threading.Lock()
+        self._rotation_lock = threading.Lock()
+        self._file: TextIO | None = None
+        self._closed = False
+        self._error_reported = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, text: str) -> None:
+        """Queue `text` to be written. Never blocks on disk I/O."""
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append(text)
+            if len(self._buffer) >= self.flush_lines:
+                self._condition.notify()
+        if self._closed:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write everything queued so far to disk before returning."""
+        # Drain and write under the file lock, so a batch drained by another thread can't be written after this one
+        with self._file_lock:
+            with self._condition:
+                batch = self._drain()
+            self._write_batch(batch)
+
+    def close(self) -> None:
+        """Flush remaining messages, stop the writer thread and close the file."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._condition:
+            self._condition.notify()
+        self._thread.join(timeout=5)
+        self.flush()
+        with self._file_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def pending(self) -> int:
+        """Number of messages waiting to be written."""
+        with self._condition:
+            return len(self._buffer)
+
+    def _drain(self) -> list[str]:
+        batch = list(self._buffer)
+        self._buffer.clear()
+        if self._dropped:
+            batch.insert(0, f"[log-writer] Dropped {self._dropped} messages, log buffer was full!\n")
+            self._dropped = 0
+        return batch
+
+    def _run(self) -> None:
+        while not self._closed:
+            with self._condition:
+                if len(self._buffer) < self.flush_lines:
+                    self._condition.wait(self.flush_interval)
+            self.flush()
+
+    def _open(self) -> TextIO:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'a', encoding="utf-8")
+            self._size = self._file.tell()
+            self._day = datetime.fromtimestamp(os.path.getmtime(self.path)).date() if self._size else date.today()
+        return self._file
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._size == 0:
+            return False
+        if self.rotate_daily and self._day != date.today():
+            return True
+        return bool(self.max_bytes) and self._size + incoming > self.max_bytes
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._file = None
+        stem, ext = os.path.splitext(self.path)
+        index = 1
+        while any(os.path.exists(f"{stem}.{self._day.isoformat()}.{index}{ext}{suffix}") for suffix in ("", ".gz")):
+            index += 1
+        segment = f"{stem}.{self._day.isoformat()}.{index}{ext}"
+        os.replace(self.path, segment)
+        threading.Thread(target=self._compress_and_prune, args=(segment,), name="log-compressor", daemon=True).start()
+
+    def _compress_and_prune(self, segment: str) -> None:
+        with self._rotation_lock:
+            _compress(segment)
+            if self.backup_count > 0:
+                for old_segment in list_segments(self.path)[:-self.backup_count]:
+                    try:
+                        os.remove(old_segment)
+                    except OSError:
+                        pass
+
+    def _write_batch(self, batch: list[str]) -> None:
+        """Write `batch` to the file. Callers hold `_file_lock`."""
+        if not batch:
+            return
+        try:
+            text = "".join(batch)
+            size = len(text.encode("utf-8"))    # `max_bytes` is in bytes, non-ASCII characters take more than one
+            file = self._open()
+            if self._should_rotate(size):
+                self._rotate()
+                file = self._open()
+            file.write(text)
+            file.flush()
+            self._size += size
+            self._error_reported = False
+        except Exception as e:
+            # Keep the messages and retry with the next batch (Eg: log.txt is open in another program)
+            with self._condition:
+                lines = batch + list(self._buffer)
+                overflow = len(lines) - self._buffer.maxlen
+                if overflow > 0:
+                    # Buffer is full, drop the oldest lines like `write()` does and keep the newest
+                    self._dropped += overflow
+                    lines = lines[overflow:]
+                self._buffer.clear()
+                self._buffer.extend(lines)
+            if self._file:
+                try:
+                    self._file.close()
+                except OSError:
+                    pass
+            self._file = None
+            if not self._error_reported:
+                self._error_reported = True
+                print(f'Failed writing to "{self.path}", will retry! {e}', file=sys.stderr)
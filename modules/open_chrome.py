@@ -13,7 +13,8 @@ version:    24.12.29.12.30
 '''
 
 from modules.helpers import make_directories
-from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path
+from config.settings import run_in_background, stealth_mode, disable_extensions, safe_mode, file_name, failed_file_name, logs_folder_path, generated_resume_path, lean_browsing, lean_browsing_blocked_urls
+from config.settings import page_load_strategy, page_load_timeout, script_timeout, element_wait_timeout, cache_chromedriver, chromedriver_cache_path
 from config.questions import default_resume_path
 if stealth_mode:
     import undetected_chromedriver as uc
@@ -23,41 +24,104 @@ else:
     # from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.remote.webdriver import WebDriver
 from modules.helpers import find_default_profile_directory, critical_error_log, print_lg
+from modules.lean_browsing import apply_lean_options, enable_lean_browsing
+from modules.driver_cache import StartupTimer, prepare_driver
 
-try:
-    make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
-
-    # Set up WebDriver with Chrome Profile
-    options = uc.ChromeOptions() if stealth_mode else Options()
-    if run_in_background:   options.add_argument("--headless")
-    if disable_extensions:  options.add_argument("--disable-extensions")
-
-    print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
-    if safe_mode: 
-        print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
-    else:
-        profile_dir = find_default_profile_directory()
-        if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
-        else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
-    if stealth_mode:
-        # try: 
-        #     driver = uc.Chrome(driver_executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe", options=options)
-        # except (FileNotFoundError, PermissionError) as e: 
-        #     print_lg("(Undetected Mode) Got '{}' when using pre-installed ChromeDriver.".format(type(e).__name__)) 
-            print_lg("Downloading Chrome Driver... This may take some time. Undetected mode requires download every run!")
-            driver = uc.Chrome(options=options)
-    else: driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
-    driver.maximize_window()
-    wait = WebDriverWait(driver, 5)
-    actions = ActionChains(driver)
-except Exception as e:
-    msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
-    if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
-    print_lg(msg)
-    critical_error_log("In Opening Chrome", e)
-    from pyautogui import alert
-    alert(msg, "Error in opening chrome")
-    try: driver.quit()
-    except NameError: exit()
-    
+class BrowserSession:
+    '''
+    Chrome browser of the bot, opened on the first call to `start()` instead of when this module is imported.
+    * `driver`, `wait` and `actions` are `None` until then
+    '''
+    def __init__(self):
+        self.driver: WebDriver | None = None
+        self.wait: WebDriverWait | None = None
+        self.actions: ActionChains | None = None
+        self.startup_timer = StartupTimer()
+
+    @property
+    def started(self) -> bool:
+        return self.driver is not None
+
+    def start(self) -> WebDriver:
+        '''
+        Opens Chrome if it isn't open yet and returns its driver.
+        * Exits if Chrome couldn't be opened, after telling the user why.
+        '''
+        if self.driver is None: self._open()
+        return self.driver
+
+    def _open(self) -> None:
+        startup_timer = self.startup_timer
+        driver = None
+        try:
+            make_directories([file_name,failed_file_name,logs_folder_path+"/screenshots",default_resume_path,generated_resume_path+"/temp"])
+
+            # Set up WebDriver with Chrome Profile
+            options = uc.ChromeOptions() if stealth_mode else Options()
+            if run_in_background:   options.add_argument("--headless")
+            if disable_extensions:  options.add_argument("--disable-extensions")
+            if lean_browsing:       apply_lean_options(options)
+            options.page_load_strategy = page_load_strategy
+
+            print_lg("IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM! Or it's highly likely that application will just open browser and not do anything!")
+            if safe_mode: 
+                print_lg("SAFE MODE: Will login with a guest profile, browsing history will not be saved in the browser!")
+            else:
+                profile_dir = find_default_profile_directory()
+                if profile_dir: options.add_argument(f"--user-data-dir={profile_dir}")
+                else: print_lg("Default profile directory not found. Logging in with a guest profile, Web history will not be saved!")
+            if stealth_mode:
+                chrome_version, driver_path = prepare_driver(chromedriver_cache_path, startup_timer) if cache_chromedriver else (None, None)
+                if not driver_path: print_lg("Downloading Chrome Driver... This may take some time. Set cache_chromedriver = True to download it only once!")
+                with startup_timer.step("launch Chrome"):
+                    driver = uc.Chrome(options=options, driver_executable_path=driver_path, version_main=chrome_version)
+            else:
+                with startup_timer.step("launch Chrome"):
+                    driver = webdriver.Chrome(options=options) #, service=Service(executable_path="C:\\Program Files\\Google\\Chrome\\chromedriver-win64\\chromedriver.exe"))
+            with startup_timer.step("set up window"):
+                driver.maximize_window()
+                if lean_browsing:   enable_lean_browsing(driver, lean_browsing_blocked_urls)
+                driver.set_page_load_timeout(page_load_timeout)
+                driver.set_script_timeout(script_timeout)
+                driver.implicitly_wait(0)   # Elements are waited for explicitly with `wait` or `element_wait_timeout`
+            self.driver = driver
+            self.wait = WebDriverWait(driver, element_wait_timeout)
+            self.actions = ActionChains(driver)
+            print_lg(startup_timer.summary())
+        except Exception as e:
+            msg = 'Seems like either... \n\n1. Chrome is already running. \nA. Close all Chrome windows and try again. \n\n2. Google Chrome or Chromedriver is out dated. \nA. Update browser and Chromedriver (You can run "windows-setup.bat" in /setup folder for Windows PC to update Chromedriver)! \n\n3. If error occurred when using "stealth_mode", try reinstalling undetected-chromedriver. \nA. Open a terminal and use commands "pip uninstall undetected-chromedriver" and "pip install undetected-chromedriver". \n\n\nIf issue persists, try Safe Mode. Set, safe_mode = True in config.py \n\nPlease check GitHub discussions/support for solutions https://github.com/GodsScion/Auto_job_applier_linkedIn \n                                   OR \nReach out in discord ( https://discord.gg/fFp7uUzWCY )'
+            if isinstance(e,TimeoutError): msg = "Couldn't download Chrome-driver. Set stealth_mode = False in config!"
+            print_lg(msg)
+            critical_error_log("In Opening Chrome", e)
+            from pyautogui import alert
+            alert(msg, "Error in opening chrome")
+            if driver:
+                try: driver.quit()
+                except Exception: pass
+            exit()
+
+    def quit(self) -> None:
+        '''
+        Closes Chrome if it was opened. `start()` opens a new one after this.
+        '''
+        driver, self.driver, self.wait, self.actions = self.driver, None, None, None
+        if driver: driver.quit()
+
+
+session = BrowserSession()
+driver: WebDriver | None = None
+wait: WebDriverWait | None = None
+actions: ActionChains | None = None
+
+
+def open_chrome() -> tuple[WebDriver, WebDriverWait, ActionChains]:
+    '''
+    Opens Chrome on first call (later calls reuse it) and returns its `driver`, `wait` and `actions`.
+    * Also sets them as `driver`, `wait` and `actions` of this module
+    '''
+    global driver, wait, actions
+    session.start()
+    driver, wait, actions = session.driver, session.wait, session.actions
+    return driver, wait, actions
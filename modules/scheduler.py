@@ -0,0 +1,97 @@
+"""Adaptive schedule of search terms for `run_non_stop` mode.
+
+After each search of a term, `SearchScheduler.record()` is given how many
+jobs it found that the bot hadn't seen before (not applied, rejected or
+skipped) and how many it had. Terms that found new jobs are searched again
+sooner, down to `min_interval` seconds; terms that found nothing new are
+backed off, up to `max_interval` seconds. `due_terms()` returns the terms due
+now, most productive first, never more than `max_per_hour` searches in any
+hour across all terms, and `seconds_until_due()` how long to sleep until the
+next one is.
+"""
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+
+@dataclass
+class TermStats:
+    interval: float
+    next_due: float = 0.0
+    searches: int = 0
+    new_jobs: int = 0
+    seen_jobs: int = 0
+    yield_rate: float = 0.0     # Smoothed share of new jobs per search (0.0 - 1.0)
+
+
+class SearchScheduler:
+    def __init__(self, terms: Iterable[str], min_interval: float = 300, max_interval: float = 7200, max_per_hour: int = 0,
+                 backoff_factor: float = 2.0, smoothing: float = 0.5, clock: Callable[[], float] = time.time):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.max_per_hour = max_per_hour
+        self.backoff_factor = backoff_factor
+        self.smoothing = smoothing
+        self._clock = clock
+        self._recent: deque[float] = deque()    # Start times of searches in the last hour
+        self.terms: dict[str, TermStats] = {}
+        for term in terms:
+            self.add_term(term)
+
+    def add_term(self, term: str) -> None:
+        if term not in self.terms:
+            self.terms[term] = TermStats(interval=self.min_interval)
+
+    def _forget_old_searches(self, now: float) -> None:
+        while self._recent and now - self._recent[0] >= 3600:
+            self._recent.popleft()
+
+    def due_terms(self, now: float | None = None) -> list[str]:
+        '''
+        Terms due to be searched now, most productive first, limited by `max_per_hour`.
+        '''
+        now = self._clock() if now is None else now
+        due = [term for term, stats in self.terms.items() if stats.next_due <= now]
+        due.sort(key=lambda term: self.terms[term].yield_rate, reverse=True)
+        if self.max_per_hour > 0:
+            self._forget_old_searches(now)
+            due = due[:max(0, self.max_per_hour - len(self._recent))]
+        return due
+
+    def record(self, term: str, new_jobs: int, seen_jobs: int, now: float | None = None) -> float:
+        '''
+        Records a search of `term` that found `new_jobs` jobs not seen before and `seen_jobs` seen ones.
+        * Returns seconds until `term` is due again
+        '''
+        now = self._clock() if now is None else now
+        self.add_term(term)
+        stats = self.terms[term]
+        total = new_jobs + seen_jobs
+        current = new_jobs / total if total else 0.0
+        stats.yield_rate = current if stats.searches == 0 else self.smoothing * current + (1 - self.smoothing) * stats.yield_rate
+        stats.searches += 1
+        stats.new_jobs += new_jobs
+        stats.seen_jobs += seen_jobs
+        if new_jobs > 0:
+            stats.interval = max(self.min_interval, stats.interval / self.backoff_factor)
+        else:
+            stats.interval = min(self.max_interval, stats.interval * self.backoff_factor)
+        stats.next_due = now + stats.interval
+        self._recent.append(now)
+        self._forget_old_searches(now)
+        return stats.interval
+
+    def seconds_until_due(self, now: float | None = None) -> float:
+        '''
+        Seconds until a term is due and the hourly limit allows searching it (0 if one can be searched now).
+        '''
+        now = self._clock() if now is None else now
+        if not self.terms:
+            return float("inf")
+        wait = max(0.0, min(stats.next_due for stats in self.terms.values()) - now)
+        if self.max_per_hour > 0:
+            self._forget_old_searches(now)
+            if len(self._recent) >= self.max_per_hour:
+                wait = max(wait, self._recent[len(self._recent) - self.max_per_hour] + 3600 - now)
+        return wait
@@ -0,0 +1,150 @@
+"""Knowledge base of answers given to Easy Apply questions, stored in SQLite.
+
+Questions are keyed by their type, normalized label and (for select/radio)
+normalized option set. `lookup()` first tries the exact key, then the most
+similar remembered label (character trigram similarity, ignoring stop
+words like "the", "with") with the same type and option set. A similar
+label is never used if the two labels differ in a short or technical word
+(Eg: "C" vs "Go", "C++" vs "C#"), as that usually changes what is asked.
+Hits and misses are counted in `modules.dashboard.metrics`
+under `answer_kb` (`answer_kb_hits`, `answer_kb_misses`, `answer_kb_hit_rate`).
+"""
+import hashlib
+import re
+import threading
+from datetime import datetime
+
+from modules.dashboard import metrics
+from modules.storage import database
+
+database.register_schema("""
+CREATE TABLE IF NOT EXISTS answers (
+    key TEXT PRIMARY KEY,
+    question_type TEXT NOT NULL,
+    label TEXT NOT NULL,
+    options_key TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    source TEXT,
+    uses INTEGER DEFAULT 0,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_answers_group ON answers (question_type, options_key);
+""")
+
+_re_word = re.compile(r"[a-z0-9+#.]+")   # Keeps "c++", "c#", ".net" and "node.js" as words
+_stop_words = frozenset("a an and are as at be by do does for from have has how i if in is it of on or the to what which with you your".split())
+
+_lock = threading.Lock()
+_index: dict[tuple[str, str], list[tuple[frozenset, frozenset, str, str]]] | None = None
+_index_connection = None
+
+
+def normalize(text: str) -> str:
+    """Lower case `text`, drop punctuation but "+", "#" and "." inside words, and collapse whitespace (Eg: "Phone Number *" -> "phone number", "With C++?" -> "with c++")."""
+    words = (word.rstrip(".") for word in _re_word.findall((text or "").lower()))
+    return " ".join(word for word in words if word.strip(".+#"))    # Drops lone symbols like "+" or "..."
+
+
+def options_key(options: list[str] | None) -> str:
+    """Order independent key of an option set ("" for free text questions)."""
+    if not options:
+        return ""
+    return "|".join(sorted(normalize(option) for option in options))
+
+
+def question_key(label: str, question_type: str, options: list[str] | None = None) -> str:
+    """Exact lookup key of a question."""
+    raw = f"{question_type}\n{normalize(label)}\n{options_key(options)}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def content_words(text: str) -> frozenset:
+    """Words of normalized `text` without stop words."""
+    return frozenset(word for word in normalize(text).split() if word not in _stop_words)
+
+
+def trigrams(text: str) -> frozenset:
+    """Character trigrams of normalized `text` without stop words, padded so that short words still count."""
+    padded = f"  {' '.join(word for word in normalize(text).split() if word not in _stop_words)} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def is_distinctive(word: str) -> bool:
+    """Short words and words with digits or symbols (Eg: "c", "go", "c#", "5", "node.js") usually name what is asked about."""
+    return len(word) <= 3 or not word.isalpha()
+
+
+def similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity of two trigram sets (0.0 - 1.0)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def _get_index() -> dict[tuple[str, str], list[tuple[frozenset, str, str]]]:
+    # Trigram sets of all remembered labels grouped by (type, options_key), rebuilt when the connection changes
+    global _index, _index_connection
+    conn = database.connect()
+    if _index is None or _index_connection is not conn:
+        index = {}
+        for row in database.query("SELECT key, question_type, label, options_key, answer FROM answers"):
+            index.setdefault((row["question_type"], row["options_key"]), []).append((trigrams(row["label"]), content_words(row["label"]), row["key"], row["answer"]))
+        _index, _index_connection = index, conn
+    return _index
+
+
+def lookup(label: str, question_type: str, options: list[str] | None = None, threshold: float = 0.85) -> str | None:
+    '''
+    Returns the remembered answer of the same or most similar question, or `None` if there is none.
+    * `threshold`: minimum trigram similarity (0.0 - 1.0) of labels for a fuzzy match. Labels differing in a distinctive word (`is_distinctive()`) never match
+    '''
+    key = question_key(label, question_type, options)
+    with _lock:
+        index = _get_index()
+        answer = None
+        rows = database.query("SELECT answer FROM answers WHERE key = ?", (key,))
+        if rows:
+            answer = rows[0]["answer"]
+        else:
+            wanted, wanted_words = trigrams(label), content_words(label)
+            best_score = threshold
+            for candidate, candidate_words, candidate_key, candidate_answer in index.get((question_type, options_key(options)), []):
+                if any(is_distinctive(word) for word in wanted_words ^ candidate_words):
+                    continue
+                score = similarity(wanted, candidate)
+                if score >= best_score:
+                    best_score, key, answer = score, candidate_key, candidate_answer
+        if answer is not None:
+            with database.transaction() as conn:
+                conn.execute("UPDATE answers SET uses = uses + 1 WHERE key = ?", (key,))
+    metrics.record_hit("answer_kb", answer is not None)
+    return answer
+
+
+def remember(label: str, question_type: str, answer: str, options: list[str] | None = None, source: str = "") -> None:
+    '''
+    Saves (or replaces) the answer of a question.
+    * `source`: where the answer came from (Eg: "rules", "ai", "previous"), for reference only
+    '''
+    if answer is None or str(answer) == "" or not normalize(label):
+        return
+    key = question_key(label, question_type, options)
+    group = (question_type, options_key(options))
+    with _lock:
+        index = _get_index()
+        with database.transaction() as conn:
+            conn.execute(
+                "INSERT INTO answers (key, question_type, label, options_key, answer, source, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET answer = excluded.answer, source = excluded.source, updated_at = excluded.updated_at",
+                (key, question_type, normalize(label), group[1], str(answer), source, datetime.now().isoformat()),
+            )
+        entries = [entry for entry in index.get(group, []) if entry[2] != key]
+        entries.append((trigrams(label), content_words(label), key, str(answer)))
+        index[group] = entries
+
+
+def count() -> int:
+    '''
+    Returns number of remembered answers.
+    '''
+    return database.query("SELECT COUNT(*) AS total FROM answers")[0]["total"]
@@ -0,0 +1,196 @@
+"""Applied and failed jobs history, stored in SQLite.
+
+Records are passed around as dicts keyed by the same column names used in the
+history CSV files (`'Job ID'`, `'Title'`, ...), so the CSV export and the
+dashboard/UI code can keep using them unchanged.
+
+Run `python -m modules.storage.applications --import` to import the CSV files
+manually, or `--export` to write the database back out as CSV.
+"""
+import csv
+import os
+from datetime import datetime
+
+from config.settings import file_name, failed_file_name
+from modules.storage import database
+
+APPLIED_FIELDS: dict[str, str] = {
+    'Job ID': 'job_id', 'Title': 'title', 'Company': 'company', 'Work Location': 'work_location', 'Work Style': 'work_style',
+    'About Job': 'about_job', 'Experience required': 'experience_required', 'Skills required': 'skills_required',
+    'HR Name': 'hr_name', 'HR Link': 'hr_link', 'Resume': 'resume', 'Re-posted': 'reposted', 'Date Posted': 'date_posted',
+    'Date Applied': 'date_applied', 'Job Link': 'job_link', 'External Job link': 'external_job_link',
+    'Questions Found': 'questions_found', 'Connect Request': 'connect_request',
+}
+'''
+CSV column name -> database column name for applied jobs (in CSV order)
+'''
+
+FAILED_FIELDS: dict[str, str] = {
+    'Job ID': 'job_id', 'Job Link': 'job_link', 'Resume Tried': 'resume_tried', 'Date listed': 'date_listed',
+    'Date Tried': 'date_tried', 'Assumed Reason': 'assumed_reason', 'Stack Trace': 'stack_trace',
+    'External Job link': 'external_job_link', 'Screenshot Name': 'screenshot_name',
+}
+'''
+CSV column name -> database column name for failed jobs (in CSV order)
+'''
+
+_TABLES = {"applied": ("applied_jobs", APPLIED_FIELDS), "failed": ("failed_jobs", FAILED_FIELDS)}
+
+database.register_schema(f"""
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    {", ".join(f"{column} TEXT" for column in APPLIED_FIELDS.values())}
+);
+CREATE INDEX IF NOT EXISTS idx_applied_job_id ON applied_jobs (job_id);
+CREATE INDEX IF NOT EXISTS idx_applied_company ON applied_jobs (company);
+CREATE INDEX IF NOT EXISTS idx_applied_date_applied ON applied_jobs (date_applied);
+
+CREATE TABLE IF NOT EXISTS failed_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    {", ".join(f"{column} TEXT" for column in FAILED_FIELDS.values())}
+);
+CREATE INDEX IF NOT EXISTS idx_failed_job_id ON failed_jobs (job_id);
+""")
+
+
+def _to_text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _insert(kind: str, records: list[dict]) -> int:
+    table, fields = _TABLES[kind]
+    columns = ", ".join(fields.values())
+    placeholders = ", ".join("?" for _ in fields)
+    rows = [tuple(_to_text(record.get(name)) for name in fields) for record in records]
+    with database.transaction() as conn:
+        conn.executemany(f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows)
+    return len(rows)
+
+
+def _select(kind: str, where: str = "", params: tuple = (), limit: int | None = None, offset: int = 0) -> list[dict]:
+    table, fields = _TABLES[kind]
+    sql = f"SELECT {', '.join(fields.values())} FROM {table} {where} ORDER BY id"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)} OFFSET {int(offset)}"
+    rows = database.query(sql, params)
+    return [{name: row[column] for name, column in fields.items()} for row in rows]
+
+
+def add_applied_job(record: dict) -> None:
+    '''
+    Saves an applied job. `record` is keyed by the applied history CSV column names.
+    '''
+    _insert("applied", [record])
+
+
+def add_failed_job(record: dict) -> None:
+    '''
+    Saves a failed or skipped job. `record` is keyed by the failed history CSV column names.
+    '''
+    _insert("failed", [record])
+
+
+def get_applied_job_ids() -> set[str]:
+    '''
+    Returns a `set` of Job IDs of all applied jobs (served from the Job ID index).
+    '''
+    return {row["job_id"] for row in database.query("SELECT DISTINCT job_id FROM applied_jobs")}
+
+
+def is_applied(job_id: str) -> bool:
+    '''
+    Returns `True` if a job with `job_id` is in the applied history.
+    '''
+    return bool(database.query("SELECT 1 FROM applied_jobs WHERE job_id = ? LIMIT 1", (job_id,)))
+
+
+def get_applied_jobs(limit: int | None = None, offset: int = 0) -> list[dict]:
+    '''
+    Returns applied jobs in the order they were saved, as dicts keyed by CSV column names.
+    '''
+    return _select("applied", limit=limit, offset=offset)
+
+
+def get_failed_jobs(limit: int | None = None, offset: int = 0) -> list[dict]:
+    '''
+    Returns failed jobs in the order they were saved, as dicts keyed by CSV column names.
+    '''
+    return _select("failed", limit=limit, offset=offset)
+
+
+def get_jobs_by_company(company: str) -> list[dict]:
+    '''
+    Returns all applied jobs of `company`.
+    '''
+    return _select("applied", "WHERE company = ?", (company,))
+
+
+def update_date_applied(job_id: str, date_applied: datetime | str | None = None) -> bool:
+    '''
+    Sets 'Date Applied' of the job with `job_id` (defaults to now). Returns `False` if the job is not found.
+    '''
+    if date_applied is None:
+        date_applied = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    with database.transaction() as conn:
+        cursor = conn.execute("UPDATE applied_jobs SET date_applied = ? WHERE job_id = ?", (_to_text(date_applied), job_id))
+    return cursor.rowcount > 0
+
+
+def count_jobs(kind: str = "applied") -> int:
+    '''
+    Returns number of saved records of `kind` ("applied" or "failed").
+    '''
+    table, _ = _TABLES[kind]
+    return database.query(f"SELECT COUNT(*) AS total FROM {table}")[0]["total"]
+
+
+def import_csv(csv_path: str, kind: str = "applied") -> int:
+    '''
+    Imports all rows of a history CSV file into the database. Returns number of imported rows.
+    * Missing columns are saved as empty strings, unknown columns are ignored.
+    '''
+    csv.field_size_limit(1000000)
+    with open(csv_path, 'r', encoding='utf-8', newline='') as file:
+        records = [row for row in csv.DictReader(file) if row.get('Job ID')]
+    return _insert(kind, records) if records else 0
+
+
+def import_existing_csvs(applied_csv: str = file_name, failed_csv: str = failed_file_name) -> dict[str, int]:
+    '''
+    One-shot import of the existing history CSV files. Each file is only imported once per database.
+    * Returns a `dict` of number of rows imported per kind.
+    '''
+    imported = {"applied": 0, "failed": 0}
+    for kind, path in (("applied", applied_csv), ("failed", failed_csv)):
+        key = f"imported_csv:{kind}:{os.path.abspath(path)}"
+        if not os.path.exists(path) or database.get_meta(key):
+            continue
+        imported[kind] = import_csv(path, kind)
+        database.set_meta(key, datetime.now().isoformat())
+    return imported
+
+
+def export_csv(csv_path: str, kind: str = "applied") -> int:
+    '''
+    Writes all saved records of `kind` to `csv_path` (overwrites it). Returns number of exported rows.
+    '''
+    _, fields = _TABLES[kind]
+    records = _select(kind)
+    with open(csv_path, 'w', encoding='utf-8', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=list(fields))
+        writer.writeheader()
+        writer.writerows(records)
+    return len(records)
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Import or export the applications history database.")
+    parser.add_argument("--import", dest="do_import", action="store_true", help="import the history CSV files configured in config/settings.py")
+    parser.add_argument("--export", dest="do_export", action="store_true", help="export the database to the history CSV files configured in config/settings.py")
+    args = parser.parse_args()
+    if args.do_import:
+        print("Imported:", import_existing_csvs())
+    if args.do_export:
+        print("Exported applied jobs:", export_csv(file_name, "applied"))
+        print("Exported failed jobs:", export_csv(failed_file_name, "failed"))
@@ -0,0 +1,94 @@
+"""Shared SQLite connection used by all persistent stores.
+
+The database runs in WAL mode so the bot thread can keep writing while
+`app.py` or the dashboard read from it. Stores register their schema with
+`register_schema()` at import time and it is applied when the connection opens.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from config.settings import history_db_path
+
+_lock = threading.RLock()
+_connection: sqlite3.Connection | None = None
+_connection_path: str | None = None
+_schemas: list[str] = []
+
+
+def register_schema(script: str) -> None:
+    """Register a `CREATE ... IF NOT EXISTS` script, applied on every (re)connect."""
+    with _lock:
+        if script not in _schemas:
+            _schemas.append(script)
+            if _connection is not None:
+                _connection.executescript(script)
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    """Return the shared connection, opening it on first use (or when a different `path` is given)."""
+    global _connection, _connection_path
+    with _lock:
+        if _connection is not None and path in (None, _connection_path):
+            return _connection
+        path = path or history_db_path
+        close()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        for script in _schemas:
+            conn.executescript(script)
+        _connection, _connection_path = conn, path
+        return conn
+
+
+def close() -> None:
+    """Close the shared connection if it is open."""
+    global _connection, _connection_path
+    with _lock:
+        if _connection is not None:
+            try:
+                _connection.close()
+            finally:
+                _connection, _connection_path = None, None
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """Run a block of statements atomically while holding the connection lock."""
+    with _lock:
+        conn = connect()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def query(sql: str, params: tuple | dict = ()) -> list[sqlite3.Row]:
+    """Run a read-only statement and return all rows."""
+    with _lock:
+        return connect().execute(sql, params).fetchall()
+
+
+def get_meta(key: str) -> str | None:
+    """Read a value from the `meta` key/value table."""
+    rows = query("SELECT value FROM meta WHERE key = ?", (key,))
+    return rows[0]["value"] if rows else None
+
+
+def set_meta(key: str, value: str) -> None:
+    """Write a value into the `meta` key/value table."""
+    with transaction() as conn:
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+register_schema("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);")
@@ -0,0 +1,86 @@
+"""Jobs rejected by the filters and blacklisted companies, stored in SQLite.
+
+Each entry keeps the reason, when it was saved and a hash of the filter
+settings at that time (`filters_hash()`), so entries saved with different
+filters can be ignored when loading: a job skipped for a bad word you have
+since removed gets another chance.
+"""
+import hashlib
+import json
+import time
+
+from modules.storage import database
+
+database.register_schema("""
+CREATE TABLE IF NOT EXISTS rejected_jobs (
+    job_id TEXT PRIMARY KEY,
+    reason TEXT,
+    filters_hash TEXT,
+    rejected_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blacklisted_companies (
+    company TEXT PRIMARY KEY,
+    reason TEXT,
+    filters_hash TEXT,
+    blacklisted_at REAL NOT NULL
+);
+""")
+
+
+def filters_hash(*filters) -> str:
+    """Short hash of the filter settings `filters` (any JSON serializable values)."""
+    raw = json.dumps(filters, sort_keys=True, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def reject_job(job_id: str, reason: str = "", filters_key: str = "") -> None:
+    '''
+    Saves `job_id` as rejected because of `reason` by the filters with hash `filters_key`.
+    '''
+    with database.transaction() as conn:
+        conn.execute("INSERT OR REPLACE INTO rejected_jobs (job_id, reason, filters_hash, rejected_at) VALUES (?, ?, ?, ?)",
+                     (job_id, reason, filters_key, time.time()))
+
+
+def blacklist_company(company: str, reason: str = "", filters_key: str = "") -> None:
+    '''
+    Saves `company` as blacklisted because of `reason` by the filters with hash `filters_key`.
+    '''
+    with database.transaction() as conn:
+        conn.execute("INSERT OR REPLACE INTO blacklisted_companies (company, reason, filters_hash, blacklisted_at) VALUES (?, ?, ?, ?)",
+                     (company, reason, filters_key, time.time()))
+
+
+def _load(table: str, key_column: str, time_column: str, filters_key: str | None, max_age_days: float) -> set[str]:
+    sql = f"SELECT {key_column} FROM {table} WHERE 1 = 1"
+    params = []
+    if filters_key is not None:
+        sql += " AND filters_hash = ?"
+        params.append(filters_key)
+    if max_age_days > 0:
+        sql += f" AND {time_column} >= ?"
+        params.append(time.time() - max_age_days * 86400)
+    return {row[key_column] for row in database.query(sql, tuple(params))}
+
+
+def load_rejected_jobs(filters_key: str | None = None, max_age_days: float = 0) -> set[str]:
+    '''
+    Returns IDs of rejected jobs, only those rejected by filters with hash `filters_key` if given, and not older than `max_age_days` (0 = any age).
+    '''
+    return _load("rejected_jobs", "job_id", "rejected_at", filters_key, max_age_days)
+
+
+def load_blacklisted_companies(filters_key: str | None = None, max_age_days: float = 0) -> set[str]:
+    '''
+    Returns names of blacklisted companies, only those blacklisted by filters with hash `filters_key` if given, and not older than `max_age_days` (0 = any age).
+    '''
+    return _load("blacklisted_companies", "company", "blacklisted_at", filters_key, max_age_days)
+
+
+def clear() -> None:
+    '''
+    Deletes all rejected jobs and blacklisted companies.
+    '''
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM rejected_jobs")
+        conn.execute("DELETE FROM blacklisted_companies")
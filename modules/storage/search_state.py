@@ -0,0 +1,49 @@
+"""Jobs seen in each search term's results, stored in SQLite.
+
+The bot marks every job card it goes through under the search term it was
+found with, so in later cycles (and runs) it can tell when a search only
+returns jobs it has already been through and stop paginating. Entries older
+than the retention period are dropped when new ones are saved.
+"""
+import time
+from typing import Iterable
+
+from modules.storage import database
+
+database.register_schema("""
+CREATE TABLE IF NOT EXISTS search_seen_jobs (
+    search_term TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (search_term, job_id)
+);
+CREATE INDEX IF NOT EXISTS idx_search_seen_jobs_seen_at ON search_seen_jobs (seen_at);
+""")
+
+
+def _term_key(search_term: str) -> str:
+    return " ".join(search_term.lower().split())
+
+
+def get_seen(search_term: str) -> set[str]:
+    '''
+    Returns Job IDs seen before in the results of `search_term`.
+    '''
+    rows = database.query("SELECT job_id FROM search_seen_jobs WHERE search_term = ?", (_term_key(search_term),))
+    return {row["job_id"] for row in rows}
+
+
+def mark_seen(search_term: str, job_ids: Iterable[str], retention_days: float = 0) -> None:
+    '''
+    Saves `job_ids` as seen in the results of `search_term` and drops entries older than `retention_days` (0 = keep forever).
+    '''
+    now = time.time()
+    term = _term_key(search_term)
+    with database.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO search_seen_jobs (search_term, job_id, seen_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(search_term, job_id) DO UPDATE SET seen_at = excluded.seen_at",
+            [(term, job_id, now) for job_id in job_ids if job_id],
+        )
+        if retention_days > 0:
+            conn.execute("DELETE FROM search_seen_jobs WHERE seen_at < ?", (now - retention_days * 86400,))
@@ -0,0 +1,86 @@
+"""Cache of AI skill extraction results, stored in SQLite.
+
+Entries are content addressed: the key is a hash of the AI provider, model,
+prompt version and the normalized job description, so the same posting seen
+under another search term, in the next run or as a re-post costs no AI call.
+Entries expire after a TTL and the least recently used ones are dropped when
+the cache grows past its size limit. Hits and misses are counted in
+`modules.dashboard.metrics` under `skills_cache`.
+"""
+import hashlib
+import json
+import time
+
+from modules.dashboard import metrics
+from modules.storage import database
+
+database.register_schema("""
+CREATE TABLE IF NOT EXISTS skills_cache (
+    key TEXT PRIMARY KEY,
+    provider TEXT,
+    model TEXT,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_skills_cache_last_used ON skills_cache (last_used);
+""")
+
+
+def normalize_description(description: str) -> str:
+    """Collapse whitespace and lower case, so formatting differences don't change the key."""
+    return " ".join((description or "").lower().split())
+
+
+def cache_key(provider: str, model: str, prompt_version: str, description: str) -> str:
+    """Key of the skills extracted from `description` by `provider`/`model` with prompt `prompt_version`."""
+    raw = "\n".join((provider.lower(), model, prompt_version, normalize_description(description)))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key: str, ttl_seconds: float = 0) -> dict | list | str | None:
+    '''
+    Returns the cached result of `key`, or `None` if missing or older than `ttl_seconds` (0 = never expires).
+    '''
+    now = time.time()
+    with database.transaction() as conn:
+        row = conn.execute("SELECT result, created_at FROM skills_cache WHERE key = ?", (key,)).fetchone()
+        if row and ttl_seconds > 0 and now - row["created_at"] > ttl_seconds:
+            conn.execute("DELETE FROM skills_cache WHERE key = ?", (key,))
+            row = None
+        if row:
+            conn.execute("UPDATE skills_cache SET last_used = ? WHERE key = ?", (now, key))
+    metrics.record_hit("skills_cache", row is not None)
+    return json.loads(row["result"]) if row else None
+
+
+def put(key: str, result: dict | list | str, provider: str = "", model: str = "", max_entries: int = 0) -> None:
+    '''
+    Saves `result` under `key` and drops the least recently used entries beyond `max_entries` (0 = no limit).
+    '''
+    now = time.time()
+    with database.transaction() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO skills_cache (key, provider, model, result, created_at, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+            (key, provider, model, json.dumps(result), now, now),
+        )
+        if max_entries > 0:
+            conn.execute(
+                "DELETE FROM skills_cache WHERE key IN (SELECT key FROM skills_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            )
+
+
+def count() -> int:
+    '''
+    Returns number of cached results.
+    '''
+    return database.query("SELECT COUNT(*) AS total FROM skills_cache")[0]["total"]
+
+
+def clear() -> None:
+    '''
+    Deletes all cached results.
+    '''
+    with database.transaction() as conn:
+        conn.execute("DELETE FROM skills_cache")
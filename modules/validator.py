@@ -16,6 +16,7 @@ version:    24.12.29.12.30
 
 
 # from config.XdepricatedX import *
+from modules.ai.providers import available_providers
 
 __validation_file_path = ""
 
@@ -24,6 +25,11 @@ def check_int(var: int, var_name: str, min_value: int=0) -> bool | TypeError | V
     if var < min_value: raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects an Integer greater than or equal to `{min_value}`! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.')
     return True
 
+def check_float(var: int | float, var_name: str, min_value: float=0) -> bool | TypeError | ValueError:
+    if isinstance(var, bool) or not isinstance(var, (int, float)): raise TypeError(f'The variable "{var_name}" in "{__validation_file_path}" must be a Number!\nReceived "{var}" of type "{type(var)}" instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" to be a Number.\nExample: `{var_name} = 0.5`\n\nNOTE: Do NOT surround Number values in quotes ("0.5")X !\n\n')
+    if var < min_value: raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects a Number greater than or equal to `{min_value}`! Received `{var}` instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" accordingly.')
+    return True
+
 def check_boolean(var: bool, var_name: str) -> bool | ValueError:
     if var == True or var == False: return True
     raise ValueError(f'The variable "{var_name}" in "{__validation_file_path}" expects a Boolean input `True` or `False`, not "{var}" of type "{type(var)}" instead!\n\nSolution:\nPlease open "{__validation_file_path}" and update "{var_name}" to either `True` or `False` (case-sensitive, T and F must be CAPITAL/uppercase).\nExample: `{var_name} = True`\n\nNOTE: Do NOT surround Boolean values in quotes ("True")X !\n\n')
@@ -99,6 +105,8 @@ def validate_questions() -> None | ValueError | TypeError:
     check_boolean(pause_before_submit, "pause_before_submit")
     check_boolean(pause_at_failed_question, "pause_at_failed_question")
     check_boolean(overwrite_previous_answers, "overwrite_previous_answers")
+    check_boolean(remember_answers, "remember_answers")
+    check_int(answer_match_threshold, "answer_match_threshold", 1)
 
 
 from config.search import *
@@ -113,6 +121,8 @@ def validate_search() -> None | ValueError | TypeError:
     check_string(search_location, "search_location")
     check_int(switch_number, "switch_number", 1)
     check_boolean(randomize_search_order, "randomize_search_order")
+    check_int(stop_after_seen_jobs, "stop_after_seen_jobs", 0)
+    check_int(seen_jobs_retention_days, "seen_jobs_retention_days", 0)
 
     check_string(sort_by, "sort_by", ["", "Most recent", "Most relevant"])
     check_string(date_posted, "date_posted", ["", "Any time", "Past month", "Past week", "Past 24 hours"])
@@ -141,6 +151,7 @@ def validate_search() -> None | ValueError | TypeError:
     check_list(about_company_bad_words, "about_company_bad_words")
     check_list(about_company_good_words, "about_company_good_words")
     check_list(bad_words, "bad_words")
+    check_boolean(match_whole_words, "match_whole_words")
     check_boolean(security_clearance, "security_clearance")
     check_boolean(did_masters, "did_masters")
     check_int(current_experience, "current_experience", -1)
@@ -167,7 +178,7 @@ def validate_secrets() -> None | ValueError | TypeError:
     
     ##> ------ Yang Li : MARKYangL - Feature ------
     # Validate DeepSeek configuration
-    check_string(ai_provider, "ai_provider", ["openai", "deepseek"])
+    check_string(ai_provider, "ai_provider", available_providers())
 
     ##> ------ Tim L : tulxoro - Refactor ------
     if ai_provider == "deepseek":
@@ -197,21 +208,79 @@ def validate_settings() -> None | ValueError | TypeError:
     check_boolean(alternate_sortby, "alternate_sortby")
     check_boolean(cycle_date_posted, "cycle_date_posted")
     check_boolean(stop_date_cycle_at_24hr, "stop_date_cycle_at_24hr")
+    check_boolean(adaptive_scheduling, "adaptive_scheduling")
+    check_int(min_search_interval, "min_search_interval", 1)
+    check_int(max_search_interval, "max_search_interval", min_search_interval)
+    check_int(max_searches_per_hour, "max_searches_per_hour", 0)
     
     # check_string(generated_resume_path, "generated_resume_path", min_length=1)
 
     check_string(file_name, "file_name", min_length=1)
     check_string(failed_file_name, "failed_file_name", min_length=1)
     check_string(logs_folder_path, "logs_folder_path", min_length=1)
+    check_int(log_flush_batch_size, "log_flush_batch_size", 1)
+    check_int(log_flush_interval, "log_flush_interval", 1)
+    check_int(log_max_size_mb, "log_max_size_mb", 0)
+    check_boolean(log_rotate_daily, "log_rotate_daily")
+    check_int(log_backup_count, "log_backup_count", 0)
+    check_boolean(structured_logs, "structured_logs")
+    check_string(history_db_path, "history_db_path", min_length=1)
+    check_boolean(export_history_csv, "export_history_csv")
 
     check_int(click_gap, "click_gap", 0)
+    check_boolean(event_driven_waits, "event_driven_waits")
+    check_float(page_quiet_time, "page_quiet_time", 0)
+    check_float(max_page_settle_time, "max_page_settle_time", 0)
+    check_float(min_human_pause, "min_human_pause", 0)
+    check_float(max_human_pause, "max_human_pause", min_human_pause)
+    check_boolean(fast_form_filling, "fast_form_filling")
+    check_boolean(prefetch_descriptions, "prefetch_descriptions")
+    check_int(prefetch_timeout, "prefetch_timeout", 1)
+    check_boolean(remember_rejections, "remember_rejections")
+    check_boolean(forget_rejections_on_filter_change, "forget_rejections_on_filter_change")
+    check_int(rejections_retention_days, "rejections_retention_days", 0)
 
     check_boolean(run_in_background, "run_in_background")
     check_boolean(disable_extensions, "disable_extensions")
+    check_boolean(lean_browsing, "lean_browsing")
+    check_list(lean_browsing_blocked_urls, "lean_browsing_blocked_urls")
+    check_string(page_load_strategy, "page_load_strategy", ["normal", "eager", "none"])
+    if not isinstance(navigation_page_load, dict): raise TypeError('Invalid input for navigation_page_load. Expecting a Dictionary!')
+    check_list(list(navigation_page_load), "navigation_page_load", ["login", "search"])
+    for kind, strategy in navigation_page_load.items():
+        check_string(strategy, f'navigation_page_load["{kind}"]', ["normal", "eager", "none", ""])
+    check_int(page_load_timeout, "page_load_timeout", 1)
+    check_int(script_timeout, "script_timeout", max(prefetch_timeout + 5, int(max_page_settle_time) + 1))
+    check_float(element_wait_timeout, "element_wait_timeout", 0)
     check_boolean(safe_mode, "safe_mode")
     check_boolean(smooth_scroll, "smooth_scroll")
     check_boolean(keep_screen_awake, "keep_screen_awake")
     check_boolean(stealth_mode, "stealth_mode")
+    check_boolean(cache_chromedriver, "cache_chromedriver")
+    check_string(chromedriver_cache_path, "chromedriver_cache_path", min_length=1)
+    check_boolean(cache_extracted_skills, "cache_extracted_skills")
+    check_int(skills_cache_ttl_days, "skills_cache_ttl_days", 0)
+    check_int(skills_cache_max_entries, "skills_cache_max_entries", 0)
+    check_int(skills_extraction_workers, "skills_extraction_workers", 0)
+    check_int(skills_extraction_timeout, "skills_extraction_timeout", 1)
+    check_boolean(batch_ai_questions, "batch_ai_questions")
+    check_int(ai_connect_timeout, "ai_connect_timeout", 1)
+    check_int(ai_read_timeout, "ai_read_timeout", 1)
+    check_int(ai_max_connections, "ai_max_connections", 1)
+    check_boolean(ai_http2, "ai_http2")
+    if not isinstance(ai_rate_limits, dict): raise TypeError('Invalid input for ai_rate_limits. Expecting a Dictionary!')
+    for provider, limits in ai_rate_limits.items():
+        check_int(limits.get("rpm", 0), f'ai_rate_limits["{provider}"]["rpm"]', 0)
+        check_int(limits.get("tpm", 0), f'ai_rate_limits["{provider}"]["tpm"]', 0)
+    check_int(ai_max_retries, "ai_max_retries", 0)
+    check_float(ai_retry_base_delay, "ai_retry_base_delay", 0)
+    check_float(ai_retry_max_delay, "ai_retry_max_delay", ai_retry_base_delay)
+    check_int(ai_circuit_failures, "ai_circuit_failures", 1)
+    check_int(ai_circuit_cooldown, "ai_circuit_cooldown", 0)
+    check_float(ai_answer_timeout, "ai_answer_timeout", 0)
+    check_float(ai_job_budget, "ai_job_budget", 0)
+    check_string(ollama_url, "ollama_url", min_length=5)
+    if not isinstance(ollama_keep_alive, int): check_string(ollama_keep_alive, "ollama_keep_alive", min_length=1)
 
 
 
@@ -17,6 +17,7 @@ version:    24.12.29.12.30
 import os
 import csv
 import re
+import time
 import pyautogui
 
 # Set CSV field size limit to prevent field size errors
@@ -24,29 +25,32 @@ csv.field_size_limit(1000000)  # Set to 1MB instead of default 131KB
 
 from random import choice, shuffle, randint
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support.select import Select
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, WebDriverException
+from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException, NoSuchWindowException, ElementNotInteractableException, WebDriverException, TimeoutException
 
 from config.personals import *
 from config.questions import *
 from config.search import *
-from config.secrets import use_AI, username, password, ai_provider
+from config.secrets import use_AI, username, password, ai_provider, llm_model
 from config.settings import *
 
 from modules.open_chrome import *
 from modules.helpers import *
 from modules.clickers_and_finders import *
 from modules.validator import validate_config
-
-if use_AI:
-    from modules.ai.openaiConnections import ai_create_openai_client, ai_extract_skills, ai_answer_question, ai_close_openai_client
-    from modules.ai.deepseekConnections import deepseek_create_client, deepseek_extract_skills, deepseek_answer_question
-    from modules.ai.geminiConnections import gemini_create_client, gemini_extract_skills, gemini_answer_question
+from modules.filters import KeywordMatcher
+from modules.lean_browsing import record_page_weight
+from modules.scheduler import SearchScheduler
+from modules.storage import applications, answers, rejections, skills_cache, search_state
+from modules.ai.prompts import extract_skills_prompt_version
+from modules.ai import providers, deadlines
+from modules.dashboard import metrics as _dash_metrics
 
 from typing import Literal
 
@@ -67,8 +71,11 @@ middle_name = middle_name.strip()
 last_name = last_name.strip()
 full_name = first_name + " " + middle_name + " " + last_name if middle_name else first_name + " " + last_name
 
+LINKEDIN_URL = "https://www.linkedin.com"   # Base URL of all LinkedIn pages (benchmarks point it to a local replay server)
+
 useNewResume = True
 randomly_answered_questions = set()
+answers_to_remember = []
 
 tabs_count = 1
 easy_applied_count = 0
@@ -77,6 +84,14 @@ failed_count = 0
 skip_count = 0
 dailyEasyApplyLimitReached = False
 
+bad_words_matcher = KeywordMatcher(bad_words, match_whole_words)
+about_company_good_words_matcher = KeywordMatcher(about_company_good_words, match_whole_words)
+about_company_bad_words_matcher = KeywordMatcher(about_company_bad_words, match_whole_words)
+
+rejection_filters_key = rejections.filters_hash(bad_words, about_company_bad_words, about_company_good_words, match_whole_words, security_clearance, did_masters, current_experience)
+
+search_scheduler = SearchScheduler(search_terms, min_search_interval, max_search_interval, max_searches_per_hour)
+
 re_experience = re.compile(r'[(]?\s*(\d+)\s*[)]?\s*[-to]*\s*\d*[+]*\s*year[s]?', re.IGNORECASE)
 
 desired_salary_lakhs = str(round(desired_salary / 100000, 2))
@@ -91,7 +106,10 @@ notice_period_months = str(notice_period//30)
 notice_period_weeks = str(notice_period//7)
 notice_period = str(notice_period)
 
-aiClient = None
+aiClient: providers.AIProvider | None = None
+skills_executor: ThreadPoolExecutor | None = None
+ai_budget = deadlines.Budget(ai_job_budget)
+late_ai_answers: dict[tuple[str, str], str] = {}
 ##> ------ Dheeraj Deshwal : dheeraj9811 Email:dheeraj20194@iiitd.ac.in/dheerajdeshwal9811@gmail.com - Feature ------
 about_company_for_ai = None # TODO extract about company for AI
 ##<
@@ -137,13 +155,21 @@ def is_bot_running() -> bool:
     return _bot_thread is not None and _bot_thread.is_alive()
 
 
+def start_browser() -> None:
+    '''
+    Opens Chrome (only the first time) and sets the `driver`, `wait` and `actions` used by the bot.
+    '''
+    global driver, wait, actions
+    driver, wait, actions = open_chrome()
+
+
 #< Login Functions
 def is_logged_in_LN() -> bool:
     '''
     Function to check if user is logged-in in LinkedIn
     * Returns: `True` if user is logged-in or `False` if not
     '''
-    if driver.current_url == "https://www.linkedin.com/feed/": return True
+    if driver.current_url == f"{LINKEDIN_URL}/feed/": return True
     if try_linkText(driver, "Sign in"): return False
     if try_xp(driver, '//button[@type="submit" and contains(text(), "Sign in")]'):  return False
     if try_linkText(driver, "Join now"): return False
@@ -159,7 +185,8 @@ def login_LN() -> None:
     * If both failed, asks user to login manually
     '''
     # Find the username and password fields and fill them with user credentials
-    driver.get("https://www.linkedin.com/login")
+    try: navigate(driver, f"{LINKEDIN_URL}/login", "login", strategy=navigation_page_load.get("login", ""))
+    except TimeoutException: print_lg(f"Login page didn't load in {page_load_timeout} secs, looking for the login form anyway.")
     try:
         wait.until(EC.presence_of_element_located((By.LINK_TEXT, "Forgot password?")))
         try:
@@ -184,7 +211,7 @@ def login_LN() -> None:
 
     try:
         # Wait until successful redirect, indicating successful login
-        wait.until(EC.url_to_be("https://www.linkedin.com/feed/")) # wait.until(EC.presence_of_element_located((By.XPATH, '//button[normalize-space(.)="Start a post"]')))
+        wait.until(EC.url_to_be(f"{LINKEDIN_URL}/feed/")) # wait.until(EC.presence_of_element_located((By.XPATH, '//button[normalize-space(.)="Start a post"]')))
         return print_lg("Login successful!")
     except Exception as e:
         print_lg("Seems like login attempt failed! Possibly due to wrong credentials or already logged in! Try logging in manually!")
@@ -197,17 +224,53 @@ def login_LN() -> None:
 def get_applied_job_ids() -> set[str]:
     '''
     Function to get a `set` of applied job's Job IDs
-    * Returns a set of Job IDs from existing applied jobs history csv file
+    * Returns a set of Job IDs from the applications history database
+    '''
+    try:
+        return applications.get_applied_job_ids()
+    except Exception as e:
+        critical_error_log("Failed to read applied jobs from the history database!", e)
+        return set()
+
+
+def get_rejections() -> tuple[set[str], set[str]]:
+    '''
+    Function to get jobs rejected and companies blacklisted by the filters in previous runs, if `remember_rejections` is `True`
+    * Returns a tuple of (rejected Job IDs, blacklisted company names)
+    * If `forget_rejections_on_filter_change` is `True`, only those rejected with the current filter settings
     '''
-    job_ids: set[str] = set()
+    if not remember_rejections: return set(), set()
+    filters_key = rejection_filters_key if forget_rejections_on_filter_change else None
     try:
-        with open(file_name, 'r', encoding='utf-8') as file:
-            reader = csv.reader(file)
-            for row in reader:
-                job_ids.add(row[0])
-    except FileNotFoundError:
-        print_lg(f"The CSV file '{file_name}' does not exist.")
-    return job_ids
+        return (rejections.load_rejected_jobs(filters_key, rejections_retention_days), 
+                rejections.load_blacklisted_companies(filters_key, rejections_retention_days))
+    except Exception as e:
+        critical_error_log("Failed to read rejected jobs from the history database!", e)
+        return set(), set()
+
+
+def reject_job(rejected_jobs: set, job_id: str, reason: str) -> None:
+    '''
+    Function to add `job_id` to `rejected_jobs` and save it for next runs if `remember_rejections` is `True`
+    '''
+    rejected_jobs.add(job_id)
+    if not remember_rejections: return
+    try:
+        rejections.reject_job(job_id, reason, rejection_filters_key)
+    except Exception as e:
+        print_lg("Failed to save rejected job!", e)
+
+
+def blacklist_company(blacklisted_companies: set, company: str, reason: str) -> None:
+    '''
+    Function to add `company` to `blacklisted_companies` and save it for next runs if `remember_rejections` is `True`
+    '''
+    blacklisted_companies.add(company)
+    if not remember_rejections: return
+    try:
+        rejections.blacklist_company(company, reason, rejection_filters_key)
+    except Exception as e:
+        print_lg("Failed to save blacklisted company!", e)
 
 
 
@@ -225,7 +288,7 @@ def set_search_location() -> None:
             actions.send_keys(Keys.TAB, Keys.TAB).perform()
             actions.key_down(Keys.CONTROL).send_keys("a").key_up(Keys.CONTROL).perform()
             actions.send_keys(search_location.strip()).perform()
-            sleep(2)
+            settle(driver, "search_location", 2, fixed=True)
             actions.send_keys(Keys.ENTER).perform()
             try_xp(driver, ".//button[@aria-label='Cancel']")
         except Exception as e:
@@ -308,9 +371,72 @@ def get_page_info() -> tuple[WebElement | None, int | None]:
 
 
 
-def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
+def get_job_cards() -> list[dict]:
+    '''
+    Function to get details of all job cards on the current results page in a single WebDriver call.
+    * Returns a `list` of `dict` with keys job_id, title, company, work_location, work_style, applied, rendered (same order as the job listings)
+    '''
+    try:
+        return run_javascript(driver, "extract_job_cards.js") or []
+    except Exception as e:
+        print_lg("Failed to extract job cards details!", e)
+        return []
+
+
+
+def get_seen_flags(job_cards: list[dict | None], applied_jobs: set, rejected_jobs: set, blacklisted_companies: set, seen_before: set) -> list[bool]:
+    '''
+    Function to tell which jobs on the current results page the bot has already seen, for `search_scheduler` and `stop_after_seen_jobs`.
+    * A job is seen if it's applied, rejected, from a blacklisted company or in `seen_before` (gone through in an earlier cycle)
+    * Returns a `list` of `bool` in the order of the cards, cards that couldn't be read are left out
+    '''
+    return [card["applied"] or card["job_id"] in applied_jobs or card["job_id"] in rejected_jobs or card["job_id"] in seen_before or card["company"] in blacklisted_companies
+            for card in job_cards if card and card["job_id"]]
+
+
+
+def prefetch_job_descriptions(job_ids: list[str]) -> dict[str, str]:
+    '''
+    Function to fetch descriptions of many jobs at once through LinkedIn's own API, without opening them.
+    * Returns a `dict` of Job ID -> description, jobs that couldn't be fetched are left out
+    '''
+    if not job_ids: return {}
+    try:
+        results = run_javascript(driver, "prefetch_job_details.js", job_ids, 4, prefetch_timeout * 1000, asynchronous=True) or {}
+    except Exception as e:
+        print_lg("Failed to prefetch job descriptions!", e)
+        return {}
+    return {job_id: result["description"] for job_id, result in results.items() if result.get("description")}
+
+
+
+def prefilter_jobs(job_cards: list[dict | None], applied_jobs: set, rejected_jobs: set, blacklisted_companies: set) -> int:
+    '''
+    Function to run the About Job filters on all jobs of the current results page before clicking any of them.
+    * Jobs that would be skipped are saved as skipped and added to `rejected_jobs`, so the click loop passes over them
+    * Returns number of jobs skipped
+    '''
+    job_ids = [card["job_id"] for card in job_cards if card and card["job_id"] and not card["applied"] and card["job_id"] not in applied_jobs 
+               and card["job_id"] not in rejected_jobs and card["company"] not in blacklisted_companies]
+    descriptions = prefetch_job_descriptions(job_ids)
+    skipped = 0
+    for job_id, description in descriptions.items():
+        _, skip, reason, message = evaluate_job_description(description)
+        if skip:
+            print_lg(f'Job ID: {job_id}', message)
+            failed_job(job_id, f"{LINKEDIN_URL}/jobs/view/"+job_id, "Pending", "Unknown", reason, message, "Skipped", "Not Available")
+            reject_job(rejected_jobs, job_id, reason)
+            skipped += 1
+    print_lg(f"Prefetched {len(descriptions)} of {len(job_ids)} job descriptions, skipping {skipped} jobs without opening them.")
+    _dash_metrics.inc('prefetch_skipped', skipped)
+    return skipped
+
+
+
+def get_job_main_details(job: WebElement, card: dict | None, blacklisted_companies: set, rejected_jobs: set) -> tuple[str, str, str, str, str, bool]:
     '''
     # Function to get job main details.
+    Takes the job card `WebElement` and its details `card` from `get_job_cards()`. Only touches the `WebElement` to scroll and click.
     Returns a tuple of (job_id, title, company, work_location, work_style, skip)
     * job_id: Job ID
     * title: Job title
@@ -319,19 +445,17 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     * work_style: Work style of this job (Remote, On-site, Hybrid)
     * skip: A boolean flag to skip this job
     '''
-    job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
-    scroll_to_view(driver, job_details_button, True)
-    job_id = job.get_dom_attribute('data-occludable-job-id')
-    title = job_details_button.text
-    title = title[:title.find("\n")]
-    # company = job.find_element(By.CLASS_NAME, "job-card-container__primary-description").text
-    # work_location = job.find_element(By.CLASS_NAME, "job-card-container__metadata-item").text
-    other_details = job.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-    index = other_details.find(' · ')
-    company = other_details[:index]
-    work_location = other_details[index+3:]
-    work_style = work_location[work_location.rfind('(')+1:work_location.rfind(')')]
-    work_location = work_location[:work_location.rfind('(')].strip()
+    job_details_button = None
+    if not card or (not card.get("rendered") and card.get("job_id") not in rejected_jobs):
+        # LinkedIn renders cards lazily, so scroll it into view and extract again
+        job_details_button = job.find_element(By.TAG_NAME, 'a')  # job.find_element(By.CLASS_NAME, "job-card-list__title")  # Problem in India
+        scroll_to_view(driver, job_details_button, True)
+        card = run_javascript(driver, "extract_job_cards.js", job)[0]
+    job_id = card["job_id"]
+    title = card["title"]
+    company = card["company"]
+    work_location = card["work_location"]
+    work_style = card["work_style"]
     
     # Skip if previously rejected due to blacklist or already applied
     skip = False
@@ -341,42 +465,51 @@ def get_job_main_details(job: WebElement, blacklisted_companies: set, rejected_j
     elif job_id in rejected_jobs: 
         print_lg(f'Skipping previously rejected "{title} | {company}" job. Job ID: {job_id}!')
         skip = True
-    try:
-        if job.find_element(By.CLASS_NAME, "job-card-container__footer-job-state").text == "Applied":
-            skip = True
-            print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
-    except: pass
+    if card["applied"]:
+        skip = True
+        print_lg(f'Already applied to "{title} | {company}" job. Job ID: {job_id}!')
+    if skip: return (job_id,title,company,work_location,work_style,skip)
+    if job_details_button is None:
+        job_details_button = job.find_element(By.TAG_NAME, 'a')
+        scroll_to_view(driver, job_details_button, True)
+    click_start = time.perf_counter()
     try: 
-        if not skip: job_details_button.click()
+        job_details_button.click()
     except Exception as e:
         print_lg(f'Failed to click "{title} | {company}" job on details button. Job ID: {job_id}!') 
         # print_lg(e)
         discard_job()
         job_details_button.click() # To pass the error outside
-    buffer(click_gap)
+    settle(driver, "job_card")
+    _dash_metrics.observe("ttfue_job", time.perf_counter() - click_start)
     return (job_id,title,company,work_location,work_style,skip)
 
 
+# Function to find Blacklisted words in About Company
+def evaluate_about_company(about_company_org: str) -> str | None:
+    '''
+    Function to check About Company text against `about_company_good_words` and `about_company_bad_words`, without touching the browser.
+    * Returns the bad word found or `None` if the company is fine
+    '''
+    word = about_company_good_words_matcher.first(about_company_org)
+    if word:
+        print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
+        return None
+    return about_company_bad_words_matcher.first(about_company_org)
+
+
 # Function to check for Blacklisted words in About Company
 def check_blacklist(rejected_jobs: set, job_id: str, company: str, blacklisted_companies: set) -> tuple[set, set, WebElement] | ValueError:
     jobs_top_card = try_find_by_classes(driver, ["job-details-jobs-unified-top-card__primary-description-container","job-details-jobs-unified-top-card__primary-description","jobs-unified-top-card__primary-description","jobs-details__main-content"])
     about_company_org = find_by_class(driver, "jobs-company__box")
     scroll_to_view(driver, about_company_org)
     about_company_org = about_company_org.text
-    about_company = about_company_org.lower()
-    skip_checking = False
-    for word in about_company_good_words:
-        if word.lower() in about_company:
-            print_lg(f'Found the word "{word}". So, skipped checking for blacklist words.')
-            skip_checking = True
-            break
-    if not skip_checking:
-        for word in about_company_bad_words: 
-            if word.lower() in about_company: 
-                rejected_jobs.add(job_id)
-                blacklisted_companies.add(company)
-                raise ValueError(f'\n"{about_company_org}"\n\nContains "{word}".')
-    buffer(click_gap)
+    bad_word = evaluate_about_company(about_company_org)
+    if bad_word:
+        reject_job(rejected_jobs, job_id, "Found Blacklisted words in About Company")
+        blacklist_company(blacklisted_companies, company, f'About Company contains "{bad_word}"')
+        raise ValueError(f'\n"{about_company_org}"\n\nContains "{bad_word}".')
+    settle(driver, "about_company")
     scroll_to_view(driver, jobs_top_card)
     return rejected_jobs, blacklisted_companies, jobs_top_card
 
@@ -416,31 +549,11 @@ def get_job_description(
         jobDescription = "Unknown"
         ##<
         experience_required = "Unknown"
-        found_masters = 0
-        jobDescription = find_by_class(driver, "jobs-box__html-content").text
-        jobDescriptionLow = jobDescription.lower()
         skip = False
         skipReason = None
         skipMessage = None
-        for word in bad_words:
-            if word.lower() in jobDescriptionLow:
-                skipMessage = f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
-                skipReason = "Found a Bad Word in About Job"
-                skip = True
-                break
-        if not skip and security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
-            skipMessage = f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
-            skipReason = "Asking for Security clearance"
-            skip = True
-        if not skip:
-            if did_masters and 'master' in jobDescriptionLow:
-                print_lg(f'Found the word "master" in \n{jobDescription}')
-                found_masters = 2
-            experience_required = extract_years_of_experience(jobDescription)
-            if current_experience > -1 and experience_required > current_experience + found_masters:
-                skipMessage = f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
-                skipReason = "Required experience is high"
-                skip = True
+        jobDescription = find_by_class(driver, "jobs-box__html-content").text
+        experience_required, skip, skipReason, skipMessage = evaluate_job_description(jobDescription)
     except Exception as e:
         if jobDescription == "Unknown":    print_lg("Unable to extract job description!")
         else:
@@ -449,6 +562,37 @@ def get_job_description(
             # print_lg(e)
     finally:
         return jobDescription, experience_required, skip, skipReason, skipMessage
+
+
+
+def evaluate_job_description(jobDescription: str) -> tuple[int | Literal['Unknown'], bool, str | None, str | None]:
+    '''
+    Function to run the About Job filters (bad words, security clearance, experience) on `jobDescription`, without touching the browser.
+    ### Returns:
+    - `experience_required: int | 'Unknown'`
+    - `skip: bool`
+    - `skipReason: str | None`
+    - `skipMessage: str | None`
+    '''
+    experience_required = "Unknown"
+    found_masters = 0
+    jobDescriptionLow = jobDescription.lower()
+    word = bad_words_matcher.first(jobDescription)
+    if word:
+        return experience_required, True, "Found a Bad Word in About Job", f'\n{jobDescription}\n\nContains bad word "{word}". Skipping this job!\n'
+    if security_clearance == False and ('polygraph' in jobDescriptionLow or 'clearance' in jobDescriptionLow or 'secret' in jobDescriptionLow):
+        return experience_required, True, "Asking for Security clearance", f'\n{jobDescription}\n\nFound "Clearance" or "Polygraph". Skipping this job!\n'
+    if did_masters and 'master' in jobDescriptionLow:
+        print_lg(f'Found the word "master" in \n{jobDescription}')
+        found_masters = 2
+    try:
+        experience_required = extract_years_of_experience(jobDescription)
+    except Exception as e:
+        print_lg("Unable to extract years of experience required!")
+        return "Error in extraction", False, None, None
+    if current_experience > -1 and experience_required > current_experience + found_masters:
+        return experience_required, True, "Required experience is high", f'\n{jobDescription}\n\nExperience required {experience_required} > Current Experience {current_experience + found_masters}. Skipping this job!\n'
+    return experience_required, False, None, None
         
 
 
@@ -465,309 +609,478 @@ def answer_common_questions(label: str, answer: str) -> str:
     return answer
 
 
+# Function to find a remembered answer of a question
+def recall_answer(label: str, question_type: str, options: list[str] | None = None) -> str | None:
+    '''
+    Function to get the answer of the same or a very similar question from previously submitted applications.
+    * Returns `None` if `remember_answers` is `False` or nothing matched
+    '''
+    if not remember_answers: return None
+    try:
+        answer = answers.lookup(label, question_type, options, answer_match_threshold / 100)
+        if answer is not None: print_lg(f'Using remembered answer "{answer}" for question "{label}"')
+        return answer
+    except Exception as e:
+        print_lg("Failed to look up remembered answers!", e)
+        return None
+
+
+# Function to queue an answer to be remembered once the application is submitted
+def learn_answer(label: str, question_type: str, answer: str, options: list[str] | None = None, source: str = "rules") -> None:
+    '''
+    Function to queue an answer (not random ones) to be saved by `remember_submitted_answers()`
+    '''
+    if remember_answers and label != "Unknown": answers_to_remember.append((label, question_type, answer, options, source))
+
+
+# Function to save answers of the submitted application
+def remember_submitted_answers() -> None:
+    '''
+    Function to save all non random answers of the submitted application to the answers knowledge base
+    '''
+    try:
+        for label, question_type, answer, options, source in answers_to_remember:
+            answers.remember(label, question_type, answer, options, source)
+    except Exception as e:
+        print_lg("Failed to remember answers of this application!", e)
+    answers_to_remember.clear()
+
+
+# Function to read all questions of the current Easy Apply page
+def get_form_snapshot(modal: WebElement) -> list[dict]:
+    '''
+    Function to read all questions of the current Easy Apply page in a single WebDriver call.
+    * Returns a `list` of `dict` with keys index, type, label, options, value, checked, option_label (see `snapshot_form.js`)
+    '''
+    try:
+        return run_javascript(driver, "snapshot_form.js", modal) or []
+    except Exception as e:
+        print_lg("Failed to read questions of Easy Apply form!", e)
+        return []
+
+
+# Function to find the option that best matches an answer
+def find_option(options_text: list[str], answer: str) -> int | None:
+    '''
+    Function to find the option matching `answer`. Tries exact text first, then similar phrases.
+    * Returns index of the option in `options_text` or `None` if nothing matched
+    '''
+    if answer in options_text: return options_text.index(answer)
+    ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
+    # Define similar phrases for common answers
+    possible_answer_phrases = []
+    if answer == 'Decline':
+        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
+    elif 'yes' in answer.lower():
+        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
+    elif 'no' in answer.lower():
+        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
+    else:
+        # Try partial matching for any answer
+        possible_answer_phrases = [answer]
+        # Add lowercase and uppercase variants
+        possible_answer_phrases.append(answer.lower())
+        possible_answer_phrases.append(answer.upper())
+        # Try without special characters
+        possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
+    ##<
+    for phrase in possible_answer_phrases:
+        for i, option in enumerate(options_text):
+            # Check if phrase is in option or option is in phrase (bidirectional matching)
+            if phrase.lower() in option.lower() or option.lower() in phrase.lower():
+                return i
+    return None
+
+
+# Function to decide the answer of a select question
+def decide_select_answer(question: dict, work_location: str) -> tuple[dict | None, tuple]:
+    '''
+    Function to decide the answer of a select question from its snapshot, without touching the browser.
+    * Returns a tuple of (fill, record), `fill` is `None` if the question is to be left as is
+    '''
+    label_org = question["label"] or "Unknown"
+    answer = 'Yes'
+    label = label_org.lower()
+    options_text = [option["label"] for option in question["options"]]
+    options = '"List of phone country codes"'
+    if label != "phone country code":
+        options = "".join([f' "{option}",' for option in options_text])
+    prev_answer = question["value"]
+    fill = None
+    if overwrite_previous_answers or prev_answer == "Select an option":
+        ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
+        if 'email' in label or 'phone' in label: 
+            answer = prev_answer
+        elif 'gender' in label or 'sex' in label: 
+            answer = gender
+        elif 'disability' in label: 
+            answer = disability_status
+        elif 'proficiency' in label: 
+            answer = 'Professional'
+        # Add location handling
+        elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
+            if 'country' in label:
+                answer = country 
+            elif 'state' in label:
+                answer = state
+            elif 'city' in label:
+                answer = current_city if current_city else work_location
+            else:
+                answer = work_location
+        else: 
+            answer = answer_common_questions(label,answer)
+        ##<
+        option_index = find_option(options_text, answer)
+        source = "rules"
+        if option_index is None:
+            remembered = recall_answer(label_org, "select", options_text)
+            if remembered in options_text:
+                option_index = options_text.index(remembered)
+                source = "memory"
+        if option_index is None:
+            #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
+            print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
+            option_index = randint(1, len(options_text)-1) if len(options_text) > 1 else 0
+            randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
+            source = None
+        if options_text:
+            answer = options_text[option_index]
+            fill = {"index": question["index"], "type": "select", "option": option_index}
+            if source: learn_answer(label_org, "select", answer, options_text, source)
+    else:
+        answer = prev_answer
+        learn_answer(label_org, "select", answer, options_text, "previous")
+    return fill, (f'{label_org} [ {options} ]', answer, "select", prev_answer)
+
+
+# Function to decide the answer of a radio question
+def decide_radio_answer(question: dict) -> tuple[dict | None, tuple]:
+    '''
+    Function to decide the answer of a radio question from its snapshot, without touching the browser.
+    * Returns a tuple of (fill, record), `fill` is `None` if the question is to be left as is
+    '''
+    prev_answer = None
+    label_org = question["label"] or "Unknown"
+    answer = 'Yes'
+    label = label_org.lower()
+    question_label = label_org
+
+    label_org += ' [ '
+    options = question["options"]
+    options_text = [option["label"] for option in options]
+    options_labels = []
+    for option in options:
+        options_labels.append( f'"{option["label"] or "Unknown"}"<{option["value"]}>' ) # Saving option as "label <value>"
+        if option["checked"]: prev_answer = options_labels[-1]
+        label_org += f' {options_labels[-1]},'
+
+    fill = None
+    if options and (overwrite_previous_answers or prev_answer is None):
+        if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
+        elif 'veteran' in label or 'protected' in label: answer = veteran_status
+        elif 'disability' in label or 'handicapped' in label: 
+            answer = disability_status
+        else: answer = answer_common_questions(label,answer)
+        option_index = next((i for i, option in enumerate(options) if " ".join(option["label"].split()) == answer), None)
+        if option_index is None:
+            possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
+            answer = options_labels[0]
+            for phrase in possible_answer_phrases:
+                for i, option_label in enumerate(options_labels):
+                    if phrase in option_label:
+                        option_index = i
+                        answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
+                        break
+                if option_index is not None: break
+        source = "rules"
+        if option_index is None:
+            remembered = recall_answer(question_label, "radio", options_text)
+            if remembered in options_text:
+                option_index = options_text.index(remembered)
+                answer = options_labels[option_index]
+                source = "memory"
+        if option_index is None:
+            option_index = 0
+            randomly_answered_questions.add((f'{label_org} ]',"radio"))
+        else: learn_answer(question_label, "radio", options_text[option_index], options_text, source)
+        fill = {"index": question["index"], "type": "radio", "option": option_index}
+    else:
+        answer = prev_answer
+        if prev_answer: learn_answer(question_label, "radio", next(option["label"] for option in options if option["checked"]), options_text, "previous")
+    return fill, (label_org+" ]", answer, "radio", prev_answer)
+
+
+# Function to answer text questions from the configured details
+def answer_text_question(label: str, work_location: str) -> tuple[str, bool]:
+    '''
+    Function to answer a text question with `label` (lower case) from the configured details.
+    * Returns a tuple of (answer, autocomplete), answer is "" if no detail matched, autocomplete is `True` if a suggestion is to be picked after typing
+    '''
+    autocomplete = False
+    answer = "" # years_of_experience
+    if 'experience' in label or 'years' in label: answer = years_of_experience
+    elif 'phone' in label or 'mobile' in label: answer = phone_number
+    elif 'street' in label: answer = street
+    elif 'city' in label or 'location' in label or 'address' in label:
+        answer = current_city if current_city else work_location
+        autocomplete = True
+    elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
+    elif 'name' in label:
+        if 'full' in label: answer = full_name
+        elif 'first' in label and 'last' not in label: answer = first_name
+        elif 'middle' in label and 'last' not in label: answer = middle_name
+        elif 'last' in label and 'first' not in label: answer = last_name
+        elif 'employer' in label: answer = recent_employer
+        else: answer = full_name
+    elif 'notice' in label:
+        if 'month' in label:
+            answer = notice_period_months
+        elif 'week' in label:
+            answer = notice_period_weeks
+        else: answer = notice_period
+    elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
+        if 'current' in label or 'present' in label:
+            if 'month' in label:
+                answer = current_ctc_monthly
+            elif 'lakh' in label:
+                answer = current_ctc_lakhs
+            else:
+                answer = current_ctc
+        else:
+            if 'month' in label:
+                answer = desired_salary_monthly
+            elif 'lakh' in label:
+                answer = desired_salary_lakhs
+            else:
+                answer = desired_salary
+    elif 'linkedin' in label: answer = linkedIn
+    elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
+    elif 'scale of 1-10' in label: answer = confidence_level
+    elif 'headline' in label: answer = linkedin_headline
+    elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
+    elif 'state' in label or 'province' in label: answer = state
+    elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
+    elif 'country' in label: answer = country
+    else: answer = answer_common_questions(label,answer)
+    return answer, autocomplete
+
+
+# Function to answer textarea questions from the configured details
+def answer_textarea_question(label: str) -> str:
+    '''
+    Function to answer a textarea question with `label` (lower case) from the configured details. Returns "" if no detail matched.
+    '''
+    if 'summary' in label: return linkedin_summary
+    if 'cover' in label: return cover_letter
+    return ""
+
+
+##> ------ Yang Li : MARKYangL - Feature ------
+def get_ai_answer(label_org: str, question_type: str, job_description: str | None) -> str:
+    '''
+    Function to answer a question with the configured AI provider.
+    * Returns "" if AI is not enabled or didn't give an answer
+    '''
+    if not (use_AI and aiClient and aiClient.healthy): return ""    # While the provider is failing, answers from config are used
+    key = (label_org, question_type)
+    if late_ai_answers.get(key):
+        print_lg(f'Using AI answer that came late before for question "{label_org}"')
+        return late_ai_answers[key]
+    def keep_late_answer(answer) -> None:
+        if answer and isinstance(answer, str): late_ai_answers[key] = answer
+    try:
+        answer = deadlines.call_with_deadline("question", ai_budget.timeout(ai_answer_timeout), aiClient.answer_question, label_org, question_type=question_type,
+                                              job_description=job_description, user_information_all=user_information_all, on_late=keep_late_answer)
+        if answer and isinstance(answer, str) and len(answer) > 0:
+            print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
+            return answer
+    except deadlines.DeadlineExceeded as e:
+        print_lg(f'{e}, using answer from config for question "{label_org}"')
+    except Exception as e:
+        print_lg("Failed to get AI answer!", e)
+    return ""
+##<
+
+
+# Function to find the answer of a text or textarea question without AI
+def find_text_answer(question: dict, work_location: str) -> tuple[str, bool, str]:
+    '''
+    Function to find the answer of a text or textarea question with the rules or answers remembered before, without AI.
+    * Returns a tuple of (answer, autocomplete, source), `answer` is "" if none was found
+    '''
+    question_type = question["type"]
+    label_org = question["label"] or "Unknown"
+    label = label_org.lower()
+    if question_type == "text":
+        answer, autocomplete = answer_text_question(label, work_location)
+    else:
+        answer, autocomplete = answer_textarea_question(label), False
+    source = "rules"
+    if answer == "":
+        answer, source = recall_answer(label_org, question_type) or "", "memory"
+    return answer, autocomplete, source
+
+
+# Function to ask AI all unanswered text questions of a page at once
+def find_batch_ai_answers(questions: list[dict], found: dict[int, tuple[str, bool, str]], job_description: str | None) -> tuple[dict[int, tuple[str, bool, str]], bool]:
+    '''
+    Function to ask AI in a single call the text and textarea questions `find_text_answer()` couldn't answer (`found` has its results by question index).
+    * Returns a tuple of (answers like `find_text_answer()` by question index, ask_one_by_one)
+    * `ask_one_by_one` is `False` when the call failed (Eg: timed out or the provider is down), so the same questions aren't sent again one by one.
+      It's `True` if AI wasn't asked or its answer couldn't be read, questions it didn't answer can then be asked one by one
+    '''
+    if not (use_AI and aiClient and aiClient.healthy): return {}, True
+    pending = [question for question in questions if question["index"] in found and found[question["index"]][0] == ""
+               and not late_ai_answers.get((question["label"] or "Unknown", question["type"]))]
+    if len(pending) < 2: return {}, True
+    def keep_late_answers(answers: dict[str, str]) -> None:
+        for question in pending:
+            if answers.get(str(question["index"])): late_ai_answers[(question["label"] or "Unknown", question["type"])] = answers[str(question["index"])]
+    try:
+        answers = deadlines.call_with_deadline("page_questions", ai_budget.timeout(ai_answer_timeout), aiClient.answer_questions,
+            [{"id": str(question["index"]), "question": question["label"] or "Unknown", "type": question["type"]} for question in pending],
+            job_description=job_description, user_information_all=user_information_all, on_late=keep_late_answers)
+    except providers.BatchParseError as e:
+        print_lg("Couldn't read AI answers for the page, asking one by one!", e)
+        return {}, True
+    except deadlines.DeadlineExceeded as e:
+        print_lg(f"{e}, using answers from config for the page")
+        return {}, False
+    except Exception as e:
+        print_lg("Failed to get AI answers for the page, using answers from config!", e)
+        return {}, False
+    print_lg(f"AI answered {len(answers)} of {len(pending)} questions in one call")
+    return {question["index"]: (answers[str(question["index"])], found[question["index"]][1], "ai") for question in pending if answers.get(str(question["index"]))}, True
+
+
+# Function to decide the answer of a text or textarea question
+def decide_text_answer(question: dict, work_location: str, job_description: str | None, found: tuple[str, bool, str] | None = None, ask_ai: bool = True) -> tuple[dict | None, tuple]:
+    '''
+    Function to decide the answer of a text or textarea question from its snapshot, without touching the browser (may ask AI).
+    * `found` is the result of `find_text_answer()` (or of `find_batch_ai_answers()`) if already known
+    * `ask_ai` is `False` to not ask AI when no answer was found (Eg: AI already failed for this page)
+    * Returns a tuple of (fill, record), `fill` is `None` if the question is to be left as is
+    '''
+    question_type = question["type"]
+    label_org = question["label"] or "Unknown"
+    label = label_org.lower()
+    prev_answer = question["value"]
+    if prev_answer and not overwrite_previous_answers:
+        learn_answer(label_org, question_type, prev_answer, source="previous")
+        return None, (label, prev_answer, question_type, prev_answer)
+    answer, autocomplete, source = found or find_text_answer(question, work_location)
+    if answer == "" and ask_ai:
+        answer, source = get_ai_answer(label_org, question_type, job_description), "ai"
+    if answer == "":
+        randomly_answered_questions.add((label_org, question_type))
+        answer = years_of_experience if question_type == "text" else linkedin_summary
+    else: learn_answer(label_org, question_type, answer, source=source)
+    fill = {"index": question["index"], "type": question_type, "value": answer, "autocomplete": autocomplete}
+    return fill, (label, answer, question_type, prev_answer)
+
+
+# Function to decide the answer of a checkbox question
+def decide_checkbox_answer(question: dict) -> tuple[dict | None, tuple]:
+    '''
+    Function to decide the answer of a checkbox question from its snapshot. Checkboxes are always ticked.
+    * Returns a tuple of (fill, record), `fill` is `None` if the checkbox is already ticked
+    '''
+    label = (question["label"] or "Unknown").lower()
+    answer = question["option_label"]  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
+    prev_answer = question["checked"]
+    fill = None if prev_answer else {"index": question["index"], "type": "checkbox"}
+    return fill, (f'{label} ([X] {answer})', prev_answer, "checkbox", prev_answer)
+
+
+# Function to fill one answer like a user
+def fill_question(modal: WebElement, fill: dict) -> dict:
+    '''
+    Function to fill one decided answer through WebDriver, with clicks and key presses.
+    * Returns `dict` with keys index, ok, value (value of the field after filling)
+    '''
+    result = {"index": fill["index"], "ok": False, "value": None}
+    try:
+        question = modal.find_element(By.CSS_SELECTOR, f'[data-hunter-question="{fill["index"]}"]')
+        if fill["type"] == "select":
+            select = Select(question.find_element(By.TAG_NAME, "select"))
+            select.select_by_index(fill["option"])
+            result["value"] = select.first_selected_option.text
+        elif fill["type"] == "radio":
+            option = question.find_elements(By.XPATH, ".//fieldset//input")[fill["option"]]
+            label = try_xp(question, f'.//label[@for="{option.get_attribute("id")}"]', False)
+            actions.move_to_element(label if label else option).click().perform()
+            result["value"] = option.get_attribute("value")
+        elif fill["type"] in ("text", "textarea"):
+            field = question.find_element(By.XPATH, ".//input[@type='text']" if fill["type"] == "text" else ".//textarea")
+            field.clear()
+            field.send_keys(fill["value"])
+            if fill.get("autocomplete"):
+                sleep(2)
+                actions.send_keys(Keys.ARROW_DOWN)
+                actions.send_keys(Keys.ENTER).perform()
+            result["value"] = field.get_attribute("value")
+        elif fill["type"] == "checkbox":
+            checkbox = question.find_element(By.XPATH, ".//input[@type='checkbox']")
+            actions.move_to_element(checkbox).click().perform()
+            result["value"] = True
+        result["ok"] = True
+    except Exception as e:
+        print_lg(f'Failed to fill {fill["type"]} question {fill["index"]}!', e)
+    return result
+
+
+# Function to fill all decided answers of the current Easy Apply page
+def fill_form(modal: WebElement, fills: list[dict]) -> dict[int, dict]:
+    '''
+    Function to fill all decided answers of the current Easy Apply page.
+    * If `fast_form_filling` is `True`, fills them in a single WebDriver call (`fill_form.js`)
+    * Answers that need a suggestion to be picked (Eg: city) or that failed are filled one by one with `fill_question()`
+    * Returns `dict` of results {index: {"index", "ok", "value"}}
+    '''
+    results = {}
+    batch = [fill for fill in fills if not fill.get("autocomplete")] if fast_form_filling else []
+    if batch:
+        try:
+            for result in run_javascript(driver, "fill_form.js", modal, batch) or []:
+                if result["ok"]: results[result["index"]] = result
+        except Exception as e:
+            print_lg("Failed to fill Easy Apply form in one go, filling questions one by one!", e)
+    for fill in fills:
+        if fill["index"] not in results:
+            results[fill["index"]] = fill_question(modal, fill)
+    return results
+
+
 # Function to answer the questions for Easy Apply
 def answer_questions(modal: WebElement, questions_list: set, work_location: str, job_description: str | None = None ) -> set:
-    # Get all questions from the page
-     
-    all_questions = modal.find_elements(By.XPATH, ".//div[@data-test-form-element]")
-    # all_questions = modal.find_elements(By.CLASS_NAME, "jobs-easy-apply-form-element")
-    # all_list_questions = modal.find_elements(By.XPATH, ".//div[@data-test-text-entity-list-form-component]")
-    # all_single_line_questions = modal.find_elements(By.XPATH, ".//div[@data-test-single-line-text-form-component]")
-    # all_questions = all_questions + all_list_questions + all_single_line_questions
-
-    for Question in all_questions:
-        # Check if it's a select Question
-        select = try_xp(Question, ".//select", False)
-        if select:
-            label_org = "Unknown"
-            try:
-                label = Question.find_element(By.TAG_NAME, "label")
-                label_org = label.find_element(By.TAG_NAME, "span").text
-            except: pass
-            answer = 'Yes'
-            label = label_org.lower()
-            select = Select(select)
-            selected_option = select.first_selected_option.text
-            optionsText = []
-            options = '"List of phone country codes"'
-            if label != "phone country code":
-                optionsText = [option.text for option in select.options]
-                options = "".join([f' "{option}",' for option in optionsText])
-            prev_answer = selected_option
-            if overwrite_previous_answers or selected_option == "Select an option":
-                ##> ------ WINDY_WINDWARD Email:karthik.sarode23@gmail.com - Added fuzzy logic to answer location based questions ------
-                if 'email' in label or 'phone' in label: 
-                    answer = prev_answer
-                elif 'gender' in label or 'sex' in label: 
-                    answer = gender
-                elif 'disability' in label: 
-                    answer = disability_status
-                elif 'proficiency' in label: 
-                    answer = 'Professional'
-                # Add location handling
-                elif any(loc_word in label for loc_word in ['location', 'city', 'state', 'country']):
-                    if 'country' in label:
-                        answer = country 
-                    elif 'state' in label:
-                        answer = state
-                    elif 'city' in label:
-                        answer = current_city if current_city else work_location
-                    else:
-                        answer = work_location
-                else: 
-                    answer = answer_common_questions(label,answer)
-                try: 
-                    select.select_by_visible_text(answer)
-                except NoSuchElementException as e:
-                    # Define similar phrases for common answers
-                    possible_answer_phrases = []
-                    if answer == 'Decline':
-                        possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"]
-                    elif 'yes' in answer.lower():
-                        possible_answer_phrases = ["Yes", "Agree", "I do", "I have"]
-                    elif 'no' in answer.lower():
-                        possible_answer_phrases = ["No", "Disagree", "I don't", "I do not"]
-                    else:
-                        # Try partial matching for any answer
-                        possible_answer_phrases = [answer]
-                        # Add lowercase and uppercase variants
-                        possible_answer_phrases.append(answer.lower())
-                        possible_answer_phrases.append(answer.upper())
-                        # Try without special characters
-                        possible_answer_phrases.append(''.join(c for c in answer if c.isalnum()))
-                    ##<
-                    foundOption = False
-                    for phrase in possible_answer_phrases:
-                        for option in optionsText:
-                            # Check if phrase is in option or option is in phrase (bidirectional matching)
-                            if phrase.lower() in option.lower() or option.lower() in phrase.lower():
-                                select.select_by_visible_text(option)
-                                answer = option
-                                foundOption = True
-                                break
-                    if not foundOption:
-                        #TODO: Use AI to answer the question need to be implemented logic to extract the options for the question
-                        print_lg(f'Failed to find an option with text "{answer}" for question labelled "{label_org}", answering randomly!')
-                        select.select_by_index(randint(1, len(select.options)-1))
-                        answer = select.first_selected_option.text
-                        randomly_answered_questions.add((f'{label_org} [ {options} ]',"select"))
-            questions_list.add((f'{label_org} [ {options} ]', answer, "select", prev_answer))
-            continue
-        
-        # Check if it's a radio Question
-        radio = try_xp(Question, './/fieldset[@data-test-form-builder-radio-button-form-component="true"]', False)
-        if radio:
-            prev_answer = None
-            label = try_xp(radio, './/span[@data-test-form-builder-radio-button-form-component__title]', False)
-            try: label = find_by_class(label, "visually-hidden", 2.0)
-            except: pass
-            label_org = label.text if label else "Unknown"
-            answer = 'Yes'
-            label = label_org.lower()
-
-            label_org += ' [ '
-            options = radio.find_elements(By.TAG_NAME, 'input')
-            options_labels = []
-            
-            for option in options:
-                id = option.get_attribute("id")
-                option_label = try_xp(radio, f'.//label[@for="{id}"]', False)
-                options_labels.append( f'"{option_label.text if option_label else "Unknown"}"<{option.get_attribute("value")}>' ) # Saving option as "label <value>"
-                if option.is_selected(): prev_answer = options_labels[-1]
-                label_org += f' {options_labels[-1]},'
-
-            if overwrite_previous_answers or prev_answer is None:
-                if 'citizenship' in label or 'employment eligibility' in label: answer = us_citizenship
-                elif 'veteran' in label or 'protected' in label: answer = veteran_status
-                elif 'disability' in label or 'handicapped' in label: 
-                    answer = disability_status
-                else: answer = answer_common_questions(label,answer)
-                foundOption = try_xp(radio, f".//label[normalize-space()='{answer}']", False)
-                if foundOption: 
-                    actions.move_to_element(foundOption).click().perform()
-                else:    
-                    possible_answer_phrases = ["Decline", "not wish", "don't wish", "Prefer not", "not want"] if answer == 'Decline' else [answer]
-                    ele = options[0]
-                    answer = options_labels[0]
-                    for phrase in possible_answer_phrases:
-                        for i, option_label in enumerate(options_labels):
-                            if phrase in option_label:
-                                foundOption = options[i]
-                                ele = foundOption
-                                answer = f'Decline ({option_label})' if len(possible_answer_phrases) > 1 else option_label
-                                break
-                        if foundOption: break
-                    # if answer == 'Decline':
-                    #     answer = options_labels[0]
-                    #     for phrase in ["Prefer not", "not want", "not wish"]:
-                    #         foundOption = try_xp(radio, f".//label[normalize-space()='{phrase}']", False)
-                    #         if foundOption:
-                    #             answer = f'Decline ({phrase})'
-                    #             ele = foundOption
-                    #             break
-                    actions.move_to_element(ele).click().perform()
-                    if not foundOption: randomly_answered_questions.add((f'{label_org} ]',"radio"))
-            else: answer = prev_answer
-            questions_list.add((label_org+" ]", answer, "radio", prev_answer))
-            continue
-        
-        # Check if it's a text question
-        text = try_xp(Question, ".//input[@type='text']", False)
-        if text: 
-            do_actions = False
-            label = try_xp(Question, ".//label[@for]", False)
-            try: label = label.find_element(By.CLASS_NAME,'visually-hidden')
-            except: pass
-            label_org = label.text if label else "Unknown"
-            answer = "" # years_of_experience
-            label = label_org.lower()
-
-            prev_answer = text.get_attribute("value")
-            if not prev_answer or overwrite_previous_answers:
-                if 'experience' in label or 'years' in label: answer = years_of_experience
-                elif 'phone' in label or 'mobile' in label: answer = phone_number
-                elif 'street' in label: answer = street
-                elif 'city' in label or 'location' in label or 'address' in label:
-                    answer = current_city if current_city else work_location
-                    do_actions = True
-                elif 'signature' in label: answer = full_name # 'signature' in label or 'legal name' in label or 'your name' in label or 'full name' in label: answer = full_name     # What if question is 'name of the city or university you attend, name of referral etc?'
-                elif 'name' in label:
-                    if 'full' in label: answer = full_name
-                    elif 'first' in label and 'last' not in label: answer = first_name
-                    elif 'middle' in label and 'last' not in label: answer = middle_name
-                    elif 'last' in label and 'first' not in label: answer = last_name
-                    elif 'employer' in label: answer = recent_employer
-                    else: answer = full_name
-                elif 'notice' in label:
-                    if 'month' in label:
-                        answer = notice_period_months
-                    elif 'week' in label:
-                        answer = notice_period_weeks
-                    else: answer = notice_period
-                elif 'salary' in label or 'compensation' in label or 'ctc' in label or 'pay' in label: 
-                    if 'current' in label or 'present' in label:
-                        if 'month' in label:
-                            answer = current_ctc_monthly
-                        elif 'lakh' in label:
-                            answer = current_ctc_lakhs
-                        else:
-                            answer = current_ctc
-                    else:
-                        if 'month' in label:
-                            answer = desired_salary_monthly
-                        elif 'lakh' in label:
-                            answer = desired_salary_lakhs
-                        else:
-                            answer = desired_salary
-                elif 'linkedin' in label: answer = linkedIn
-                elif 'website' in label or 'blog' in label or 'portfolio' in label or 'link' in label: answer = website
-                elif 'scale of 1-10' in label: answer = confidence_level
-                elif 'headline' in label: answer = linkedin_headline
-                elif ('hear' in label or 'come across' in label) and 'this' in label and ('job' in label or 'position' in label): answer = "https://github.com/GodsScion/Auto_job_applier_linkedIn"
-                elif 'state' in label or 'province' in label: answer = state
-                elif 'zip' in label or 'postal' in label or 'code' in label: answer = zipcode
-                elif 'country' in label: answer = country
-                else: answer = answer_common_questions(label,answer)
-                ##> ------ Yang Li : MARKYangL - Feature ------
-                if answer == "":
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="text", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="text", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "text"))
-                                answer = years_of_experience
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "text"))
-                            answer = years_of_experience
-                    else:
-                        randomly_answered_questions.add((label_org, "text"))
-                        answer = years_of_experience
-                ##<
-                text.clear()
-                text.send_keys(answer)
-                if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text.get_attribute("value"), "text", prev_answer))
-            continue
-
-        # Check if it's a textarea question
-        text_area = try_xp(Question, ".//textarea", False)
-        if text_area:
-            label = try_xp(Question, ".//label[@for]", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = ""
-            prev_answer = text_area.get_attribute("value")
-            if not prev_answer or overwrite_previous_answers:
-                if 'summary' in label: answer = linkedin_summary
-                elif 'cover' in label: answer = cover_letter
-                if answer == "":
-                ##> ------ Yang Li : MARKYangL - Feature ------
-                    if use_AI and aiClient:
-                        try:
-                            if ai_provider.lower() == "openai":
-                                answer = ai_answer_question(aiClient, label_org, question_type="textarea", job_description=job_description, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "deepseek":
-                                answer = deepseek_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            elif ai_provider.lower() == "gemini":
-                                answer = gemini_answer_question(aiClient, label_org, options=None, question_type="textarea", job_description=job_description, about_company=None, user_information_all=user_information_all)
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                            if answer and isinstance(answer, str) and len(answer) > 0:
-                                print_lg(f'AI Answered received for question "{label_org}" \nhere is answer: "{answer}"')
-                            else:
-                                randomly_answered_questions.add((label_org, "textarea"))
-                                answer = ""
-                        except Exception as e:
-                            print_lg("Failed to get AI answer!", e)
-                            randomly_answered_questions.add((label_org, "textarea"))
-                            answer = ""
-                    else:
-                        randomly_answered_questions.add((label_org, "textarea"))
-            text_area.clear()
-            text_area.send_keys(answer)
-            if do_actions:
-                    sleep(2)
-                    actions.send_keys(Keys.ARROW_DOWN)
-                    actions.send_keys(Keys.ENTER).perform()
-            questions_list.add((label, text_area.get_attribute("value"), "textarea", prev_answer))
-            ##<
-            continue
-
-        # Check if it's a checkbox question
-        checkbox = try_xp(Question, ".//input[@type='checkbox']", False)
-        if checkbox:
-            label = try_xp(Question, ".//span[@class='visually-hidden']", False)
-            label_org = label.text if label else "Unknown"
-            label = label_org.lower()
-            answer = try_xp(Question, ".//label[@for]", False)  # Sometimes multiple checkboxes are given for 1 question, Not accounted for that yet
-            answer = answer.text if answer else "Unknown"
-            prev_answer = checkbox.is_selected()
-            checked = prev_answer
-            if not prev_answer:
-                try:
-                    actions.move_to_element(checkbox).click().perform()
-                    checked = True
-                except Exception as e: 
-                    print_lg("Checkbox click failed!", e)
-                    pass
-            questions_list.add((f'{label} ([X] {answer})', checked, "checkbox", prev_answer))
-            continue
-
+    '''
+    Function to answer the questions of the current Easy Apply page.
+    * Reads all questions with one WebDriver call, decides the answers without touching the browser and fills them in one more call
+    * Adds (label, answer, type, previous answer) of each question to `questions_list` and returns it
+    '''
+    questions = get_form_snapshot(modal)
+    found = {question["index"]: find_text_answer(question, work_location) for question in questions
+             if question["type"] in ("text", "textarea") and not (question["value"] and not overwrite_previous_answers)}
+    ask_ai = True
+    if batch_ai_questions:
+        batch_answers, ask_ai = find_batch_ai_answers(questions, found, job_description)
+        found.update(batch_answers)
+
+    decided = []
+    for question in questions:
+        question_type = question["type"]
+        if question_type == "select": decided.append(decide_select_answer(question, work_location))
+        elif question_type == "radio": decided.append(decide_radio_answer(question))
+        elif question_type in ("text", "textarea"): decided.append(decide_text_answer(question, work_location, job_description, found.get(question["index"]), ask_ai))
+        elif question_type == "checkbox": decided.append(decide_checkbox_answer(question))
+
+    results = fill_form(modal, [fill for fill, _ in decided if fill])
+
+    for fill, (label, answer, question_type, prev_answer) in decided:
+        result = results.get(fill["index"]) if fill else None
+        if result and question_type in ("text", "textarea"): answer = result["value"]
+        elif fill and question_type == "checkbox": answer = result["ok"]
+        questions_list.add((label, answer, question_type, prev_answer))
 
     # Select todays date
     try_xp(driver, "//button[contains(@aria-label, 'This is today')]")
@@ -813,10 +1126,12 @@ def external_apply(pagination_element: WebElement, job_id: str, job_link: str, r
 
 
 
-def follow_company(modal: WebDriver = driver) -> None:
+def follow_company(modal: WebDriver | WebElement | None = None) -> None:
     '''
     Function to follow or un-follow easy applied companies based om `follow_companies`
+    * `modal` defaults to the whole page
     '''
+    if modal is None: modal = driver
     try:
         follow_checkbox_input = try_xp(modal, ".//input[@id='follow-company-checkbox' and @type='checkbox']", False)
         if follow_checkbox_input and follow_checkbox_input.is_selected() != follow_companies:
@@ -829,14 +1144,19 @@ def follow_company(modal: WebDriver = driver) -> None:
 #< Failed attempts logging
 def failed_job(job_id: str, job_link: str, resume: str, date_listed, error: str, exception: Exception, application_link: str, screenshot_name: str) -> None:
     '''
-    Function to update failed jobs list in excel
+    Function to save the failed job in the history database (and failed jobs list in excel if `export_history_csv`)
     '''
+    record = {'Job ID':job_id, 'Job Link':job_link, 'Resume Tried':resume, 'Date listed':date_listed, 'Date Tried':datetime.now(), 'Assumed Reason':error, 'Stack Trace':exception, 'External Job link':application_link, 'Screenshot Name':screenshot_name}
+    try:
+        applications.add_failed_job(record)
+    except Exception as e:
+        critical_error_log("Failed to save failed job in the history database!", e)
+    if not export_history_csv: return
     try:
         with open(failed_file_name, 'a', newline='', encoding='utf-8') as file:
-            fieldnames = ['Job ID', 'Job Link', 'Resume Tried', 'Date listed', 'Date Tried', 'Assumed Reason', 'Stack Trace', 'External Job link', 'Screenshot Name']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer = csv.DictWriter(file, fieldnames=list(applications.FAILED_FIELDS))
             if file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Job Link':truncate_for_csv(job_link), 'Resume Tried':truncate_for_csv(resume), 'Date listed':truncate_for_csv(date_listed), 'Date Tried':datetime.now(), 'Assumed Reason':truncate_for_csv(error), 'Stack Trace':truncate_for_csv(exception), 'External Job link':truncate_for_csv(application_link), 'Screenshot Name':truncate_for_csv(screenshot_name)})
+            writer.writerow({key: truncate_for_csv(value) for key, value in record.items()})
             file.close()
     except Exception as e:
         print_lg("Failed to update failed jobs list!", e)
@@ -863,18 +1183,23 @@ def submitted_jobs(job_id: str, title: str, company: str, work_location: str, wo
                    reposted: bool, date_listed: datetime | Literal['Unknown'], date_applied:  datetime | Literal['Pending'], job_link: str, application_link: str, 
                    questions_list: set | None, connect_request: Literal['In Development']) -> None:
     '''
-    Function to create or update the Applied jobs CSV file, once the application is submitted successfully
+    Function to save the applied job in the history database (and Applied jobs CSV file if `export_history_csv`), once the application is submitted successfully
     '''
+    record = {'Job ID':job_id, 'Title':title, 'Company':company, 'Work Location':work_location, 'Work Style':work_style, 
+              'About Job':description, 'Experience required':experience_required, 'Skills required':skills, 
+              'HR Name':hr_name, 'HR Link':hr_link, 'Resume':resume, 'Re-posted':reposted, 
+              'Date Posted':date_listed, 'Date Applied':date_applied, 'Job Link':job_link, 
+              'External Job link':application_link, 'Questions Found':questions_list, 'Connect Request':connect_request}
+    try:
+        applications.add_applied_job(record)
+    except Exception as e:
+        critical_error_log("Failed to save applied job in the history database!", e)
+    if not export_history_csv: return
     try:
         with open(file_name, mode='a', newline='', encoding='utf-8') as csv_file:
-            fieldnames = ['Job ID', 'Title', 'Company', 'Work Location', 'Work Style', 'About Job', 'Experience required', 'Skills required', 'HR Name', 'HR Link', 'Resume', 'Re-posted', 'Date Posted', 'Date Applied', 'Job Link', 'External Job link', 'Questions Found', 'Connect Request']
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+            writer = csv.DictWriter(csv_file, fieldnames=list(applications.APPLIED_FIELDS))
             if csv_file.tell() == 0: writer.writeheader()
-            writer.writerow({'Job ID':truncate_for_csv(job_id), 'Title':truncate_for_csv(title), 'Company':truncate_for_csv(company), 'Work Location':truncate_for_csv(work_location), 'Work Style':truncate_for_csv(work_style), 
-                            'About Job':truncate_for_csv(description), 'Experience required': truncate_for_csv(experience_required), 'Skills required':truncate_for_csv(skills), 
-                                'HR Name':truncate_for_csv(hr_name), 'HR Link':truncate_for_csv(hr_link), 'Resume':truncate_for_csv(resume), 'Re-posted':truncate_for_csv(reposted), 
-                                'Date Posted':truncate_for_csv(date_listed), 'Date Applied':truncate_for_csv(date_applied), 'Job Link':truncate_for_csv(job_link), 
-                                'External Job link':truncate_for_csv(application_link), 'Questions Found':truncate_for_csv(questions_list), 'Connect Request':truncate_for_csv(connect_request)})
+            writer.writerow({key: truncate_for_csv(value) for key, value in record.items()})
         csv_file.close()
     except Exception as e:
         print_lg("Failed to update submitted jobs list!", e)
@@ -892,36 +1217,153 @@ def discard_job() -> None:
 
 
 
+# Function to extract skills from job description using AI
+def extract_skills(description: str) -> dict | list | str:
+    '''
+    Function to extract skills required in `description` with the configured AI provider.
+    * If `cache_extracted_skills` is `True`, reuses skills extracted earlier from the same description (by the same provider, model and prompt version)
+    '''
+    model = aiClient.model if aiClient else llm_model
+    key = skills_cache.cache_key(ai_provider, model, extract_skills_prompt_version, description) if cache_extracted_skills else None
+    if key:
+        try:
+            cached = skills_cache.get(key, skills_cache_ttl_days * 86400)
+            if cached is not None:
+                print_lg(f"Reusing skills extracted earlier using {ai_provider} AI")
+                return cached
+        except Exception as e:
+            print_lg("Failed to read skills cache!", e)
+
+    if aiClient and not aiClient.healthy:
+        print_lg(f"Not extracting skills, {ai_provider} AI is failing")
+        return "Error extracting skills"
+
+    ##> ------ Yang Li : MARKYangL - Feature ------
+    try:
+        import time
+        from modules.dashboard import metrics as _dash_metrics
+        ai_start = time.perf_counter()
+        skills = aiClient.extract_skills(description) if aiClient else "In Development"
+        duration = time.perf_counter() - ai_start
+        try:
+            # record under 'jd_analysis' for dashboard time-series and keep legacy name
+            _dash_metrics.append_sample('jd_analysis', duration)
+            _dash_metrics.append_sample('jd_analysis_time', duration)
+            _dash_metrics.inc('jd_analysis_count')
+        except Exception:
+            pass
+        print_lg(f"Extracted skills using {ai_provider} AI")
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        return "Error extracting skills"
+    ##<
+
+    # Don't cache failures, so they are retried next time
+    failed = not skills or skills == "In Development" or (isinstance(skills, dict) and "error" in skills) or (isinstance(skills, str) and "[Ollama Error]" in skills)
+    if key and not failed:
+        try:
+            skills_cache.put(key, skills, ai_provider, model, skills_cache_max_entries)
+        except Exception as e:
+            print_lg("Failed to save skills to cache!", e)
+    return skills
+
+
+
+# Function to start extracting skills in background
+def submit_skills_extraction(description: str) -> Future | dict | list | str:
+    '''
+    Function to start `extract_skills(description)` on a background worker, so AI latency overlaps with filling the application.
+    * Returns a `Future` to pass to `collect_skills()`, or the skills directly if `skills_extraction_workers` is 0
+    '''
+    global skills_executor
+    if skills_extraction_workers < 1:
+        # Extraction keeps running in the background if it takes too long, and its result is still cached
+        try: return deadlines.call_with_deadline("skills", skills_extraction_timeout, extract_skills, description)
+        except deadlines.DeadlineExceeded:
+            print_lg(f"Skill extraction didn't finish in {skills_extraction_timeout} secs, saving job without skills!")
+            return "Timed out extracting skills"
+    if skills_executor is None:
+        skills_executor = ThreadPoolExecutor(max_workers=skills_extraction_workers, thread_name_prefix="skills-extraction")
+    return skills_executor.submit(extract_skills, description)
+
+
+# Function to get the result of background skill extraction
+def collect_skills(skills: Future | dict | list | str) -> dict | list | str:
+    '''
+    Function to wait for skills started with `submit_skills_extraction()`, for at most `skills_extraction_timeout` secs.
+    * If it takes longer, the job is saved without skills. Extraction keeps running and its result is still cached.
+    '''
+    if not isinstance(skills, Future): return skills
+    wait_start = time.perf_counter()
+    try:
+        return skills.result(timeout=skills_extraction_timeout)
+    except FutureTimeoutError:
+        print_lg(f"Skill extraction didn't finish in {skills_extraction_timeout} secs, saving job without skills!")
+        _dash_metrics.inc('skills_extraction_timeouts')
+        deadlines.record_miss("skills")
+        return "Timed out extracting skills"
+    except Exception as e:
+        print_lg("Failed to extract skills:", e)
+        return "Error extracting skills"
+    finally:
+        _dash_metrics.append_sample('skills_wait', time.perf_counter() - wait_start)
+
+
+
 # Function to apply to jobs
 def apply_to_jobs(search_terms: list[str]) -> None:
     applied_jobs = get_applied_job_ids()
-    rejected_jobs = set()
-    blacklisted_companies = set()
-    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume
+    rejected_jobs, blacklisted_companies = get_rejections()
+    if rejected_jobs or blacklisted_companies: print_lg(f"Skipping {len(rejected_jobs)} jobs and {len(blacklisted_companies)} companies rejected by your filters before.")
+    global current_city, failed_count, skip_count, easy_applied_count, external_jobs_count, tabs_count, pause_before_submit, pause_at_failed_question, useNewResume, ai_budget
     current_city = current_city.strip()
 
     if randomize_search_order:  shuffle(search_terms)
     for searchTerm in search_terms:
-        driver.get(f"https://www.linkedin.com/jobs/search/?keywords={searchTerm}")
+        set_log_context(stage="search")
+        try:
+            navigate(driver, f"{LINKEDIN_URL}/jobs/search/?keywords={searchTerm}", "search", (By.XPATH, "//li[@data-occludable-job-id]"), navigation_page_load.get("search", ""))
+        except TimeoutException:
+            print_lg(f'Job listings for "{searchTerm}" did not show up in {element_wait_timeout} secs, checking again after applying filters.')
         print_lg("\n________________________________________________________________________________________________________________________\n")
         print_lg(f'\n>>>> Now searching for "{searchTerm}" <<<<\n\n')
 
         apply_filters()
 
         current_count = 0
+        new_jobs = seen_jobs = seen_in_a_row = 0
+        seen_before = set()
+        visited_jobs = []
+        try:
+            seen_before = search_state.get_seen(searchTerm)
+        except Exception as e:
+            print_lg(f'Failed to load jobs seen before for "{searchTerm}"!', e)
         try:
             while current_count < switch_number:
                 # Wait until job listings are loaded
-                wait.until(EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]")))
+                wait_for(driver, "job_listings_present", EC.presence_of_all_elements_located((By.XPATH, "//li[@data-occludable-job-id]")))
 
                 pagination_element, current_page = get_page_info()
 
                 # Find all job listings in current page
-                buffer(3)
+                settle(driver, "job_listings", 3)
+                record_page_weight(driver, "search")
                 job_listings = driver.find_elements(By.XPATH, "//li[@data-occludable-job-id]")  
+                job_cards = get_job_cards()
+                if len(job_cards) != len(job_listings): job_cards = [None] * len(job_listings)
+                seen_flags = get_seen_flags(job_cards, applied_jobs, rejected_jobs, blacklisted_companies, seen_before)
+                new_jobs += seen_flags.count(False)
+                seen_jobs += seen_flags.count(True)
+                for seen in seen_flags: seen_in_a_row = seen_in_a_row + 1 if seen else 0
+                page_seen = bool(stop_after_seen_jobs and seen_flags and all(seen_flags))
+                if page_seen and seen_in_a_row >= stop_after_seen_jobs:
+                    print_lg(f'All jobs on this page and the last {seen_in_a_row} in a row were seen before, done with "{searchTerm}" for now.')
+                    break
+                if page_seen: print_lg(f"All jobs on page {current_page} were seen before, going to the next page without opening them.")
+                elif prefetch_descriptions: skip_count += prefilter_jobs(job_cards, applied_jobs, rejected_jobs, blacklisted_companies)
 
             
-                for job in job_listings:
+                for job, card in ([] if page_seen else zip(job_listings, job_cards)):
                     import time
                     if keep_screen_awake: pyautogui.press('shiftright')
                     if current_count >= switch_number: break
@@ -929,9 +1371,12 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
                     job_start_time = time.perf_counter()
 
-                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, blacklisted_companies, rejected_jobs)
+                    set_log_context(stage="job_card")
+                    job_id,title,company,work_location,work_style,skip = get_job_main_details(job, card, blacklisted_companies, rejected_jobs)
                     
+                    visited_jobs.append(job_id)
                     if skip: continue
+                    set_log_context(job_id, "job_details")
                     # Redundant fail safe check for applied jobs!
                     try:
                         if job_id in applied_jobs or find_by_class(driver, "jobs-s-apply__application-link", 2):
@@ -940,7 +1385,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     except Exception as e:
                         print_lg(f'Trying to Apply to "{title} | {company}" job. Job ID: {job_id}')
 
-                    job_link = "https://www.linkedin.com/jobs/view/"+job_id
+                    job_link = f"{LINKEDIN_URL}/jobs/view/"+job_id
                     application_link = "Easy Applied"
                     date_applied = "Pending"
                     hr_link = "Unknown"
@@ -1006,69 +1451,22 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                         print_lg("Failed to calculate the date posted!",e)
 
 
+                    set_log_context(job_id, "job_description")
                     description, experience_required, skip, reason, message = get_job_description()
                     if skip:
                         print_lg(message)
                         failed_job(job_id, job_link, resume, date_listed, reason, message, "Skipped", screenshot_name)
-                        rejected_jobs.add(job_id)
+                        reject_job(rejected_jobs, job_id, reason)
                         skip_count += 1
                         continue
 
                     
                     if use_AI and description != "Unknown":
-                        ##> ------ Yang Li : MARKYangL - Feature ------
-                        try:
-                            import time
-                            from modules.dashboard import metrics as _dash_metrics
-                            ai_start = time.perf_counter()
-                            if ai_provider.lower() == "openai":
-                                skills = ai_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "deepseek":
-                                skills = deepseek_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "gemini":
-                                skills = gemini_extract_skills(aiClient, description)
-                            elif ai_provider.lower() == "ollama":
-                                # Use local Ollama wrapper; prefer streaming if available
-                                try:
-                                    from modules.ai import ollama_integration as _oll
-                                    res = _oll.generate(description, timeout=120, stream=True)
-                                    if isinstance(res, str):
-                                        skills = res
-                                    else:
-                                        # res is an iterator
-                                        out = []
-                                        try:
-                                            from modules.dashboard import log_handler as _lh
-                                        except Exception:
-                                            _lh = None
-                                        for chunk in res:
-                                            text = str(chunk).strip()
-                                            out.append(text)
-                                            if _lh:
-                                                try:
-                                                    _lh.publish('[AI] ' + text)
-                                                except Exception:
-                                                    pass
-                                        skills = ' '.join(out)
-                                except Exception as e:
-                                    skills = f"[Ollama Error] {e}"
-                            else:
-                                skills = "In Development"
-                            duration = time.perf_counter() - ai_start
-                            try:
-                                # record under 'jd_analysis' for dashboard time-series and keep legacy name
-                                _dash_metrics.append_sample('jd_analysis', duration)
-                                _dash_metrics.append_sample('jd_analysis_time', duration)
-                                _dash_metrics.inc('jd_analysis_count')
-                            except Exception:
-                                pass
-                            print_lg(f"Extracted skills using {ai_provider} AI")
-                        except Exception as e:
-                            print_lg("Failed to extract skills:", e)
-                            skills = "Error extracting skills"
-                        ##<
+                        set_log_context(job_id, "skills_extraction")
+                        skills = submit_skills_extraction(description)
 
                     uploaded = False
+                    set_log_context(job_id, "apply")
                     # Case 1: Easy Apply Button
                     if try_xp(driver, ".//button[contains(@class,'jobs-apply-button') and contains(@class, 'artdeco-button--3') and contains(@aria-label, 'Easy')]"):
                         try: 
@@ -1081,6 +1479,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                 resume = "Previous resume"
                                 next_button = True
                                 questions_list = set()
+                                answers_to_remember.clear()
+                                ai_budget = deadlines.Budget(ai_job_budget)
                                 next_counter = 0
                                 while next_button:
                                     next_counter += 1
@@ -1100,7 +1500,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                                     except NoSuchElementException:  next_button = modal.find_element(By.XPATH, './/button[contains(span, "Next")]')
                                     try: next_button.click()
                                     except ElementClickInterceptedException: break    # Happens when it tries to click Next button in About Company photos section
-                                    buffer(click_gap)
+                                    settle(modal, "easy_apply_next")
 
                             except NoSuchElementException: errored = "nose"
                             finally:
@@ -1144,6 +1544,8 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                             return
                         if skip: continue
 
+                    set_log_context(job_id, "save")
+                    skills = collect_skills(skills)
                     submitted_jobs(job_id, title, company, work_location, work_style, description, experience_required, skills, hr_name, hr_link, resume, reposted, date_listed, date_applied, job_link, application_link, questions_list, connect_request)
                     if uploaded:   useNewResume = False
 
@@ -1151,6 +1553,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     current_count += 1
                     if application_link == "Easy Applied":
                         easy_applied_count += 1
+                        remember_submitted_answers()
                         try:
                             from modules.dashboard import metrics as _dash_metrics
                             _dash_metrics.inc('easy_applied')
@@ -1166,6 +1569,7 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                     applied_jobs.add(job_id)
 
                     # Job timing & ETA updates for dashboard metrics
+                    record_page_weight(driver, "job")
                     try:
                         import time
                         from modules.dashboard import metrics as _dash_metrics
@@ -1187,6 +1591,9 @@ def apply_to_jobs(search_terms: list[str]) -> None:
 
 
                 # Switching to next page
+                if stop_after_seen_jobs and seen_in_a_row >= stop_after_seen_jobs:
+                    print_lg(f'Last {seen_in_a_row} jobs in a row were seen before, not going through more pages of "{searchTerm}".')
+                    break
                 if pagination_element == None:
                     print_lg("Couldn't find pagination element, probably at the end page of results!")
                     break
@@ -1196,6 +1603,13 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 except NoSuchElementException:
                     print_lg(f"\n>-> Didn't find Page {current_page+1}. Probably at the end page of results!\n")
                     break
+                # Wait for the job listings of the new page to replace the old ones
+                first_job_id = next((card["job_id"] for card in job_cards if card), None)
+                if event_driven_waits and first_job_id:
+                    try:
+                        wait_for(driver, "next_page", lambda driver: driver.find_element(By.XPATH, "//li[@data-occludable-job-id]").get_attribute("data-occludable-job-id") != first_job_id, 10)
+                    except TimeoutException:
+                        print_lg("Job listings didn't change after switching page, continuing anyway...")
 
         except (NoSuchWindowException, WebDriverException) as e:
             print_lg("Browser window closed or session is invalid. Ending application process.", e)
@@ -1209,6 +1623,13 @@ def apply_to_jobs(search_terms: list[str]) -> None:
                 print_lg(f"Failed to get page source, browser might have crashed. {page_source_error}")
             # print_lg(e)
 
+        try:
+            search_state.mark_seen(searchTerm, visited_jobs, seen_jobs_retention_days)
+        except Exception as e:
+            print_lg(f'Failed to save jobs seen for "{searchTerm}"!', e)
+        next_search = search_scheduler.record(searchTerm, new_jobs, seen_jobs)
+        print_lg(f'Found {new_jobs} new and {seen_jobs} already seen jobs for "{searchTerm}", will search it again in {round(next_search/60)} min or later.')
+
         
 def run(total_runs: int) -> int:
     if dailyEasyApplyLimitReached:
@@ -1217,13 +1638,23 @@ def run(total_runs: int) -> int:
     print_lg(f"Date and Time: {datetime.now()}")
     print_lg(f"Cycle number: {total_runs}")
     print_lg(f"Currently looking for jobs posted within '{date_posted}' and sorting them by '{sort_by}'")
-    apply_to_jobs(search_terms)
+    if adaptive_scheduling and run_non_stop:
+        due_terms = search_scheduler.due_terms()
+        print_lg(f"Search terms due in this cycle: {due_terms}")
+        apply_to_jobs(due_terms)
+    else:
+        apply_to_jobs(search_terms)
     print_lg("########################################################################################################################\n")
     if not dailyEasyApplyLimitReached:
-        print_lg("Sleeping for 10 min...")
-        sleep(300)
-        print_lg("Few more min... Gonna start with in next 5 min...")
-        sleep(300)
+        if adaptive_scheduling and run_non_stop:
+            wait_time = min(search_scheduler.seconds_until_due(), max_search_interval)
+            print_lg(f"Sleeping for {round(wait_time/60)} min, until the next search term is due...")
+            sleep(wait_time)
+        else:
+            print_lg("Sleeping for 10 min...")
+            sleep(300)
+            print_lg("Few more min... Gonna start with in next 5 min...")
+            sleep(300)
     buffer(3)
     return total_runs + 1
 
@@ -1238,6 +1669,13 @@ def main() -> None:
         alert_title = "Error Occurred. Closing Browser!"
         total_runs = 1        
         validate_config()
+        start_browser()
+
+        try:
+            imported = applications.import_existing_csvs()
+            if any(imported.values()): print_lg(f"Imported history CSV files into the applications database: {imported}")
+        except Exception as e:
+            critical_error_log("Failed to import history CSV files into the applications database!", e)
         
         if not os.path.exists(default_resume_path):
             pyautogui.alert(text='Your default resume "{}" is missing! Please update it\'s folder path "default_resume_path" in config.py\n\nOR\n\nAdd a resume with exact name and path (check for spelling mistakes including cases).\n\n\nFor now the bot will continue using your previous upload from LinkedIn!'.format(default_resume_path), title="Missing Resume", button="OK")
@@ -1245,7 +1683,8 @@ def main() -> None:
         
         # Login to LinkedIn
         tabs_count = len(driver.window_handles)
-        driver.get("https://www.linkedin.com/login")
+        try: navigate(driver, f"{LINKEDIN_URL}/login", "login", strategy=navigation_page_load.get("login", ""))
+        except TimeoutException: print_lg(f"Login page didn't load in {page_load_timeout} secs, checking if logged in anyway.")
         if not is_logged_in_LN(): login_LN()
         
         linkedIn_tab = driver.current_window_handle
@@ -1262,15 +1701,7 @@ def main() -> None:
         #     except Exception as e:
         #         print_lg("Opening OpenAI chatGPT tab failed!")
         if use_AI:
-            if ai_provider == "openai":
-                aiClient = ai_create_openai_client()
-            ##> ------ Yang Li : MARKYangL - Feature ------
-            # Create DeepSeek client
-            elif ai_provider == "deepseek":
-                aiClient = deepseek_create_client()
-            elif ai_provider == "gemini":
-                aiClient = gemini_create_client()
-            ##<
+            aiClient = providers.connect(ai_provider)
 
             try:
                 about_company_for_ai = " ".join([word for word in (first_name+" "+last_name).split() if len(word) > 3])
@@ -1309,6 +1740,18 @@ def main() -> None:
         print_lg("Total applied or collected:     {}".format(easy_applied_count + external_jobs_count))
         print_lg("\nFailed jobs:                    {}".format(failed_count))
         print_lg("Irrelevant jobs skipped:        {}\n".format(skip_count))
+        try:
+            for name in sorted(_dash_metrics.get_histograms("wait_")):
+                stats = _dash_metrics.get_sample_stats(name)
+                print_lg(f"Waited after {name[5:]:<22} {stats['count']:>5} times, avg {stats['avg']:.2f}s, max {stats['max']:.2f}s")
+            for name in sorted(_dash_metrics.get_histograms("ttfue_")):
+                stats = _dash_metrics.get_sample_stats(name)
+                print_lg(f"Time until {name[6:]} page usable {stats['count']:>5} times, avg {stats['avg']:.2f}s, max {stats['max']:.2f}s")
+            for site in ("search", "job"):
+                stats = _dash_metrics.get_sample_stats(f"page_bytes_{site}")
+                if stats["count"]: print_lg(f"Data loaded per {site}: avg {stats['avg']/1024:.0f} KB over {stats['count']} samples (lean browsing {'on' if lean_browsing else 'off'})")
+        except Exception:
+            pass
         if randomly_answered_questions: print_lg("\n\nQuestions randomly answered:\n  {}  \n\n".format(";\n".join(str(question) for question in randomly_answered_questions)))
         quote = choice([
             "You're one step closer than before.", 
@@ -1331,22 +1774,18 @@ def main() -> None:
             msg = "NOTE: IF YOU HAVE MORE THAN 10 TABS OPENED, PLEASE CLOSE OR BOOKMARK THEM!\n\nOr it's highly likely that application will just open browser and not do anything next time!" 
             pyautogui.alert(msg,"Info")
             print_lg("\n"+msg)
+        if skills_executor:
+            skills_executor.shutdown(wait=False, cancel_futures=True)
         ##> ------ Yang Li : MARKYangL - Feature ------
         if use_AI and aiClient:
             try:
-                if ai_provider.lower() == "openai":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "deepseek":
-                    ai_close_openai_client(aiClient)
-                elif ai_provider.lower() == "gemini":
-                    pass # Gemini client does not need to be closed
+                aiClient.close()
                 print_lg(f"Closed {ai_provider} AI client.")
             except Exception as e:
                 print_lg("Failed to close AI client:", e)
         ##<
         try:
-            if driver:
-                driver.quit()
+            session.quit()
         except WebDriverException as e:
             print_lg("Browser already closed.", e)
         except Exception as e: 
@@ -0,0 +1,13 @@
+import pytest
+
+from modules.storage import database
+
+
+@pytest.fixture
+def temp_db(tmp_path):
+    '''
+    Connects the storage modules to an empty database in a temporary folder.
+    '''
+    database.connect(str(tmp_path / "history.db"))
+    yield
+    database.close()
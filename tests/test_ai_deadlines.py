@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from modules.ai import deadlines
+from modules.dashboard import metrics
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset_all()
+
+
+def test_fast_call_returns_its_result():
+    assert deadlines.call_with_deadline("question", 1, lambda a, b=0: a + b, 1, b=2) == 3
+    assert deadlines.call_with_deadline("question", None, str.upper, "no limit") == "NO LIMIT"
+    assert "ai_deadline_misses" not in metrics.get_metrics()
+
+
+def test_errors_are_raised():
+    def fail():
+        raise ValueError("bad answer")
+    with pytest.raises(ValueError, match="bad answer"):
+        deadlines.call_with_deadline("question", 1, fail)
+
+
+def test_late_call_is_abandoned_and_kept():
+    release, kept = threading.Event(), threading.Event()
+    late = []
+    def slow():
+        release.wait(5)
+        return "late answer"
+    def on_late(result):
+        late.append(result)
+        kept.set()
+
+    with pytest.raises(deadlines.DeadlineExceeded):
+        deadlines.call_with_deadline("question", 0.05, slow, on_late=on_late)
+    release.set()
+    assert kept.wait(5) and late == ["late answer"]
+    data = metrics.get_metrics()
+    assert data["ai_deadline_misses"] == 1 and data["ai_deadline_misses_question"] == 1
+
+
+def test_no_time_left_skips_the_call():
+    calls = []
+    with pytest.raises(deadlines.DeadlineExceeded):
+        deadlines.call_with_deadline("skills", 0, calls.append, "x")
+    assert calls == [] and metrics.get_metrics()["ai_deadline_misses_skills"] == 1
+
+
+def test_budget():
+    now = [100.0]
+    budget = deadlines.Budget(30, clock=lambda: now[0])
+    assert budget.timeout(20) == 20
+    now[0] += 25
+    assert budget.timeout(20) == pytest.approx(5)
+    assert budget.timeout(0) == pytest.approx(5)
+    now[0] += 10
+    assert budget.timeout(20) == 0
+    unlimited = deadlines.Budget(0)
+    assert unlimited.remaining() is None and unlimited.timeout(0) is None and unlimited.timeout(15) == 15
@@ -0,0 +1,83 @@
+import pytest
+
+from modules.ai import providers
+
+
+class EchoProvider(providers.AIProvider):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def connect(self) -> bool:
+        self.client = object()
+        return True
+
+    def complete(self, prompt, response_format=None):
+        self.prompts.append((prompt, response_format))
+        return {"tech_stack": ["Python"]} if response_format else "answer"
+
+
+@pytest.fixture
+def echo():
+    providers.register("echo")(EchoProvider)
+    yield
+    providers._registry.pop("echo")
+
+
+def test_builtin_providers_are_registered():
+    assert {"openai", "deepseek", "gemini", "ollama"} <= set(providers.available_providers())
+    assert isinstance(providers.create_provider("OpenAI"), providers.OpenAIProvider)
+
+
+def test_unknown_provider():
+    with pytest.raises(ValueError, match="Unknown AI provider"):
+        providers.create_provider("nope")
+
+
+def test_defaults_build_on_complete(echo):
+    provider = providers.connect("echo")
+    assert provider.name == "echo"
+    assert provider.extract_skills("We use Python") == {"tech_stack": ["Python"]}
+    assert "We use Python" in provider.prompts[0][0] and provider.prompts[0][1] is not None
+    assert provider.answer_question("Notice period?", job_description="Backend role") == "answer"
+    assert "Notice period?" in provider.prompts[1][0] and "Backend role" in provider.prompts[1][0]
+    assert list(provider.stream("hi")) == ["answer"]
+
+
+def test_question_prompt_options():
+    prompt = providers.build_question_prompt("Sponsorship?", ["Yes", "No"], "single_select", job_description="Unknown")
+    assert "- Yes\n- No" in prompt and "exactly ONE" in prompt
+    assert "JOB DESCRIPTION" not in prompt
+    assert "OPTIONS" not in providers.build_question_prompt("Why us?", ["Yes"], "text")
+
+
+class BatchProvider(providers.AIProvider):
+    def __init__(self, reply):
+        super().__init__()
+        self.reply = reply
+        self.prompts = []
+
+    def complete(self, prompt, response_format=None):
+        self.prompts.append(prompt)
+        return self.reply
+
+
+def test_answer_questions_in_one_call():
+    provider = BatchProvider('```json\n{"answers": [{"id": "0", "answer": "5"}, {"id": "2", "answer": " Yes "}, {"id": "9", "answer": "x"}]}\n```')
+    questions = [{"id": "0", "question": "Years of Python?", "type": "text"},
+                 {"id": "2", "question": "Can you relocate?", "type": "text"},
+                 {"id": "3", "question": "Why us?", "type": "textarea"}]
+    assert provider.answer_questions(questions, job_description="Backend role") == {"0": "5", "2": "Yes"}
+    assert len(provider.prompts) == 1
+    assert provider.prompts[0].count("Backend role") == 1 and "Why us?" in provider.prompts[0]
+
+
+def test_parse_batch_answers_formats():
+    assert providers.parse_batch_answers([{"id": 1, "answer": "No"}], ["1"]) == {"1": "No"}
+    assert providers.parse_batch_answers({"1": "No", "2": ""}, ["1", "2"]) == {"1": "No"}
+    with pytest.raises(providers.BatchParseError):
+        providers.parse_batch_answers("Sure! Here are the answers...", ["1"])
+    with pytest.raises(providers.BatchParseError):
+        providers.parse_batch_answers({"error": "Unable to parse the response as JSON", "data": "Sure!"}, ["1"])
+    with pytest.raises(RuntimeError):
+        providers.parse_batch_answers({"error": "API down"}, ["1"])
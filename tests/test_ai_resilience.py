@@ -0,0 +1,139 @@
+import random
+
+import pytest
+
+from modules.ai import resilience
+from modules.ai.resilience import CircuitBreaker, CircuitOpenError, ProviderGuard, RateLimiter, TokenBucket
+from modules.dashboard import metrics
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class APIError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"status_code": status_code, "headers": headers or {}})()
+
+
+@pytest.fixture
+def clock():
+    metrics.reset_all()
+    return FakeClock()
+
+
+def make_guard(clock, rpm=0, tpm=0, failures=3, cooldown=60, retries=2):
+    return ProviderGuard("test", RateLimiter(rpm, tpm, clock=clock), CircuitBreaker(failures, cooldown, clock=clock),
+                         max_retries=retries, sleep=clock.sleep, rng=random.Random(1))
+
+
+def flaky(*errors, result="ok"):
+    errors = list(errors)
+    calls = []
+    def function(*args, **kwargs):
+        calls.append((args, kwargs))
+        if errors: raise errors.pop(0)
+        return result
+    return function, calls
+
+
+def test_token_bucket(clock):
+    bucket = TokenBucket(60, clock=clock)
+    assert bucket.wait_time(60) == 0
+    bucket.take(60)
+    assert bucket.wait_time(1) == pytest.approx(1)
+    clock.now += 30
+    assert bucket.wait_time(30) == 0
+    assert TokenBucket(0, clock=clock).wait_time(10 ** 9) == 0
+
+
+def test_rate_limiter_throttles(clock):
+    guard = make_guard(clock, rpm=2, tpm=1000)
+    function, calls = flaky()
+    for _ in range(3):
+        assert guard.call(function, "prompt", tokens=100, temperature=0) == "ok"
+    assert calls[0] == (("prompt",), {"temperature": 0})
+    assert clock.sleeps == [pytest.approx(30)]
+    assert metrics.get_metrics()["ai_throttled"] == 1
+
+
+def test_retries_with_backoff(clock):
+    guard = make_guard(clock)
+    function, calls = flaky(APIError(503), TimeoutError())
+    assert guard.call(function) == "ok"
+    assert len(calls) == 3 and len(clock.sleeps) == 2
+    assert 0 <= clock.sleeps[0] <= resilience.ai_retry_base_delay
+    assert 0 <= clock.sleeps[1] <= 2 * resilience.ai_retry_base_delay
+    assert metrics.get_metrics()["ai_retries"] == 2
+    assert guard.breaker.failures == 0
+
+
+def test_retry_after_pauses_the_limiter(clock):
+    guard = make_guard(clock)
+    function, calls = flaky(APIError(429, {"retry-after": "7"}))
+    assert guard.call(function) == "ok"
+    assert clock.sleeps == [pytest.approx(7)]
+
+
+def test_bad_requests_are_not_retried(clock):
+    guard = make_guard(clock, failures=1)
+    function, calls = flaky(APIError(400))
+    with pytest.raises(APIError):
+        guard.call(function)
+    assert len(calls) == 1 and guard.healthy
+
+
+def test_circuit_opens_and_recovers(clock):
+    guard = make_guard(clock, failures=2, retries=0)
+    function, calls = flaky(APIError(500), APIError(500), APIError(500))
+    for _ in range(2):
+        with pytest.raises(APIError):
+            guard.call(function)
+    assert not guard.healthy and guard.breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        guard.call(function)
+    assert len(calls) == 2 and metrics.get_metrics()["ai_short_circuited"] == 1
+
+    clock.now += 60
+    assert guard.healthy and guard.breaker.state == "half_open"
+    with pytest.raises(APIError):
+        guard.call(function)   # The trial call fails, so it opens again right away
+    assert guard.breaker.state == "open"
+
+    clock.now += 60
+    assert guard.call(function) == "ok"
+    assert guard.breaker.state == "closed"
+
+
+def test_is_retryable():
+    assert resilience.is_retryable(APIError(429))
+    assert not resilience.is_retryable(APIError(401))
+    assert resilience.is_retryable(ConnectionError())
+    assert not resilience.is_retryable(ValueError("bad JSON"))
+    assert resilience.retry_after(APIError(429, {"retry-after-ms": "1500"})) == 1.5
+
+
+def test_stream_errors_count_as_failures(clock):
+    guard = make_guard(clock, failures=1)
+    def broken_stream():
+        yield "Hel"
+        raise ConnectionError("stream cut")
+    pieces = []
+    with pytest.raises(ConnectionError):
+        for piece in guard.stream(broken_stream):
+            pieces.append(piece)
+    assert pieces == ["Hel"] and not guard.healthy
+    assert metrics.get_metrics()["ai_failures"] == 1
+    with pytest.raises(CircuitOpenError):
+        list(guard.stream(broken_stream))
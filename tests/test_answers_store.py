@@ -0,0 +1,62 @@
+import pytest
+
+from modules.dashboard import metrics
+from modules.storage import answers
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset_all()
+
+
+def test_exact_lookup_ignores_case_punctuation_and_option_order():
+    answers.remember("Are you willing to relocate?", "radio", "Yes", ["Yes", "No"], source="rules")
+    assert answers.lookup("are you willing to relocate", "radio", ["No", "Yes"]) == "Yes"
+    assert answers.lookup("Are you willing to relocate?", "radio", ["Yes", "No", "Maybe"]) is None
+    assert answers.lookup("Are you willing to relocate?", "select", ["Yes", "No"]) is None
+
+
+def test_fuzzy_lookup_and_threshold():
+    answers.remember("How many years of experience do you have with Python?", "text", "5", source="ai")
+    assert answers.lookup("How many years of experience do you have in Python?", "text") == "5"
+    assert answers.lookup("How many years of experience do you have with Kubernetes?", "text") is None
+    assert answers.lookup("How many years of work experience do you have with Python?", "text") is None
+    assert answers.lookup("How many years of work experience do you have with Python?", "text", threshold=0.75) == "5"
+
+
+def test_programming_languages_are_not_mixed_up():
+    answers.remember("How many years of experience do you have with C++?", "text", "7")
+    answers.remember("How many years of experience do you have with .NET?", "text", "2")
+    assert answers.question_key("Years of experience with C++?", "text") != answers.question_key("Years of experience with C#?", "text")
+    assert answers.question_key("Years of experience with C#?", "text") != answers.question_key("Years of experience with C?", "text")
+    assert answers.lookup("How many years of experience do you have with C++?", "text") == "7"
+    assert answers.lookup("How many years of experience do you have with C#?", "text", threshold=0.5) is None
+    assert answers.lookup("How many years of experience do you have with C?", "text", threshold=0.5) is None
+    assert answers.lookup("How many years of experience do you have with NET?", "text", threshold=0.5) is None
+
+
+def test_short_words_block_fuzzy_matches():
+    answers.remember("How many years of experience do you have with Go?", "text", "3")
+    assert answers.lookup("How many years of experience do you have with C?", "text", threshold=0.5) is None
+    assert answers.lookup("How many years of experience do you have in Go?", "text") == "3"
+
+
+def test_remember_replaces_answer_and_skips_empty():
+    answers.remember("Cover letter", "textarea", "Old")
+    answers.remember("Cover letter", "textarea", "New")
+    answers.remember("Website", "text", "")
+    assert answers.count() == 1
+    assert answers.lookup("Cover letter", "textarea") == "New"
+
+
+def test_hit_rate_metrics():
+    answers.remember("Phone", "text", "1234567890")
+    answers.lookup("Phone", "text")
+    answers.lookup("Unknown question", "text")
+    data = metrics.get_metrics()
+    assert data["answer_kb_hits"] == 1
+    assert data["answer_kb_misses"] == 1
+    assert metrics.get_hit_rate("answer_kb") == 0.5
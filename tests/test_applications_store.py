@@ -0,0 +1,45 @@
+import csv
+
+import pytest
+
+from modules.storage import applications
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def test_add_and_get_applied_ids():
+    applications.add_applied_job({'Job ID': '101', 'Title': 'Engineer', 'Company': 'Acme'})
+    applications.add_applied_job({'Job ID': '102', 'Title': 'Developer', 'Company': 'Acme'})
+    assert applications.get_applied_job_ids() == {'101', '102'}
+    assert applications.is_applied('101')
+    assert not applications.is_applied('999')
+    assert len(applications.get_jobs_by_company('Acme')) == 2
+
+
+def test_update_date_applied():
+    applications.add_applied_job({'Job ID': '7', 'Date Applied': 'Pending'})
+    assert applications.update_date_applied('7', '2024-01-01 10:00:00')
+    assert applications.get_applied_jobs()[0]['Date Applied'] == '2024-01-01 10:00:00'
+    assert not applications.update_date_applied('8')
+
+
+def test_import_existing_csvs_only_once_and_export(tmp_path):
+    applied_csv = tmp_path / "applied.csv"
+    with open(applied_csv, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=['Job ID', 'Title', 'Company'])
+        writer.writeheader()
+        writer.writerow({'Job ID': '1', 'Title': 'A', 'Company': 'X'})
+        writer.writerow({'Job ID': '2', 'Title': 'B', 'Company': 'Y'})
+    missing_csv = tmp_path / "missing.csv"
+
+    assert applications.import_existing_csvs(str(applied_csv), str(missing_csv)) == {'applied': 2, 'failed': 0}
+    assert applications.import_existing_csvs(str(applied_csv), str(missing_csv)) == {'applied': 0, 'failed': 0}
+    assert applications.count_jobs() == 2
+
+    exported = tmp_path / "export.csv"
+    assert applications.export_csv(str(exported)) == 2
+    with open(exported, encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+    assert [row['Job ID'] for row in rows] == ['1', '2']
+    assert list(rows[0].keys()) == list(applications.APPLIED_FIELDS)
@@ -0,0 +1,55 @@
+import json
+import os
+
+from modules import driver_cache
+
+
+def make_binary(tmp_path, content=b"patched chromedriver"):
+    path = tmp_path / "downloaded"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_parse_major_version():
+    assert driver_cache.parse_major_version("Google Chrome 126.0.6478.126 \n") == 126
+    assert driver_cache.parse_major_version("    version    REG_SZ    131.0.6778.86") == 131
+    assert driver_cache.parse_major_version("Chromium 99.0.4844") == 99
+    assert driver_cache.parse_major_version("command not found") is None
+    assert driver_cache.parse_major_version("") is None
+
+
+def test_store_then_get(tmp_path):
+    cache = str(tmp_path / "drivers")
+    assert driver_cache.get_cached_driver(cache, 126) is None
+    cached = driver_cache.store_driver(cache, 126, make_binary(tmp_path))
+    assert driver_cache.get_cached_driver(cache, 126) == cached
+    assert os.access(cached, os.X_OK)
+    assert driver_cache.get_cached_driver(cache, 127) is None
+    with open(os.path.join(cache, "126", driver_cache.MANIFEST_NAME)) as file:
+        manifest = json.load(file)
+    assert manifest["sha256"] == driver_cache.file_sha256(cached)
+
+
+def test_corrupted_driver_is_dropped(tmp_path):
+    cache = str(tmp_path / "drivers")
+    cached = driver_cache.store_driver(cache, 126, make_binary(tmp_path))
+    with open(cached, "ab") as file:
+        file.write(b"truncated download")
+    assert driver_cache.get_cached_driver(cache, 126) is None
+    assert not os.path.exists(os.path.join(cache, "126"))
+
+
+def test_latest_cached_driver(tmp_path):
+    cache = str(tmp_path / "drivers")
+    assert driver_cache.latest_cached_driver(cache) is None
+    driver_cache.store_driver(cache, 120, make_binary(tmp_path, b"old"))
+    newest = driver_cache.store_driver(cache, 126, make_binary(tmp_path, b"new"))
+    assert driver_cache.latest_cached_driver(cache) == (126, newest)
+
+
+def test_startup_timer():
+    timer = driver_cache.StartupTimer()
+    with timer.step("launch Chrome"):
+        pass
+    assert [name for name, _ in timer.steps] == ["launch Chrome"]
+    assert "launch Chrome" in timer.summary()
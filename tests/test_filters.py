@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from modules.filters import KeywordMatcher
+
+# scan_threshold=0 always uses the single pass regex, a high one always searches once per keyword
+STRATEGIES = [0, 10000]
+
+
+@pytest.mark.parametrize("scan_threshold", STRATEGIES)
+def test_find_all_case_insensitive_in_given_order(scan_threshold):
+    matcher = KeywordMatcher(["No C2C", ".NET", "PHP", "Ruby"], scan_threshold=scan_threshold)
+    text = "We use Ruby and PHP. .net experience is a plus. NO c2c please."
+    assert matcher.find_all(text) == ["No C2C", ".NET", "PHP", "Ruby"]
+    assert matcher.first(text) == "No C2C"
+    assert matcher.first("Python and Go") is None
+    assert not matcher.matches_any("Python and Go")
+
+
+@pytest.mark.parametrize("scan_threshold", STRATEGIES)
+def test_overlapping_and_nested_keywords(scan_threshold):
+    matcher = KeywordMatcher(["he", "she", "his", "hers", "usher"], scan_threshold=scan_threshold)
+    assert matcher.find_all("ushers") == ["he", "she", "hers", "usher"]
+
+
+@pytest.mark.parametrize("scan_threshold", STRATEGIES)
+def test_whole_words(scan_threshold):
+    matcher = KeywordMatcher(["PHP", "C++", "Java"], whole_words=True, scan_threshold=scan_threshold)
+    assert matcher.find_all("PHPUnit, JavaScript") == []
+    assert matcher.find_all("php, c++ and Java.") == ["PHP", "C++", "Java"]
+    assert matcher.find_all("JavaScript or Java") == ["Java"]
+    assert KeywordMatcher(["Java"], scan_threshold=scan_threshold).find_all("JavaScript") == ["Java"]
+
+
+def test_empty_keywords_are_ignored():
+    matcher = KeywordMatcher(["", "  ", "sql"])
+    assert len(matcher) == 1
+    assert matcher.find_all("SQL") == ["sql"]
+
+
+@pytest.mark.parametrize("whole_words", [False, True])
+def test_single_pass_gives_same_results_as_searching_each_keyword(whole_words):
+    rng = random.Random(7)
+    words = ["".join(rng.choice("abc ") for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    single_pass = KeywordMatcher(words, whole_words, scan_threshold=0)
+    each_keyword = KeywordMatcher(words, whole_words, scan_threshold=10000)
+    for _ in range(50):
+        text = "".join(rng.choice("abcd ") for _ in range(80))
+        assert single_pass.find_all(text) == each_keyword.find_all(text)
+        assert single_pass.first(text) == each_keyword.first(text)
+        assert single_pass.matches_any(text) == each_keyword.matches_any(text)
@@ -0,0 +1,34 @@
+import gzip
+
+from modules import log_reader
+
+
+def test_tail_returns_last_lines(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)), encoding="utf-8")
+    assert log_reader.tail(str(path), 3, block_size=64) == ["line 997", "line 998", "line 999"]
+    assert log_reader.tail(str(tmp_path / "missing.txt"), 3) == []
+
+
+def test_read_from_continues_and_restarts_after_rotation(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+    text, offset = log_reader.read_from(str(path))
+    assert text == "a\nb\n"
+    with open(path, 'a', encoding="utf-8") as file:
+        file.write("c\n")
+    assert log_reader.read_from(str(path), offset) == ("c\n", 6)
+    path.write_text("new\n", encoding="utf-8")
+    assert log_reader.read_from(str(path), 6) == ("new\n", 4)
+
+
+def test_iter_lines_and_export_include_rotated_segments(tmp_path):
+    path = tmp_path / "log.txt"
+    with gzip.open(tmp_path / "log.2024-01-01.1.txt.gz", 'wb') as file:
+        file.write(b"old 1\n")
+    (tmp_path / "log.2024-01-02.1.txt").write_text("old 2\n", encoding="utf-8")
+    path.write_text("current\n", encoding="utf-8")
+    assert list(log_reader.iter_lines(str(path))) == ["old 1", "old 2", "current"]
+    destination = tmp_path / "export.txt"
+    log_reader.export_logs(str(path), str(destination))
+    assert destination.read_text(encoding="utf-8") == "old 1\nold 2\ncurrent\n"
@@ -0,0 +1,83 @@
+import time
+
+from modules.log_writer import BufferedLogWriter
+
+
+def test_flush_writes_in_order(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_lines=1000, flush_interval=60)
+    for i in range(5):
+        writer.write(f"line {i}\n")
+    writer.flush()
+    assert path.read_text(encoding="utf-8") == "".join(f"line {i}\n" for i in range(5))
+    writer.close()
+
+
+def test_background_flush_on_batch_size(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_lines=3, flush_interval=60)
+    for i in range(3):
+        writer.write(f"{i}\n")
+    deadline = time.time() + 2
+    while not (path.exists() and path.read_text(encoding="utf-8")) and time.time() < deadline:
+        time.sleep(0.01)
+    assert path.read_text(encoding="utf-8") == "0\n1\n2\n"
+    writer.close()
+
+
+def test_close_flushes_remaining(tmp_path):
+    path = tmp_path / "nested" / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_lines=100, flush_interval=60)
+    writer.write("bye\n")
+    writer.close()
+    assert path.read_text(encoding="utf-8") == "bye\n"
+
+
+def test_rotates_and_compresses_by_size(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_lines=1000, flush_interval=60, max_bytes=50, backup_count=2)
+    for i in range(4):
+        writer.write(f"{i}" * 40 + "\n")
+        writer.flush()
+    writer.close()
+    deadline = time.time() + 2
+    while len(list(tmp_path.glob("log.*.txt.gz"))) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    segments = sorted(p.name for p in tmp_path.glob("log.*.txt*"))
+    assert len(segments) == 2 and all(name.endswith(".txt.gz") for name in segments)
+    assert path.read_text(encoding="utf-8") == "3" * 40 + "\n"
+
+
+def test_rotation_counts_bytes_not_characters(tmp_path):
+    path = tmp_path / "log.txt"
+    writer = BufferedLogWriter(str(path), flush_lines=1000, flush_interval=60, max_bytes=100)
+    for _ in range(2):
+        writer.write("é" * 30 + "\n")    # 31 characters, 61 bytes
+        writer.flush()
+    writer.close()
+    assert path.read_text(encoding="utf-8") == "é" * 30 + "\n"
+    assert list(tmp_path.glob("log.*.txt*"))
+
+
+class BrokenFile:
+    closed = False
+
+    def write(self, text):
+        raise OSError("log.txt is locked")
+
+    def close(self):
+        self.closed = True
+
+
+def test_failed_write_closes_file_and_keeps_newest_lines(tmp_path):
+    writer = BufferedLogWriter(str(tmp_path / "log.txt"), flush_lines=3, flush_interval=60, max_buffer_lines=3)
+    writer.write("new 1\n")
+    writer.write("new 2\n")
+    broken = writer._file = BrokenFile()
+    with writer._file_lock:
+        writer._write_batch(["old 1\n", "old 2\n"])
+    assert broken.closed and writer._file is None
+    assert list(writer._buffer) == ["old 2\n", "new 1\n", "new 2\n"] and writer._dropped == 1
+    writer.close()
+    assert (tmp_path / "log.txt").read_text(encoding="utf-8").endswith("old 2\nnew 1\nnew 2\n")
@@ -33,3 +33,29 @@ def test_get_sample_stats_and_eta():
     # avg = 1.5, jobs_processed=1, max_jobs=5 -> remaining 4 * 1.5 = 6.0
     eta = metrics.get_eta(1, 5)
     assert abs(eta - 6.0) < 1e-6
+
+
+def test_record_hit_and_hit_rate():
+    metrics.reset_all()
+    assert metrics.get_hit_rate('cache') == 0.0
+    metrics.record_hit('cache', True)
+    metrics.record_hit('cache', True)
+    metrics.record_hit('cache', False)
+    data = metrics.get_metrics()
+    assert data['cache_hits'] == 2
+    assert data['cache_misses'] == 1
+    assert abs(metrics.get_hit_rate('cache') - 2 / 3) < 1e-6
+
+
+def test_histogram():
+    metrics.reset_all()
+    for value in (0.01, 0.3, 0.4, 7.0, 60.0):
+        metrics.observe('wait_job_card', value)
+    histogram = metrics.get_histogram('wait_job_card')
+    assert histogram[0.05] == 1
+    assert histogram[0.5] == 2
+    assert histogram[10.0] == 1
+    assert histogram[float('inf')] == 1
+    assert sum(histogram.values()) == 5
+    assert list(metrics.get_histograms('wait_')) == ['wait_job_card']
+    assert metrics.get_sample_stats('wait_job_card')['max'] == 60.0
@@ -1,34 +1,95 @@
-import subprocess
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
 from modules.ai import ollama_integration as oi
+from modules.dashboard import metrics
+
+
+class FakeOllama(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list = []
+    tokens = ["Hello", " world", "\n"]
+    token_delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        FakeOllama.requests.append((self.path, payload))
+        if "prompt" not in payload:
+            return self._send_json({"model": payload["model"], "response": "", "done": True})
+        if not payload["stream"]:
+            return self._send_json({"response": "".join(self.tokens), "done": True})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for token in self.tokens:
+            time.sleep(self.token_delay)
+            self._chunk(json.dumps({"response": token, "done": False}) + "\n")
+        self._chunk(json.dumps({"response": "", "done": True, "eval_count": len(self.tokens)}) + "\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, text):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_json(self, data):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
 
+@pytest.fixture
+def client():
+    FakeOllama.requests = []
+    FakeOllama.token_delay = 0.0
+    metrics.reset_all()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = oi.OllamaClient(f"http://127.0.0.1:{server.server_address[1]}", keep_alive="5m")
+    yield client
+    client.close()
+    server.shutdown()
+    server.server_close()
 
-class DummyProc:
-    def __init__(self, outputs):
-        self._outputs = outputs
-        self.stdout = self
-        self._i = 0
 
-    def readline(self):
-        if self._i < len(self._outputs):
-            out = self._outputs[self._i]
-            self._i += 1
-            return out
-        return ''
+def test_stream_generate(client):
+    assert list(client.stream_generate("hi")) == ["Hello", " world", "\n"]
+    path, payload = FakeOllama.requests[0]
+    assert path == "/api/generate"
+    assert payload == {"model": oi.MODEL_NAME, "stream": True, "keep_alive": "5m", "prompt": "hi"}
+    assert metrics.get_sample_stats("ollama_ttft")["count"] == 1
+    assert metrics.get_sample_stats("ollama_response_time")["count"] == 1
 
-    def poll(self):
-        return 0 if self._i >= len(self._outputs) else None
 
-    def read(self):
-        return ''.join(self._outputs[self._i:])
+def test_generate_reuses_connection(client):
+    client.preload()
+    assert client.generate("hi") == "Hello world"
+    assert "".join(client.stream_generate("again")) == "Hello world\n"
+    assert client.generate("once more") == "Hello world"
+    assert client.connections_opened == 1
+    assert "prompt" not in FakeOllama.requests[0][1]
+    assert metrics.get_sample_stats("ollama_response_time")["count"] == 3
+    assert metrics.get_sample_stats("ollama_response_time")["avg"] > 0
 
 
-def test_stream_generate(monkeypatch):
-    dummy = DummyProc(['Hello ', 'world', '\n'])
+def test_stream_timeout(client):
+    FakeOllama.token_delay = 0.2
+    with pytest.raises(TimeoutError):
+        list(client.stream_generate("slow", timeout=0.1))
 
-    def fake_popen(cmd, stdout, stderr, text):
-        return dummy
 
-    monkeypatch.setattr(subprocess, 'Popen', fake_popen)
-    gen = oi.stream_generate('hi')
-    out = ''.join(list(gen))
-    assert 'Hello' in out
+def test_module_functions_report_errors(monkeypatch):
+    monkeypatch.setattr(oi, "_client", oi.OllamaClient("http://127.0.0.1:9"))
+    assert oi.generate("hi", timeout=1).startswith("[Ollama Error]")
+    assert "".join(oi.generate("hi", timeout=1, stream=True)).startswith("[Ollama Error]")
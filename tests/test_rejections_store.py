@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+from modules.storage import database, rejections
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def test_filters_hash_changes_with_filters():
+    assert rejections.filters_hash(["PHP"], 5) == rejections.filters_hash(["PHP"], 5)
+    assert rejections.filters_hash(["PHP"], 5) != rejections.filters_hash(["PHP", "Ruby"], 5)
+    assert rejections.filters_hash(["PHP"], 5) != rejections.filters_hash(["PHP"], 6)
+
+
+def test_load_only_with_same_filters():
+    old, new = rejections.filters_hash(["PHP"]), rejections.filters_hash(["Ruby"])
+    rejections.reject_job("1", "Found a Bad Word in About Job", old)
+    rejections.reject_job("2", "Required experience is high", new)
+    rejections.blacklist_company("Initech", 'About Company contains "staffing"', old)
+    assert rejections.load_rejected_jobs() == {"1", "2"}
+    assert rejections.load_rejected_jobs(new) == {"2"}
+    assert rejections.load_blacklisted_companies(old) == {"Initech"}
+    assert rejections.load_blacklisted_companies(new) == set()
+
+
+def test_max_age():
+    rejections.reject_job("1")
+    rejections.blacklist_company("Initech")
+    with database.transaction() as conn:
+        conn.execute("UPDATE rejected_jobs SET rejected_at = ?", (time.time() - 10 * 86400,))
+    rejections.reject_job("2")
+    assert rejections.load_rejected_jobs(max_age_days=7) == {"2"}
+    assert rejections.load_rejected_jobs(max_age_days=0) == {"1", "2"}
+    assert rejections.load_blacklisted_companies(max_age_days=7) == {"Initech"}
+    rejections.clear()
+    assert rejections.load_rejected_jobs() == set()
@@ -0,0 +1,44 @@
+from modules.scheduler import SearchScheduler
+
+
+def test_all_terms_due_at_start():
+    scheduler = SearchScheduler(["Python", "Go"], min_interval=300, max_interval=3600)
+    assert scheduler.due_terms(now=0) == ["Python", "Go"]
+
+
+def test_backs_off_unproductive_terms_and_revisits_productive_ones():
+    scheduler = SearchScheduler(["Python", "Go"], min_interval=300, max_interval=3600)
+    assert scheduler.record("Python", new_jobs=5, seen_jobs=20, now=0) == 300
+    assert scheduler.record("Go", new_jobs=0, seen_jobs=25, now=0) == 600
+    assert scheduler.due_terms(now=300) == ["Python"]
+    assert scheduler.record("Go", new_jobs=0, seen_jobs=25, now=600) == 1200
+    for _ in range(5):
+        scheduler.record("Go", new_jobs=0, seen_jobs=25, now=600)
+    assert scheduler.terms["Go"].interval == 3600
+    # Finding new jobs again brings it back sooner
+    assert scheduler.record("Go", new_jobs=3, seen_jobs=0, now=600) == 1800
+
+
+def test_most_productive_first():
+    scheduler = SearchScheduler(["Go", "Python", "Rust"], min_interval=10)
+    scheduler.record("Go", 1, 9, now=0)
+    scheduler.record("Python", 8, 2, now=0)
+    scheduler.record("Rust", 0, 10, now=0)
+    assert scheduler.due_terms(now=10_000) == ["Python", "Go", "Rust"]
+
+
+def test_seconds_until_due():
+    scheduler = SearchScheduler(["Python"], min_interval=300)
+    assert scheduler.seconds_until_due(now=0) == 0
+    scheduler.record("Python", 1, 0, now=100)
+    assert scheduler.seconds_until_due(now=150) == 250
+
+
+def test_hourly_limit():
+    scheduler = SearchScheduler(["a", "b", "c"], min_interval=60, max_per_hour=2)
+    scheduler.record("a", 1, 0, now=0)
+    scheduler.record("b", 1, 0, now=10)
+    assert scheduler.due_terms(now=100) == []
+    assert scheduler.seconds_until_due(now=100) == 3500
+    assert scheduler.due_terms(now=3600) == ["a"]
+    assert len(scheduler.due_terms(now=3610)) == 2
@@ -0,0 +1,32 @@
+import time
+
+import pytest
+
+from modules.storage import database, search_state
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+def test_seen_jobs_are_kept_per_search_term():
+    search_state.mark_seen("Python Developer", ["1", "2"])
+    search_state.mark_seen("Go Developer", ["3"])
+    assert search_state.get_seen("python  developer") == {"1", "2"}
+    assert search_state.get_seen("Go Developer") == {"3"}
+    assert search_state.get_seen("Rust Developer") == set()
+
+
+def test_marking_again_is_not_a_duplicate():
+    search_state.mark_seen("Python", ["1", "1", ""])
+    search_state.mark_seen("Python", ["1", "2"])
+    assert search_state.get_seen("Python") == {"1", "2"}
+
+
+def test_old_entries_are_dropped():
+    search_state.mark_seen("Python", ["1"])
+    with database.transaction() as conn:
+        conn.execute("UPDATE search_seen_jobs SET seen_at = ?", (time.time() - 3 * 86400,))
+    search_state.mark_seen("Python", ["2"], retention_days=7)
+    assert search_state.get_seen("Python") == {"1", "2"}
+    search_state.mark_seen("Python", ["3"], retention_days=2)
+    assert search_state.get_seen("Python") == {"2", "3"}
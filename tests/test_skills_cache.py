@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from modules.dashboard import metrics
+from modules.storage import database, skills_cache
+
+
+pytestmark = pytest.mark.usefixtures("temp_db")
+
+
+@pytest.fixture(autouse=True)
+def fresh_metrics():
+    metrics.reset_all()
+
+
+def test_key_ignores_formatting_but_not_provider_model_or_prompt():
+    key = skills_cache.cache_key("OpenAI", "gpt-4o", "v1", "We need  Python\nand SQL")
+    assert key == skills_cache.cache_key("openai", "gpt-4o", "v1", "we need python and sql")
+    assert key != skills_cache.cache_key("openai", "gpt-4o-mini", "v1", "we need python and sql")
+    assert key != skills_cache.cache_key("openai", "gpt-4o", "v2", "we need python and sql")
+    assert key != skills_cache.cache_key("deepseek", "gpt-4o", "v1", "we need python and sql")
+
+
+def test_put_get_and_hit_rate():
+    key = skills_cache.cache_key("openai", "gpt-4o", "v1", "description")
+    assert skills_cache.get(key) is None
+    skills_cache.put(key, {"tech_stack": ["Python"]})
+    assert skills_cache.get(key) == {"tech_stack": ["Python"]}
+    data = metrics.get_metrics()
+    assert data["skills_cache_hits"] == 1
+    assert data["skills_cache_misses"] == 1
+
+
+def test_ttl_expiry():
+    skills_cache.put("old", ["Python"])
+    with database.transaction() as conn:
+        conn.execute("UPDATE skills_cache SET created_at = ?", (time.time() - 100,))
+    assert skills_cache.get("old", ttl_seconds=1000) == ["Python"]
+    assert skills_cache.get("old", ttl_seconds=10) is None
+    assert skills_cache.count() == 0
+
+
+def test_lru_limit_keeps_recently_used():
+    for key in ("a", "b", "c"):
+        skills_cache.put(key, key)
+    with database.transaction() as conn:
+        for i, key in enumerate(("a", "b", "c")):
+            conn.execute("UPDATE skills_cache SET last_used = ? WHERE key = ?", (i, key))
+    skills_cache.get("a")
+    skills_cache.put("d", "d", max_entries=3)
+    assert skills_cache.count() == 3
+    assert skills_cache.get("b") is None
+    assert skills_cache.get("a") == "a"
@@ -0,0 +1,79 @@
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from benchmarks.stub_llm_server import StubConfig, StubLLMServer, extract_skills
+
+
+@pytest.fixture
+def server():
+    with StubLLMServer(StubConfig(seed=1)) as stub:
+        yield stub
+
+
+def post(url: str, body: dict):
+    request = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), headers={"Content-Type": "application/json"})
+    return urllib.request.urlopen(request, timeout=5)
+
+
+def test_models(server):
+    with urllib.request.urlopen(server.url + "/models", timeout=5) as response:
+        data = json.load(response)
+    assert [model["id"] for model in data["data"]] == ["stub-model"]
+
+
+def test_skills_extraction_returns_json_and_usage(server):
+    prompt = 'Return "tech_stack": [] ...\nJOB DESCRIPTION:\nWe use Python, Kafka and Kubernetes. Strong communication.'
+    with post(server.url + "/chat/completions", {"model": "stub-model", "messages": [{"role": "user", "content": prompt}]}) as response:
+        data = json.load(response)
+    skills = json.loads(data["choices"][0]["message"]["content"])
+    assert skills["tech_stack"] == ["Python", "Kafka", "Kubernetes"]
+    assert skills["other_skills"] == ["Communication"]
+    assert data["usage"]["total_tokens"] == data["usage"]["prompt_tokens"] + data["usage"]["completion_tokens"] > 0
+
+
+def test_skills_match_whole_names():
+    assert extract_skills("Experience with JavaScript and Golang")["tech_stack"] == ["JavaScript"]
+
+
+def test_streaming(server):
+    server.config.chunk_tokens = 1
+    body = {"model": "stub-model", "stream": True, "messages": [{"role": "user", "content": "Describe your experience"}]}
+    with post(server.url + "/chat/completions", body) as response:
+        assert response.headers["Content-Type"] == "text/event-stream"
+        events = [line[len("data: "):] for line in response.read().decode("utf-8").splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(event) for event in events[:-1]]
+    content = "".join(chunk["choices"][0]["delta"].get("content", "") for chunk in chunks)
+    assert len(chunks) > 3
+    assert content.startswith("I have built")
+    assert chunks[-1]["choices"][0]["finish_reason"] == "stop"
+    assert chunks[-1]["usage"]["completion_tokens"] > 0
+
+
+def test_question_answers(server):
+    def ask(question: str) -> str:
+        prompt = f"**QUESTION Strat from here:**\n{question}"
+        with post(server.url + "/chat/completions", {"messages": [{"role": "user", "content": prompt}]}) as response:
+            return json.load(response)["choices"][0]["message"]["content"]
+    assert ask("How many years of experience do you have with Go?") == "3"
+    assert ask("Are you willing to relocate?") == "Yes"
+
+
+def test_error_injection_with_retry_after(server):
+    server.config.error_rate = 1.0
+    server.config.retry_after = 2
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(server.url + "/chat/completions", {"messages": [{"role": "user", "content": "hi"}]})
+    assert error.value.code == 429
+    assert error.value.headers["Retry-After"] == "2"
+    assert json.load(error.value)["error"]["code"] == 429
+    assert server.stats()["errors"] == 1
+
+
+def test_unknown_model(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        post(server.url + "/chat/completions", {"model": "gpt-5", "messages": []})
+    assert error.value.code == 404